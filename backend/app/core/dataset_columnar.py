@@ -0,0 +1,195 @@
+import glob
+import io
+import os
+import tempfile
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pyarrow는 선택 의존성이며, 없으면 CSV 업로드/다운로드만 지원
+    pyarrow = None
+
+from app.core.dataset_content import iter_dataset_chunks
+
+# 데이터셋별 컬럼 캐시 파일(Arrow IPC, Parquet) 저장 위치
+DATASET_COLUMNAR_CACHE_DIR = os.getenv(
+    "DATASET_COLUMNAR_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "dataset_columnar_cache"),
+)
+# 컬럼 형식 업로드를 CSV로 변환할 때 한 번에 처리하는 행 수
+COLUMNAR_BATCH_SIZE = 8192
+
+COLUMNAR_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+UPLOAD_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/vnd.apache.parquet": "parquet",
+    "application/x-parquet": "parquet",
+    "application/vnd.apache.arrow.file": "arrow",
+    "application/vnd.apache.arrow.stream": "arrow",
+}
+UPLOAD_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".arrows": "arrow",
+    ".feather": "arrow",
+}
+
+
+class ColumnarImportError(ValueError):
+    """Parquet/Arrow 파일을 읽을 수 없거나 CSV로 표현할 수 없는 컬럼이 있음"""
+
+
+def columnar_available() -> bool:
+    return pyarrow is not None
+
+
+def detect_upload_format(content_type: Optional[str], filename: Optional[str]) -> Optional[str]:
+    """
+    업로드 파일 형식 (csv, parquet, arrow, 알 수 없으면 None).
+    브라우저는 Parquet/Arrow에 application/octet-stream을 보내므로 그때는 확장자로 판단합니다.
+    """
+    if content_type in UPLOAD_CONTENT_TYPES:
+        return UPLOAD_CONTENT_TYPES[content_type]
+    if content_type in (None, "", "application/octet-stream"):
+        return UPLOAD_EXTENSIONS.get(os.path.splitext(filename or "")[1].lower())
+    return None
+
+
+def columnar_cache_path(dataset_id: int, content_sha256: str, file_format: str) -> str:
+    """내용 해시가 파일 이름에 들어가므로 내용이 같으면 캐시를 그대로 사용"""
+    return os.path.join(DATASET_COLUMNAR_CACHE_DIR, f"{dataset_id}-{content_sha256[:16]}.{file_format}")
+
+
+def temporary_cache_path() -> str:
+    """캐시 디렉터리 안의 임시 파일 (완성 후 os.replace로 원자적으로 교체)"""
+    os.makedirs(DATASET_COLUMNAR_CACHE_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=DATASET_COLUMNAR_CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    return path
+
+
+def remove_cache_file(path: Optional[str]) -> None:
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def remove_columnar_cache(dataset_id: int) -> None:
+    """데이터셋 삭제 시 캐시 파일 정리"""
+    for path in glob.glob(os.path.join(DATASET_COLUMNAR_CACHE_DIR, f"{dataset_id}-*")):
+        remove_cache_file(path)
+
+
+def _open_columnar(fileobj, upload_format: str) -> Tuple["pyarrow.Schema", Iterator["pyarrow.RecordBatch"]]:
+    """Parquet 또는 Arrow IPC(파일/스트림)를 스키마와 레코드 배치 반복자로 엶"""
+    if upload_format == "parquet":
+        parquet_file = pyarrow.parquet.ParquetFile(fileobj)
+        return parquet_file.schema_arrow, parquet_file.iter_batches(batch_size=COLUMNAR_BATCH_SIZE)
+
+    try:
+        reader = pyarrow.ipc.open_file(fileobj)
+        return reader.schema, (reader.get_batch(index) for index in range(reader.num_record_batches))
+    except pyarrow.ArrowInvalid:
+        fileobj.seek(0)
+        reader = pyarrow.ipc.open_stream(fileobj)
+        return reader.schema, iter(reader)
+
+
+def _columnar_csv_chunks(fileobj, upload_format: str, arrow_path: str) -> Iterator[bytes]:
+    """
+    배치마다 CSV 바이트를 만들고, 원래 타입 그대로의 배치를 Arrow IPC 캐시 파일에도 씁니다.
+    한 번에 한 배치만 메모리에 올라갑니다.
+    """
+    schema, batches = _open_columnar(fileobj, upload_format)
+
+    header = io.BytesIO()
+    pyarrow.csv.write_csv(schema.empty_table(), header)
+    yield header.getvalue()
+
+    without_header = pyarrow.csv.WriteOptions(include_header=False)
+    with pyarrow.ipc.new_file(arrow_path, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            sink = io.BytesIO()
+            pyarrow.csv.write_csv(batch, sink, write_options=without_header)
+            yield sink.getvalue()
+
+
+async def read_columnar_upload(file, upload_format: str, arrow_path: str) -> AsyncIterator[bytes]:
+    """
+    Parquet/Arrow 업로드를 CSV 바이트 조각 스트림으로 변환합니다 (store_dataset_upload 입력).
+    변환은 스레드풀에서 실행하며, 타입을 유지한 Arrow 캐시는 arrow_path에 씁니다.
+    """
+    try:
+        async for data in iterate_in_threadpool(_columnar_csv_chunks(file.file, upload_format, arrow_path)):
+            yield data
+    except pyarrow.ArrowException as e:
+        raise ColumnarImportError(str(e)) from e
+
+
+def _write_arrow_from_csv(csv_path: str, arrow_path: str, column_types: Optional[Dict] = None) -> None:
+    """CSV를 스트리밍으로 읽어 타입을 추론한 Arrow IPC 파일로 저장"""
+    if os.path.getsize(csv_path) == 0:
+        pyarrow.ipc.new_file(arrow_path, pyarrow.schema([])).close()
+        return
+
+    options = pyarrow.csv.ConvertOptions(column_types=column_types or {})
+    try:
+        reader = pyarrow.csv.open_csv(csv_path, convert_options=options)
+        with pyarrow.ipc.new_file(arrow_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    except pyarrow.ArrowInvalid:
+        if column_types is not None:
+            raise
+        # 첫 블록으로 추론한 타입과 맞지 않는 값이 뒤에 있으면 모든 컬럼을 문자열로 저장
+        names = pyarrow.csv.open_csv(csv_path).schema.names
+        _write_arrow_from_csv(csv_path, arrow_path, {name: pyarrow.string() for name in names})
+
+
+def _write_parquet_from_arrow(arrow_path: str, parquet_path: str) -> None:
+    reader = pyarrow.ipc.open_file(pyarrow.memory_map(arrow_path))
+    with pyarrow.parquet.ParquetWriter(parquet_path, reader.schema) as writer:
+        for index in range(reader.num_record_batches):
+            writer.write_batch(reader.get_batch(index))
+
+
+async def ensure_columnar_cache(dataset_id: int, content_sha256: str, file_format: str) -> str:
+    """
+    데이터셋의 Arrow IPC(또는 Parquet) 캐시 파일 경로. 없으면 저장된 CSV 조각으로 만듭니다.
+    Parquet는 Arrow 캐시에서 변환하며, 변환은 스레드풀에서 배치 단위로 실행합니다.
+    """
+    arrow_path = columnar_cache_path(dataset_id, content_sha256, "arrow")
+    if not os.path.exists(arrow_path):
+        csv_path = temporary_cache_path()
+        temporary_path = temporary_cache_path()
+        try:
+            with open(csv_path, "wb") as csv_file:
+                async for data in iter_dataset_chunks(dataset_id):
+                    csv_file.write(data)
+            await run_in_threadpool(_write_arrow_from_csv, csv_path, temporary_path)
+            os.replace(temporary_path, arrow_path)
+        finally:
+            remove_cache_file(csv_path)
+            remove_cache_file(temporary_path)
+
+    if file_format == "arrow":
+        return arrow_path
+
+    parquet_path = columnar_cache_path(dataset_id, content_sha256, "parquet")
+    if not os.path.exists(parquet_path):
+        temporary_path = temporary_cache_path()
+        try:
+            await run_in_threadpool(_write_parquet_from_arrow, arrow_path, temporary_path)
+            os.replace(temporary_path, parquet_path)
+        finally:
+            remove_cache_file(temporary_path)
+    return parquet_path
+
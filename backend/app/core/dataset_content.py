@@ -0,0 +1,245 @@
+import codecs
+import csv
+import hashlib
+import io
+import json
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import delete, select
+
+from app.database import database
+from app.models.dataset_model import dataset_chunks, dataset_rows
+
+# 업로드를 읽고 dataset_chunks에 저장하는 단위 (1 MiB)
+DATASET_CHUNK_SIZE = 1024 * 1024
+# CSV 한 행의 최대 크기 (문자 수). 줄바꿈 없이 이어지는 데이터가 메모리에 계속 쌓이지 않도록 제한
+DATASET_MAX_RECORD_SIZE = int(os.getenv("DATASET_MAX_RECORD_SIZE", str(16 * 1024 * 1024)))
+
+
+class CsvRecordTooLarge(ValueError):
+    """행 구분자 없이 DATASET_MAX_RECORD_SIZE를 넘는 데이터가 이어짐 (줄바꿈 누락, 닫히지 않은 따옴표 등)"""
+
+
+class CsvRecordSplitter:
+    """
+    텍스트 조각을 이어 받아 완성된 CSV 행만 파싱합니다.
+    따옴표 개수가 짝수인 줄바꿈(\n, \r)에서만 자르므로 따옴표 안의 줄바꿈이 있는 행도
+    조각 경계에 걸치지 않고 한 행으로 파싱됩니다 (기본 csv 방언 기준).
+    완성되지 않은 행이 max_record_size를 넘으면 CsvRecordTooLarge가 발생하므로
+    보류 중인 텍스트와 조각마다 다시 잇는 비용은 행 크기로 제한됩니다.
+    """
+
+    def __init__(self, max_record_size: int = DATASET_MAX_RECORD_SIZE):
+        self.max_record_size = max_record_size
+        self._pending = ""
+        self._pending_quotes = 0
+
+    def _rows(self, text: str) -> List[List[str]]:
+        # 빈 줄은 행으로 세지 않음
+        return [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+
+    def feed(self, text: str) -> List[List[str]]:
+        """이번 조각까지 완성된 행 목록 (마지막 미완성 행은 다음 조각과 합침)"""
+        start = len(self._pending)
+        buffer = self._pending + text
+        total_quotes = self._pending_quotes + text.count('"')
+
+        # 보류 중인 부분의 줄바꿈은 이미 따옴표 안이었으므로 새 조각만 뒤에서부터 확인
+        # \r\n 사이에서 자르면 다음 조각이 빈 줄로 시작하며, 빈 줄은 행으로 세지 않음
+        cut = -1
+        end = len(buffer)
+        quotes_after = 0
+        while True:
+            newline = max(buffer.rfind("\n", start, end), buffer.rfind("\r", start, end))
+            if newline < 0:
+                break
+            quotes_after += buffer.count('"', newline, end)
+            if (total_quotes - quotes_after) % 2 == 0:
+                cut = newline + 1
+                break
+            end = newline
+
+        if cut < 0:
+            self._check_pending(buffer)
+            self._pending = buffer
+            self._pending_quotes = total_quotes
+            return []
+
+        self._check_pending(buffer[cut:])
+        self._pending = buffer[cut:]
+        self._pending_quotes = self._pending.count('"')
+        return self._rows(buffer[:cut])
+
+    def _check_pending(self, pending: str) -> None:
+        if len(pending) > self.max_record_size:
+            raise CsvRecordTooLarge(
+                f"CSV 행이 최대 크기({self.max_record_size}자)를 넘습니다. "
+                "줄바꿈과 따옴표가 올바른지 확인해 주세요."
+            )
+
+    def close(self) -> List[List[str]]:
+        """줄바꿈 없이 끝난 마지막 행"""
+        rows = self._rows(self._pending) if self._pending else []
+        self._pending = ""
+        self._pending_quotes = 0
+        return rows
+
+
+class DatasetContentReader:
+    """
+    업로드 바이트 조각을 받아 UTF-8 검증, 해시, 크기, 헤더와 행 수 계산을 이어서 처리합니다.
+    파일 전체를 메모리에 올리지 않고 조각 단위로 메타데이터와 데이터 행을 만들 때 사용합니다.
+    잘못된 UTF-8이면 feed/close에서 UnicodeDecodeError가 발생합니다.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._hash = hashlib.sha256()
+        self._splitter = CsvRecordSplitter()
+        self.byte_size = 0
+        self.row_count = 0
+        self.column_names: Optional[List[str]] = None
+
+    def _data_rows(self, rows: List[List[str]]) -> List[List[str]]:
+        # 첫 행은 헤더
+        if rows and self.column_names is None:
+            self.column_names = rows[0]
+            rows = rows[1:]
+        self.row_count += len(rows)
+        return rows
+
+    def feed(self, data: bytes) -> List[List[str]]:
+        """이번 조각까지 완성된 데이터 행 (헤더 제외)"""
+        self._hash.update(data)
+        self.byte_size += len(data)
+        return self._data_rows(self._splitter.feed(self._decoder.decode(data)))
+
+    def close(self) -> List[List[str]]:
+        """남은 데이터 행"""
+        rows = self._data_rows(self._splitter.feed(self._decoder.decode(b"", final=True)))
+        return rows + self._data_rows(self._splitter.close())
+
+    def metadata(self) -> Dict[str, Any]:
+        """datasets 메타데이터 컬럼 값 (close 이후 호출)"""
+        return {
+            "row_count": self.row_count,
+            "byte_size": self.byte_size,
+            "column_names": self.column_names or [],
+            "content_sha256": self._hash.hexdigest(),
+        }
+
+
+def dataset_content_metadata(content: str) -> Dict[str, Any]:
+    """
+    업로드 시 한 번 계산하여 datasets에 저장하는 CSV 메타데이터.
+    목록/검색/ETag는 이 값만 읽으므로 CSV 본문을 다시 읽지 않습니다.
+    """
+    reader = DatasetContentReader()
+    reader.feed(content.encode("utf-8"))
+    reader.close()
+    return reader.metadata()
+
+
+async def copy_records(table, records: List[tuple]) -> None:
+    """현재 연결(트랜잭션)의 asyncpg COPY로 레코드를 적재"""
+    if not records:
+        return
+    # databases 연결은 현재 트랜잭션의 asyncpg 연결을 그대로 사용
+    connection = database.connection().raw_connection
+    await connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[column.name for column in table.columns],
+    )
+
+
+def row_records(dataset_id: int, first_index: int, rows: List[List[str]]) -> List[tuple]:
+    """dataset_rows COPY 레코드 (값은 헤더 순서의 JSON 배열)"""
+    return [
+        (dataset_id, first_index + offset, json.dumps(row, ensure_ascii=False))
+        for offset, row in enumerate(rows)
+    ]
+
+
+async def read_upload_chunks(file) -> AsyncIterator[bytes]:
+    """업로드 파일을 DATASET_CHUNK_SIZE 단위로 읽음"""
+    while True:
+        data = await file.read(DATASET_CHUNK_SIZE)
+        if not data:
+            break
+        yield data
+
+
+async def store_dataset_upload(dataset_id: int, chunks: AsyncIterator[bytes]) -> Dict[str, Any]:
+    """
+    CSV 바이트 조각 스트림(read_upload_chunks 등)의 원본 조각은 dataset_chunks에,
+    파싱한 데이터 행은 dataset_rows에 COPY로 적재하고 메타데이터 컬럼 값을 반환합니다.
+    조각마다 적재하므로 메모리에는 한 조각과 그 조각의 행만 올라갑니다.
+    데이터셋 행 생성과 함께 되돌릴 수 있도록 트랜잭션 안에서 호출해야 합니다.
+    """
+    reader = DatasetContentReader()
+    chunk_index = 0
+    byte_offset = 0
+    async for data in chunks:
+        if not data:
+            continue
+        first_row = reader.row_count
+        rows = reader.feed(data)
+        await copy_records(dataset_chunks, [(dataset_id, chunk_index, byte_offset, data)])
+        await copy_records(dataset_rows, row_records(dataset_id, first_row, rows))
+        chunk_index += 1
+        byte_offset += len(data)
+
+    first_row = reader.row_count
+    await copy_records(dataset_rows, row_records(dataset_id, first_row, reader.close()))
+    return reader.metadata()
+
+
+async def rebuild_dataset_rows(dataset_id: int) -> int:
+    """
+    저장된 조각을 다시 파싱하여 dataset_rows를 채우고 행 수를 반환합니다.
+    행 테이블 추가 이전 업로드용이며 트랜잭션 안에서 호출해야 합니다.
+    """
+    await database.execute(delete(dataset_rows).where(dataset_rows.c.dataset_id == dataset_id))
+
+    reader = DatasetContentReader()
+    async for data in iter_dataset_chunks(dataset_id):
+        first_row = reader.row_count
+        await copy_records(dataset_rows, row_records(dataset_id, first_row, reader.feed(data)))
+    first_row = reader.row_count
+    await copy_records(dataset_rows, row_records(dataset_id, first_row, reader.close()))
+    return reader.row_count
+
+
+async def iter_dataset_chunks(dataset_id: int, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+    """
+    저장된 CSV 원본에서 [start, end] 바이트 범위를 조각 순서대로 읽습니다 (end 포함, None이면 끝까지).
+    조각은 기본 키로 한 번에 하나씩 조회하므로 파일 크기와 관계없이 메모리에는 한 조각만 올라갑니다.
+    """
+    first = await database.fetch_one(
+        select(dataset_chunks.c.chunk_index)
+        .where(dataset_chunks.c.dataset_id == dataset_id, dataset_chunks.c.byte_offset <= start)
+        .order_by(dataset_chunks.c.chunk_index.desc())
+        .limit(1)
+    )
+    chunk_index = first.chunk_index if first else 0
+
+    while True:
+        chunk = await database.fetch_one(
+            select(dataset_chunks.c.byte_offset, dataset_chunks.c.data).where(
+                dataset_chunks.c.dataset_id == dataset_id,
+                dataset_chunks.c.chunk_index == chunk_index,
+            )
+        )
+        if chunk is None or (end is not None and chunk.byte_offset > end):
+            break
+
+        data = chunk.data
+        lower = max(start - chunk.byte_offset, 0)
+        upper = len(data) if end is None else min(end - chunk.byte_offset + 1, len(data))
+        if lower == 0 and upper == len(data):
+            yield data
+        elif lower < upper:
+            yield data[lower:upper]
+        chunk_index += 1
@@ -0,0 +1,74 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import database
+from app.models.node_summary_model import node_summary
+from app.models.prompt_model import prompts
+
+SUMMARY_COLUMNS = [
+    "node_name",
+    "prompt_count",
+    "latest_version",
+    "production_prompt_id",
+    "latest_created_at",
+    "updated_at",
+]
+
+
+def node_summary_aggregate(node_names: Optional[Iterable[str]] = None):
+    """prompts 테이블에서 노드별 요약을 계산하는 단일 집계 쿼리 (프로덕션 ID는 FILTER 집계)"""
+    query = select(
+        prompts.c.node_name,
+        func.count(prompts.c.id).label("prompt_count"),
+        func.max(prompts.c.version).label("latest_version"),
+        func.max(prompts.c.id).filter(prompts.c.production == True).label("production_prompt_id"),
+        func.max(prompts.c.created_at).label("latest_created_at"),
+        func.now().label("updated_at"),
+    ).group_by(prompts.c.node_name)
+
+    if node_names is not None:
+        query = query.where(prompts.c.node_name.in_(list(node_names)))
+    return query
+
+
+def _upsert_from(aggregate):
+    statement = pg_insert(node_summary).from_select(SUMMARY_COLUMNS, aggregate)
+    return statement.on_conflict_do_update(
+        index_elements=[node_summary.c.node_name],
+        set_={column: statement.excluded[column] for column in SUMMARY_COLUMNS[1:]},
+    )
+
+
+async def refresh_node_summary(node_name: str) -> None:
+    """
+    한 노드의 요약 행을 다시 계산합니다.
+    프롬프트 쓰기와 같은 트랜잭션 안에서 호출해야 합니다.
+    """
+    await refresh_node_summaries([node_name])
+
+
+async def refresh_node_summaries(node_names: Iterable[str]) -> None:
+    """여러 노드의 요약 행을 노드 수와 관계없이 두 개의 쿼리로 다시 계산 (트랜잭션 안에서 호출)"""
+    node_names = sorted(set(node_names))
+    await database.execute(_upsert_from(node_summary_aggregate(node_names)))
+
+    # 프롬프트가 모두 삭제된 노드는 요약 행도 제거
+    await database.execute(
+        delete(node_summary).where(
+            node_summary.c.node_name.in_(node_names),
+            ~exists().where(prompts.c.node_name == node_summary.c.node_name),
+        )
+    )
+
+
+async def rebuild_node_summaries() -> None:
+    """모든 노드의 요약을 prompts 테이블 기준으로 재구성 (앱 시작 시 또는 수동 복구용)"""
+    async with database.transaction():
+        await database.execute(_upsert_from(node_summary_aggregate()))
+        await database.execute(
+            delete(node_summary).where(
+                ~exists().where(prompts.c.node_name == node_summary.c.node_name)
+            )
+        )
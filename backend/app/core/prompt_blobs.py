@@ -0,0 +1,231 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.prompt_delta import (
+    apply_delta,
+    diff_contents,
+    diff_deltas,
+    encode_delta,
+    is_delta_encodable,
+    keyframe_as_delta,
+)
+from app.core.prompt_templates import compile_prompt
+from app.database import database
+from app.models.prompt_model import (
+    PROMPT_ROW_COLUMNS,
+    blobs_with_keyframes,
+    keyframe_blobs,
+    prompt_blobs,
+    prompts,
+)
+
+# 키프레임 하나에 연결할 수 있는 최대 델타 수 (이후에는 새 키프레임 저장)
+PROMPT_KEYFRAME_INTERVAL = 20
+# 델타가 전체 내용의 이 비율 이상이면 델타 대신 새 키프레임으로 저장
+PROMPT_DELTA_MAX_RATIO = 0.5
+# 복원한 blob 내용 캐시 크기 (해시가 같으면 내용도 같으므로 무효화가 필요 없음)
+BLOB_CONTENT_CACHE_SIZE = 1024
+
+_blob_content_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def canonical_content(content: Dict[str, Any]) -> str:
+    """키 순서와 공백에 관계없이 같은 내용이면 같은 문자열이 되도록 정규화"""
+    return json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def compute_content_hash(content: Dict[str, Any]) -> str:
+    """프롬프트 내용의 SHA-256 (prompt_blobs 키)"""
+    return hashlib.sha256(canonical_content(content).encode("utf-8")).hexdigest()
+
+
+def _loads(value: Any) -> Any:
+    # json 컬럼은 드라이버에 따라 문자열로 반환됨
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def encode_blob(
+    content: Dict[str, Any],
+    keyframe_hash: Optional[str] = None,
+    keyframe_content: Optional[Dict[str, Any]] = None,
+    keyframe_deltas: int = 0,
+) -> Dict[str, Any]:
+    """
+    prompt_blobs 행에 저장할 값을 정합니다.
+    키프레임이 있고 델타가 충분히 작으면 델타로, 아니면 전체 내용을 새 키프레임으로 저장합니다.
+    """
+    keyframe = {"content": content, "base_hash": None, "delta": None}
+    if keyframe_content is None or keyframe_deltas >= PROMPT_KEYFRAME_INTERVAL:
+        return keyframe
+    if not is_delta_encodable(content) or not is_delta_encodable(keyframe_content):
+        return keyframe
+
+    delta = encode_delta(keyframe_content, content)
+    if len(canonical_content(delta)) >= len(canonical_content(content)) * PROMPT_DELTA_MAX_RATIO:
+        return keyframe
+    return {"content": None, "base_hash": keyframe_hash, "delta": delta}
+
+
+def node_keyframe_query(node_name: str):
+    """노드 최신 버전이 사용하는 키프레임의 해시, 내용, 연결된 델타 수"""
+    latest_keyframe_hash = (
+        select(func.coalesce(prompt_blobs.c.base_hash, prompt_blobs.c.content_hash))
+        .select_from(prompts.join(prompt_blobs, prompts.c.content_hash == prompt_blobs.c.content_hash))
+        .where(prompts.c.node_name == node_name)
+        .order_by(prompts.c.version.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    deltas = prompt_blobs.alias("deltas")
+    delta_count = (
+        select(func.count())
+        .select_from(deltas)
+        .where(deltas.c.base_hash == keyframe_blobs.c.content_hash)
+        .scalar_subquery()
+    )
+    return select(
+        keyframe_blobs.c.content_hash,
+        keyframe_blobs.c.content,
+        delta_count.label("delta_count"),
+    ).where(keyframe_blobs.c.content_hash == latest_keyframe_hash)
+
+
+async def store_prompt_blob(content: Dict[str, Any], node_name: str) -> str:
+    """
+    내용을 prompt_blobs에 저장하고 해시를 반환합니다.
+    이미 같은 내용이 있으면 저장하지 않고, 새 내용은 노드의 현재 키프레임 대비 델타로 저장합니다.
+    노드 잠금을 잡은 트랜잭션 안에서 호출합니다.
+    """
+    content_hash = compute_content_hash(content)
+    exists = await database.fetch_val(
+        select(prompt_blobs.c.content_hash).where(prompt_blobs.c.content_hash == content_hash)
+    )
+    if exists:
+        return content_hash
+
+    keyframe = await database.fetch_one(node_keyframe_query(node_name))
+    if keyframe is None:
+        values = encode_blob(content)
+    else:
+        values = encode_blob(
+            content,
+            keyframe.content_hash,
+            _loads(keyframe.content),
+            keyframe.delta_count,
+        )
+
+    # 델타로 저장하더라도 검색 인덱스는 전체 텍스트로 만듦
+    values["system_text"] = (content.get("system") or {}).get("prompt")
+    values["user_text"] = (content.get("user") or {}).get("prompt")
+    # 템플릿 변수는 내용에서 정해지므로 blob에 저장 (컴파일 결과는 이 워커의 렌더링 캐시에도 남음)
+    values["template_variables"] = list(compile_prompt(content_hash, content).variables)
+    await database.execute(
+        pg_insert(prompt_blobs)
+        .values(content_hash=content_hash, **values)
+        .on_conflict_do_nothing(index_elements=[prompt_blobs.c.content_hash])
+    )
+    return content_hash
+
+
+def _cache_blob_content(content_hash: str, content: Dict[str, Any]) -> None:
+    _blob_content_cache[content_hash] = content
+    _blob_content_cache.move_to_end(content_hash)
+    while len(_blob_content_cache) > BLOB_CONTENT_CACHE_SIZE:
+        _blob_content_cache.popitem(last=False)
+
+
+async def load_prompt_contents(content_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    해시별 프롬프트 내용을 조회합니다.
+    저장된 키프레임과 델타를 가져와 애플리케이션에서 복원하며, 복원 결과는 프로세스 내 LRU에 보관합니다.
+    """
+    contents = {}
+    missing = []
+    for content_hash in dict.fromkeys(content_hashes):
+        cached = _blob_content_cache.get(content_hash)
+        if cached is None:
+            missing.append(content_hash)
+        else:
+            _blob_content_cache.move_to_end(content_hash)
+            contents[content_hash] = cached
+
+    if missing:
+        records = await database.fetch_all(
+            select(
+                prompt_blobs.c.content_hash,
+                prompt_blobs.c.content,
+                prompt_blobs.c.delta,
+                keyframe_blobs.c.content.label("keyframe_content"),
+            )
+            .select_from(blobs_with_keyframes)
+            .where(prompt_blobs.c.content_hash.in_(missing))
+        )
+        for record in records:
+            if record.content is not None:
+                content = _loads(record.content)
+            else:
+                content = apply_delta(_loads(record.keyframe_content), _loads(record.delta))
+            _cache_blob_content(record.content_hash, content)
+            contents[record.content_hash] = content
+    return contents
+
+
+async def diff_prompt_blobs(from_hash: str, to_hash: str) -> List[Dict[str, Any]]:
+    """
+    두 blob 내용의 역할별 차이를 계산합니다.
+    같은 키프레임을 공유하면(한쪽이 키프레임이거나 둘 다 같은 키프레임의 델타) 저장된 델타 연산에서
+    변경 구간을 만들고, 키프레임이 다를 때만 두 내용을 복원해 difflib으로 비교합니다.
+    """
+    records = await database.fetch_all(
+        select(
+            prompt_blobs.c.content_hash,
+            prompt_blobs.c.content,
+            prompt_blobs.c.base_hash,
+            prompt_blobs.c.delta,
+            keyframe_blobs.c.content.label("keyframe_content"),
+        )
+        .select_from(blobs_with_keyframes)
+        .where(prompt_blobs.c.content_hash.in_([from_hash, to_hash]))
+    )
+    blobs = {record.content_hash: record for record in records}
+    from_blob, to_blob = blobs[from_hash], blobs[to_hash]
+
+    def keyframe_hash(blob):
+        return blob.base_hash or blob.content_hash
+
+    if keyframe_hash(from_blob) == keyframe_hash(to_blob):
+        keyframe_blob = from_blob if from_blob.content is not None else to_blob
+        keyframe = _loads(
+            keyframe_blob.content if keyframe_blob.content is not None else keyframe_blob.keyframe_content
+        )
+        # 델타로 저장할 수 없는 형태의 키프레임은 자기 대비 델타로도 표현할 수 없음
+        if is_delta_encodable(keyframe):
+
+            def as_delta(blob):
+                return keyframe_as_delta(keyframe) if blob.content is not None else _loads(blob.delta)
+
+            return diff_deltas(keyframe, as_delta(from_blob), as_delta(to_blob))
+
+    contents = await load_prompt_contents([from_hash, to_hash])
+    return diff_contents(contents[from_hash], contents[to_hash])
+
+
+def with_content(write_statement):
+    """
+    prompts에 대한 INSERT/UPDATE 결과에 blob 내용을 붙여 조회 행(prompt_rows)과
+    같은 형태로 돌려주는 단일 쿼리 (WITH written AS (... RETURNING) SELECT ... JOIN prompt_blobs)
+    """
+    written = write_statement.returning(*prompts.c).cte("written")
+    # prompts 컬럼은 쓰기 결과에서, content는 blob에서 가져옴
+    columns = [
+        written.c[column.name] if column.name in written.c else column
+        for column in PROMPT_ROW_COLUMNS
+    ]
+    return select(*columns).select_from(
+        written.join(blobs_with_keyframes, written.c.content_hash == prompt_blobs.c.content_hash)
+    )
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import and_, or_, select, tuple_
+
+from app.database import database
+from app.models.prompt_model import prompt_rows
+
+# (node_name, version) 키. version이 None이면 해당 노드의 프로덕션 프롬프트를 의미
+CacheKey = Tuple[str, Optional[int]]
+
+
+class PromptCache:
+    """노드별 프롬프트 조회 결과를 보관하는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        # 워커 간 무효화 알림을 받을 수 없는 동안에는 False로 두어 항상 DB에서 조회
+        self.enabled = True
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        # 노드별 세대 번호. 무효화될 때마다 증가하여 조회 도중 발생한 쓰기를 감지
+        self._generations: Dict[str, int] = {}
+
+    def generation(self, node_name: str) -> int:
+        return self._generations.get(node_name, 0)
+
+    def get(self, node_name: str, version: Optional[int] = None) -> Any:
+        if not self.enabled:
+            return None
+        key = (node_name, version)
+        record = self._entries.get(key)
+        if record is not None:
+            self._entries.move_to_end(key)
+        return record
+
+    def set(
+        self,
+        node_name: str,
+        version: Optional[int],
+        record: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """조회 결과 저장. 조회 시작 후 무효화가 있었다면 오래된 값이므로 저장하지 않음"""
+        if record is None or not self.enabled:
+            return
+        if generation is not None and generation != self.generation(node_name):
+            return
+
+        key = (node_name, version)
+        self._entries[key] = record
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, node_name: str, version: Optional[int] = None) -> None:
+        """
+        캐시 무효화.
+        version을 지정하면 해당 버전과 노드의 프로덕션 항목을, 생략하면 노드 전체를 제거합니다.
+        """
+        self._generations[node_name] = self.generation(node_name) + 1
+
+        if version is None:
+            for key in [key for key in self._entries if key[0] == node_name]:
+                del self._entries[key]
+        else:
+            self._entries.pop((node_name, version), None)
+            self._entries.pop((node_name, None), None)
+
+    def clear(self) -> None:
+        for node_name in list(self._generations):
+            self._generations[node_name] += 1
+        self._entries.clear()
+
+
+prompt_cache = PromptCache()
+
+
+def prompt_lookup_query(node_name: str, version: Optional[int] = None):
+    """노드의 프로덕션(version 생략) 또는 지정 버전 프롬프트 조회 쿼리"""
+    if version is None:
+        return select(prompt_rows).where(
+            prompt_rows.c.node_name == node_name,
+            prompt_rows.c.production == True,
+        )
+    return select(prompt_rows).where(
+        prompt_rows.c.node_name == node_name,
+        prompt_rows.c.version == version,
+    )
+
+
+async def get_prompt(node_name: str, version: Optional[int] = None) -> Any:
+    """
+    노드의 프롬프트를 캐시를 거쳐 조회합니다.
+    version을 생략하면 프로덕션 프롬프트를 반환하며, 없으면 None을 반환합니다.
+    """
+    record = prompt_cache.get(node_name, version)
+    if record is not None:
+        return record
+
+    generation = prompt_cache.generation(node_name)
+    record = await database.fetch_one(prompt_lookup_query(node_name, version))
+    prompt_cache.set(node_name, version, record, generation)
+    return record
+
+
+async def resolve_prompts(keys: Iterable[CacheKey]) -> Dict[CacheKey, Any]:
+    """
+    여러 (node_name, version) 키를 한 번에 조회합니다.
+    캐시에 없는 항목만 모아 단일 쿼리로 가져오며, 찾지 못한 키는 결과에서 제외됩니다.
+    """
+    resolved: Dict[CacheKey, Any] = {}
+    missing = []
+    for key in dict.fromkeys(keys):
+        record = prompt_cache.get(*key)
+        if record is not None:
+            resolved[key] = record
+        else:
+            missing.append(key)
+
+    if not missing:
+        return resolved
+
+    generations = {node_name: prompt_cache.generation(node_name) for node_name, _ in missing}
+    production_nodes = [node_name for node_name, version in missing if version is None]
+    pinned = [(node_name, version) for node_name, version in missing if version is not None]
+
+    conditions = []
+    if production_nodes:
+        conditions.append(
+            and_(prompt_rows.c.node_name.in_(production_nodes), prompt_rows.c.production == True)
+        )
+    if pinned:
+        conditions.append(tuple_(prompt_rows.c.node_name, prompt_rows.c.version).in_(pinned))
+
+    records = await database.fetch_all(select(prompt_rows).where(or_(*conditions)))
+
+    wanted = set(missing)
+    for record in records:
+        candidates = [(record.node_name, record.version)]
+        if record.production:
+            candidates.append((record.node_name, None))
+        for key in candidates:
+            if key in wanted:
+                resolved[key] = record
+                prompt_cache.set(key[0], key[1], record, generations[key[0]])
+
+    return resolved
@@ -0,0 +1,248 @@
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Union
+
+# 델타의 텍스트 연산: [시작, 길이]는 키프레임 텍스트에서 복사, 문자열은 그대로 삽입
+TextOp = Union[List[int], str]
+
+# 델타로 표현할 수 있는 역할 값의 키 (PromptContent의 MessageContent와 같음)
+MESSAGE_KEYS = {"order", "prompt"}
+
+
+def is_delta_encodable(content: Dict[str, Any]) -> bool:
+    """모든 역할이 {order, prompt} 형태여야 DB 함수 prompt_apply_delta로 같은 내용을 복원할 수 있음"""
+    return all(
+        isinstance(message, dict)
+        and set(message) == MESSAGE_KEYS
+        and (message["prompt"] is None or isinstance(message["prompt"], str))
+        for message in content.values()
+    )
+
+
+def encode_text_delta(base: Optional[str], text: str) -> List[TextOp]:
+    """
+    키프레임 텍스트 대비 텍스트 델타를 줄 단위로 계산합니다.
+    같은 줄은 키프레임의 문자 위치로 복사하고, 바뀐 줄만 문자열로 저장합니다.
+    """
+    base = base or ""
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+
+    offsets = [0]
+    for line in base_lines:
+        offsets.append(offsets[-1] + len(line))
+
+    ops: List[TextOp] = []
+    matcher = SequenceMatcher(None, base_lines, lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([offsets[i1], offsets[i2] - offsets[i1]])
+        elif j2 > j1:
+            ops.append("".join(lines[j1:j2]))
+    return ops
+
+
+def apply_text_delta(base: Optional[str], ops: List[TextOp]) -> str:
+    base = base or ""
+    return "".join(op if isinstance(op, str) else base[op[0]:op[0] + op[1]] for op in ops)
+
+
+def encode_delta(keyframe: Dict[str, Any], content: Dict[str, Any]) -> Dict[str, Any]:
+    """키프레임 대비 내용 델타 (역할 순서 유지, prompt는 텍스트 델타 또는 None)"""
+    delta = {}
+    for role, message in content.items():
+        base_prompt = (keyframe.get(role) or {}).get("prompt")
+        prompt = message["prompt"]
+        delta[role] = {
+            "order": message["order"],
+            "prompt": None if prompt is None else encode_text_delta(base_prompt, prompt),
+        }
+    return delta
+
+
+def apply_delta(keyframe: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """encode_delta의 역연산 (DB 함수 prompt_apply_delta와 같은 결과)"""
+    content = {}
+    for role, message in delta.items():
+        base_prompt = (keyframe.get(role) or {}).get("prompt")
+        ops = message.get("prompt")
+        content[role] = {
+            "order": message.get("order"),
+            "prompt": apply_text_delta(base_prompt, ops) if isinstance(ops, list) else ops,
+        }
+    return content
+
+
+def _hunk(old_lines: List[str], new_lines: List[str], i1: int, i2: int, j1: int, j2: int) -> Dict[str, Any]:
+    """old_lines[i1:i2]가 new_lines[j1:j2]로 바뀐 변경 구간 (줄 번호는 1부터)"""
+    if i2 > i1 and j2 > j1:
+        tag = "replace"
+    elif i2 > i1:
+        tag = "delete"
+    else:
+        tag = "insert"
+    return {
+        "op": tag,
+        "from_line": i1 + 1,
+        "from_count": i2 - i1,
+        "to_line": j1 + 1,
+        "to_count": j2 - j1,
+        "removed": old_lines[i1:i2],
+        "added": new_lines[j1:j2],
+    }
+
+
+def diff_text(old: Optional[str], new: Optional[str]) -> List[Dict[str, Any]]:
+    """줄 단위 변경 구간 목록 (줄 번호는 1부터, 같은 구간은 생략)"""
+    old_lines = (old or "").splitlines()
+    new_lines = (new or "").splitlines()
+
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return [
+        _hunk(old_lines, new_lines, i1, i2, j1, j2)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def keyframe_as_delta(keyframe: Dict[str, Any]) -> Dict[str, Any]:
+    """키프레임 자신을 자기 대비 델타로 표현 (prompt 전체를 한 번에 복사)"""
+    return {
+        role: {
+            "order": message.get("order"),
+            "prompt": None if message.get("prompt") is None else [[0, len(message["prompt"])]],
+        }
+        for role, message in keyframe.items()
+    }
+
+
+def _strip_line_ends(lines: List[str]) -> List[str]:
+    return [line.splitlines()[0] if line.splitlines() else "" for line in lines]
+
+
+def _delta_lines(base: str, base_lines: List[str], line_starts: Dict[int, int], ops: List[TextOp]) -> List[Union[int, str]]:
+    """
+    델타 연산을 줄 목록으로 펼칩니다. 키프레임에서 복사한 줄은 키프레임 줄 번호(int),
+    삽입한 줄은 줄 텍스트(str)입니다. encode_text_delta는 줄 경계에서만 복사하므로 복사 구간은 줄 번호로 바뀝니다.
+    """
+    lines: List[Union[int, str]] = []
+    for op in ops:
+        if isinstance(op, str):
+            lines.extend(op.splitlines(keepends=True))
+            continue
+        start, length = op
+        first = line_starts.get(start)
+        last = line_starts.get(start + length)
+        if first is None or last is None:
+            # 줄 경계가 아닌 복사 구간은 텍스트로 취급
+            lines.extend(base[start:start + length].splitlines(keepends=True))
+        else:
+            lines.extend(range(first, last))
+    return lines
+
+
+def diff_delta_text(base: Optional[str], old_ops: List[TextOp], new_ops: List[TextOp]) -> List[Dict[str, Any]]:
+    """
+    같은 키프레임 대비 두 텍스트 델타의 줄 단위 변경 구간 (diff_text와 같은 형식).
+    두 델타가 모두 복사한 키프레임 줄을 같은 줄로 맞추고 그 사이의 줄만 비교하므로,
+    두 버전을 복원하거나 전체 텍스트에 difflib을 돌리지 않습니다.
+    """
+    base = base or ""
+    base_lines = base.splitlines(keepends=True)
+    line_starts = {0: 0}
+    offset = 0
+    for index, line in enumerate(base_lines, start=1):
+        offset += len(line)
+        line_starts[offset] = index
+
+    old = _delta_lines(base, base_lines, line_starts, old_ops)
+    new = _delta_lines(base, base_lines, line_starts, new_ops)
+
+    # 줄 끝 문자까지 비교해서 변경 구간이 없으면 두 텍스트가 같음
+    old_raw = [base_lines[line] if isinstance(line, int) else line for line in old]
+    new_raw = [base_lines[line] if isinstance(line, int) else line for line in new]
+
+    # 복사한 키프레임 줄은 두 델타에서 모두 증가 순이므로 공통 줄이 그대로 정렬 기준이 됨
+    old_positions = {line: index for index, line in enumerate(old) if isinstance(line, int)}
+    anchors = [
+        (old_positions[line], index)
+        for index, line in enumerate(new)
+        if isinstance(line, int) and line in old_positions
+    ]
+    anchors.append((len(old), len(new)))
+
+    hunks = []
+    i = j = 0
+    for anchor_i, anchor_j in anchors:
+        i1, i2, j1, j2 = i, anchor_i, j, anchor_j
+        # 양쪽에 똑같이 삽입된 줄은 변경에서 제외
+        while i1 < i2 and j1 < j2 and old_raw[i1] == new_raw[j1]:
+            i1 += 1
+            j1 += 1
+        while i1 < i2 and j1 < j2 and old_raw[i2 - 1] == new_raw[j2 - 1]:
+            i2 -= 1
+            j2 -= 1
+        if i1 < i2 or j1 < j2:
+            hunks.append(_hunk(_strip_line_ends(old_raw), _strip_line_ends(new_raw), i1, i2, j1, j2))
+        i, j = anchor_i + 1, anchor_j + 1
+    return hunks
+
+
+def _diff_roles(old: Dict[str, Any], new: Dict[str, Any], diff_prompt) -> List[Dict[str, Any]]:
+    """역할별 order 변경과 diff_prompt(이전, 이후)가 돌려준 (변경 여부, 변경 구간)"""
+    roles = list(old) + [role for role in new if role not in old]
+
+    result = []
+    for role in roles:
+        old_message = old.get(role) or {}
+        new_message = new.get(role) or {}
+        order_changed = old_message.get("order") != new_message.get("order")
+        prompt_changed, hunks = diff_prompt(role, old_message.get("prompt"), new_message.get("prompt"))
+
+        result.append(
+            {
+                "role": role,
+                "changed": order_changed or prompt_changed,
+                "order": {
+                    "from": old_message.get("order"),
+                    "to": new_message.get("order"),
+                    "changed": order_changed,
+                },
+                "prompt": {
+                    "changed": prompt_changed,
+                    "hunks": hunks,
+                },
+            }
+        )
+    return result
+
+
+def diff_contents(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """역할별 구조화된 차이 (order 변경과 prompt의 줄 단위 변경 구간)"""
+
+    def diff_prompt(role, old_prompt, new_prompt):
+        if old_prompt == new_prompt:
+            return False, []
+        return True, diff_text(old_prompt, new_prompt)
+
+    return _diff_roles(old, new, diff_prompt)
+
+
+def diff_deltas(keyframe: Dict[str, Any], old_delta: Dict[str, Any], new_delta: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    같은 키프레임 대비 두 델타의 역할별 차이 (diff_contents와 같은 형식).
+    키프레임 버전은 keyframe_as_delta로 바꿔서 전달합니다.
+    """
+
+    def diff_prompt(role, old_ops, new_ops):
+        if old_ops == new_ops:
+            return False, []
+        base = (keyframe.get(role) or {}).get("prompt")
+        if old_ops is None or new_ops is None:
+            # prompt가 없는 쪽과는 텍스트 전체가 변경 구간
+            old_prompt = None if old_ops is None else apply_text_delta(base, old_ops)
+            new_prompt = None if new_ops is None else apply_text_delta(base, new_ops)
+            return True, diff_text(old_prompt, new_prompt)
+        hunks = diff_delta_text(base, old_ops, new_ops)
+        return bool(hunks), hunks
+
+    return _diff_roles(old_delta, new_delta, diff_prompt)
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Iterable, Optional, Set
+
+import asyncpg
+
+from app.core.prompt_cache import prompt_cache
+from app.core.prompt_snapshot import invalidate_production_snapshot
+from app.database import DATABASE_URL, database
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트 변경 알림 채널
+PROMPT_CHANGES_CHANNEL = "prompt_changes"
+
+# 현재 워커 식별자 (자기 자신이 보낸 알림 구분용)
+WORKER_ID = uuid.uuid4().hex
+
+
+async def notify_prompt_change(node_name: str, version: Optional[int] = None) -> None:
+    """
+    프롬프트 리비전을 올리고 다른 워커에 변경 사항을 알립니다.
+    쓰기와 같은 트랜잭션 안에서 호출하며, 알림은 커밋 시점에 전달되고 롤백되면 전달되지 않습니다.
+    version을 생략하면 노드 전체가 변경된 것으로 처리됩니다.
+    로컬 캐시는 커밋 후 invalidate_prompt_change로 무효화합니다.
+    """
+    # 리비전 증가와 알림 전송을 한 번의 왕복으로 처리
+    await database.execute(
+        """
+        SELECT pg_notify(
+            :channel,
+            json_build_object(
+                'node_name', CAST(:node_name AS text),
+                'version', CAST(:version AS integer),
+                'origin', CAST(:origin AS text),
+                'revision', nextval('prompt_revision_seq')
+            )::text
+        )
+        """,
+        {
+            "channel": PROMPT_CHANGES_CHANNEL,
+            "node_name": node_name,
+            "version": version,
+            "origin": WORKER_ID,
+        },
+    )
+
+
+async def notify_prompt_changes(node_names: Iterable[str]) -> None:
+    """
+    여러 노드 전체의 변경을 한 번의 왕복으로 알림 (노드마다 알림과 리비전이 하나씩 생성됨).
+    notify_prompt_change와 같이 쓰기 트랜잭션 안에서 호출합니다.
+    """
+    await database.execute(
+        """
+        SELECT pg_notify(
+            :channel,
+            json_build_object(
+                'node_name', changed.node_name,
+                'version', CAST(NULL AS integer),
+                'origin', CAST(:origin AS text),
+                'revision', nextval('prompt_revision_seq')
+            )::text
+        )
+        FROM unnest(CAST(:node_names AS text[])) AS changed(node_name)
+        """,
+        {
+            "channel": PROMPT_CHANGES_CHANNEL,
+            "node_names": sorted(set(node_names)),
+            "origin": WORKER_ID,
+        },
+    )
+
+
+def invalidate_prompt_change(node_name: str, version: Optional[int] = None) -> None:
+    """커밋 후 현재 워커의 캐시 무효화 (다른 워커는 커밋 시 전달되는 알림으로 무효화)"""
+    prompt_cache.invalidate(node_name, version)
+    invalidate_production_snapshot()
+
+
+def invalidate_prompt_changes(node_names: Iterable[str]) -> None:
+    """여러 노드 전체에 대한 invalidate_prompt_change"""
+    for node_name in set(node_names):
+        prompt_cache.invalidate(node_name)
+    invalidate_production_snapshot()
+
+
+class PromptWatchSubscription:
+    """구독자별로 변경된 노드 이름을 모아 두는 구독 정보"""
+
+    def __init__(self, node_names: Iterable[str]):
+        self.node_names: Set[str] = set(node_names)
+        self.pending: Set[str] = set()
+        self.changed = asyncio.Event()
+
+    def mark(self, node_names: Iterable[str]) -> None:
+        matched = self.node_names.intersection(node_names)
+        if matched:
+            self.pending.update(matched)
+            self.changed.set()
+
+    def drain(self) -> Set[str]:
+        """모인 변경 노드를 꺼내고 대기 상태로 되돌림"""
+        pending, self.pending = self.pending, set()
+        self.changed.clear()
+        return pending
+
+
+class PromptChangeBroker:
+    """변경 알림을 워치 스트림 구독자에게 전달하는 프로세스 내 브로커"""
+
+    def __init__(self):
+        self._subscriptions: Set[PromptWatchSubscription] = set()
+
+    def subscribe(self, node_names: Iterable[str]) -> PromptWatchSubscription:
+        subscription = PromptWatchSubscription(node_names)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: PromptWatchSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def publish(self, node_name: str) -> None:
+        for subscription in self._subscriptions:
+            subscription.mark([node_name])
+
+    def publish_all(self) -> None:
+        """알림 누락 가능성이 있을 때 모든 구독 노드를 다시 확인하도록 표시"""
+        for subscription in self._subscriptions:
+            subscription.mark(subscription.node_names)
+
+
+prompt_change_broker = PromptChangeBroker()
+
+
+class PromptChangeListener:
+    """전용 LISTEN 연결로 다른 워커의 변경 알림을 받아 로컬 캐시를 무효화"""
+
+    def __init__(self, dsn: str, channel: str = PROMPT_CHANGES_CHANNEL):
+        self.dsn = dsn
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[asyncpg.Connection] = None
+
+    async def start(self) -> None:
+        # LISTEN 연결이 맺어지기 전까지는 다른 워커의 변경을 알 수 없으므로 캐시 사용 중지
+        prompt_cache.enabled = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        retry_delay = 1
+        while True:
+            closed = asyncio.Event()
+            try:
+                self._connection = await asyncpg.connect(self.dsn)
+                self._connection.add_termination_listener(lambda _: closed.set())
+                await self._connection.add_listener(self.channel, self._on_notification)
+
+                # 연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 캐시를 비우고 다시 사용
+                prompt_cache.clear()
+                prompt_cache.enabled = True
+                prompt_change_broker.publish_all()
+                retry_delay = 1
+                logger.info(f"📡 프롬프트 변경 알림 수신 시작 (채널: {self.channel})")
+
+                await closed.wait()
+                logger.warning("⚠️ 프롬프트 변경 알림 연결이 끊어졌습니다. 재연결합니다.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ 프롬프트 변경 알림 연결 실패: {e}")
+            finally:
+                prompt_cache.enabled = False
+                if self._connection is not None and not self._connection.is_closed():
+                    await self._connection.close()
+                self._connection = None
+
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 프롬프트 변경 알림: {payload}")
+            return
+
+        # 자신이 보낸 알림은 커밋 직후 로컬에서 이미 무효화됨
+        if event.get("origin") != WORKER_ID:
+            invalidate_prompt_change(event["node_name"], event.get("version"))
+
+        # 워치 스트림은 커밋 이후 도착하는 알림을 기준으로 갱신
+        prompt_change_broker.publish(event["node_name"])
+
+
+prompt_change_listener = PromptChangeListener(DATABASE_URL.replace("+asyncpg", ""))
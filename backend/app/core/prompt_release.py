@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import String, column, func, select, tuple_, update, values
+
+from app.core.node_summary import refresh_node_summaries
+from app.core.prompt_blobs import with_content
+from app.core.prompt_events import notify_prompt_changes
+from app.database import database
+from app.models.prompt_model import prompts
+
+# (node_name, version)
+ReleaseTarget = Tuple[str, int]
+
+
+class ReleaseTargetNotFound(LookupError):
+    """배포하려는 노드/버전의 프롬프트가 없음 (트랜잭션은 롤백됨)"""
+
+    def __init__(self, missing: List[ReleaseTarget]):
+        self.missing = missing
+        super().__init__(
+            ", ".join(f"{node_name} v{version}" for node_name, version in missing)
+        )
+
+
+def lock_nodes_query(node_names: Iterable[str]):
+    """
+    노드 단위 트랜잭션 잠금 쿼리 (커밋/롤백 시 자동 해제).
+    여러 노드를 잠그는 쓰기끼리 교착 상태가 생기지 않도록 항상 이름순으로 잠급니다.
+    """
+    locked = values(column("node_name", String), name="locked_nodes").data(
+        [(node_name,) for node_name in sorted(set(node_names))]
+    )
+    return select(func.pg_advisory_xact_lock(func.hashtext(locked.c.node_name)))
+
+
+async def release_prompts(targets: List[ReleaseTarget]):
+    """
+    여러 노드의 프로덕션 프롬프트를 한 트랜잭션에서 전환합니다.
+    노드 수와 관계없이 잠금, 기존 프로덕션 해제, 새 프로덕션 지정, 요약 갱신, 변경 알림을 고정된 수의 쿼리로 처리하며,
+    하나라도 찾지 못하면 ReleaseTargetNotFound로 전체를 롤백합니다.
+
+    해제와 지정을 하나의 UPDATE ... CASE로 합치면 행 처리 순서에 따라
+    노드당 프로덕션 부분 유니크 인덱스 검사에 걸릴 수 있어 두 문장으로 나눕니다.
+    """
+    node_names = sorted({node_name for node_name, _ in targets})
+
+    demote_query = (
+        update(prompts)
+        .where(prompts.c.node_name.in_(node_names), prompts.c.production == True)
+        .values(production=False)
+    )
+    promote_query = with_content(
+        update(prompts)
+        .where(tuple_(prompts.c.node_name, prompts.c.version).in_(targets))
+        .values(production=True, updated_at=datetime.now(timezone.utc))
+    )
+
+    async with database.transaction():
+        await database.execute(lock_nodes_query(node_names))
+        await database.execute(demote_query)
+        released = await database.fetch_all(promote_query)
+
+        found = {(record.node_name, record.version) for record in released}
+        missing = [target for target in targets if target not in found]
+        if missing:
+            raise ReleaseTargetNotFound(missing)
+
+        await refresh_node_summaries(node_names)
+        await notify_prompt_changes(node_names)
+
+    order = {target: index for index, target in enumerate(targets)}
+    return sorted(released, key=lambda record: order[(record.node_name, record.version)])
@@ -0,0 +1,90 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+
+from app.database import database
+from app.models.prompt_model import prompt_rows
+
+# 스냅샷 파일 형식 버전 (구조가 바뀌면 증가)
+SNAPSHOT_FORMAT_VERSION = 1
+
+# 마지막으로 생성한 스냅샷 (리비전이 그대로면 재사용)
+_latest_snapshot: Optional[Dict[str, Any]] = None
+
+
+def encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    """스냅샷을 공백 없는 JSON 바이트로 직렬화"""
+    return json.dumps(
+        snapshot, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+
+async def get_prompt_revision() -> int:
+    """현재 프롬프트 리비전 번호 조회 (한 번도 변경되지 않았으면 0)"""
+    row = await database.fetch_one(
+        "SELECT last_value, is_called FROM prompt_revision_seq"
+    )
+    return row["last_value"] if row and row["is_called"] else 0
+
+
+def invalidate_production_snapshot() -> None:
+    """
+    재사용 중인 스냅샷 제거 (변경이 커밋된 뒤 호출).
+    리비전은 쓰기 트랜잭션 안에서 커밋 전에 증가하므로, 그 사이에 만든 스냅샷은
+    같은 리비전이어도 커밋 전 내용일 수 있습니다.
+    """
+    global _latest_snapshot
+    _latest_snapshot = None
+
+
+async def build_production_snapshot() -> Dict[str, Any]:
+    """
+    모든 노드의 현재 프로덕션 프롬프트로 스냅샷을 생성합니다.
+    `snapshot_id`는 프롬프트 리비전이며 변경이 있을 때만 증가합니다.
+    """
+    global _latest_snapshot
+
+    # 리비전을 먼저 읽어야 스냅샷 내용이 snapshot_id보다 오래되지 않음
+    revision = await get_prompt_revision()
+    if _latest_snapshot is not None and _latest_snapshot["snapshot_id"] == revision:
+        return _latest_snapshot
+
+    query = (
+        select(
+            prompt_rows.c.id,
+            prompt_rows.c.node_name,
+            prompt_rows.c.version,
+            prompt_rows.c.content,
+            prompt_rows.c.message,
+            prompt_rows.c.updated_at,
+        )
+        .where(prompt_rows.c.production == True)
+        .order_by(prompt_rows.c.node_name)
+    )
+    records = await database.fetch_all(query)
+
+    production_prompts = {
+        record.node_name: {
+            "id": record.id,
+            "version": record.version,
+            "content": record.content,
+            "message": record.message,
+            "updated_at": int(record.updated_at.timestamp()) if record.updated_at else None,
+        }
+        for record in records
+    }
+    content_hash = hashlib.sha256(
+        encode_snapshot(production_prompts)
+    ).hexdigest()
+
+    _latest_snapshot = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "snapshot_id": revision,
+        "content_hash": content_hash,
+        "created_at": int(datetime.now(timezone.utc).timestamp()),
+        "prompts": production_prompts,
+    }
+    return _latest_snapshot
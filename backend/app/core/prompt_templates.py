@@ -0,0 +1,126 @@
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# {변수} 자리 표시자. {{변수}}는 변수로 치환하지 않고 {변수} 그대로 출력
+# 식별자 형태가 아닌 중괄호(JSON 예시 등)는 일반 텍스트로 취급
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([^\W\d]\w*)\}\}|\{([^\W\d]\w*)\}")
+
+# 컴파일된 템플릿 캐시 크기 (내용 해시가 같으면 템플릿도 같으므로 무효화가 필요 없음)
+COMPILED_PROMPT_CACHE_SIZE = 1024
+
+
+class MissingTemplateVariables(LookupError):
+    """렌더링에 필요한 변수가 빠진 변수 세트가 있음"""
+
+    def __init__(self, missing: List[Tuple[int, List[str]]]):
+        self.missing = missing
+        super().__init__(
+            "; ".join(f"#{index}: {', '.join(names)}" for index, names in missing)
+        )
+
+
+def compile_template(template: str) -> Tuple[Tuple[Tuple[str, str], ...], str]:
+    """
+    템플릿을 (앞 텍스트, 변수 이름) 조각 목록과 마지막 텍스트로 나눕니다.
+    렌더링은 조각을 순서대로 이어 붙이기만 하므로 템플릿을 다시 파싱하지 않습니다.
+    """
+    segments = []
+    text = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        text.append(template[position:match.start()])
+        escaped_name, name = match.groups()
+        if escaped_name is not None:
+            text.append("{" + escaped_name + "}")
+        else:
+            segments.append(("".join(text), name))
+            text = []
+        position = match.end()
+    text.append(template[position:])
+    return tuple(segments), "".join(text)
+
+
+def render_template(segments: Tuple[Tuple[str, str], ...], tail: str, values: Mapping[str, Any]) -> str:
+    """컴파일된 템플릿 렌더링 (변수가 빠지면 KeyError)"""
+    parts = []
+    for text, name in segments:
+        parts.append(text)
+        parts.append(str(values[name]))
+    parts.append(tail)
+    return "".join(parts)
+
+
+class CompiledPrompt:
+    """역할별 템플릿을 미리 컴파일한 프롬프트 (order 순서의 메시지 목록으로 렌더링)"""
+
+    __slots__ = ("content_hash", "variables", "_messages")
+
+    def __init__(self, content_hash: str, content: Dict[str, Any]):
+        self.content_hash = content_hash
+
+        # prompt가 없는 역할은 메시지에서 제외하고, order가 없는 역할은 뒤에 둠
+        roles = [
+            (role, message)
+            for role, message in content.items()
+            if isinstance(message, dict) and message.get("prompt") is not None
+        ]
+        roles.sort(key=lambda item: (item[1].get("order") is None, item[1].get("order") or 0))
+
+        variables: List[str] = []
+        messages = []
+        for role, message in roles:
+            segments, tail = compile_template(message["prompt"])
+            variables.extend(name for _, name in segments if name not in variables)
+            # 변수가 없으면 렌더링 결과가 항상 같으므로 미리 만들어 둠
+            fixed = {"role": role, "content": tail} if not segments else None
+            messages.append((role, segments, tail, fixed))
+
+        self.variables = tuple(variables)
+        self._messages = tuple(messages)
+
+    def render(self, values: Mapping[str, Any]) -> List[Dict[str, str]]:
+        """변수 세트 하나를 메시지 목록으로 렌더링 (변수가 빠지면 KeyError)"""
+        return [
+            fixed if fixed is not None else {"role": role, "content": render_template(segments, tail, values)}
+            for role, segments, tail, fixed in self._messages
+        ]
+
+    def render_many(self, variable_sets: Sequence[Mapping[str, Any]]) -> List[List[Dict[str, str]]]:
+        """
+        여러 변수 세트를 순서대로 렌더링합니다.
+        변수가 빠진 세트가 있으면 모든 세트를 확인한 뒤 MissingTemplateVariables를 발생시킵니다.
+        """
+        rendered = []
+        missing = []
+        for index, values in enumerate(variable_sets):
+            try:
+                rendered.append(self.render(values))
+            except KeyError:
+                missing.append((index, [name for name in self.variables if name not in values]))
+        if missing:
+            raise MissingTemplateVariables(missing)
+        return rendered
+
+
+_compiled_prompts: "OrderedDict[str, CompiledPrompt]" = OrderedDict()
+
+
+def get_compiled_prompt(content_hash: str) -> Optional[CompiledPrompt]:
+    compiled = _compiled_prompts.get(content_hash)
+    if compiled is not None:
+        _compiled_prompts.move_to_end(content_hash)
+    return compiled
+
+
+def compile_prompt(content_hash: str, content: Dict[str, Any]) -> CompiledPrompt:
+    """내용 해시 기준으로 컴파일 결과를 캐시 (쓰기 시점에 미리 호출하여 첫 렌더링 비용 제거)"""
+    compiled = get_compiled_prompt(content_hash)
+    if compiled is not None:
+        return compiled
+
+    compiled = CompiledPrompt(content_hash, content)
+    _compiled_prompts[content_hash] = compiled
+    while len(_compiled_prompts) > COMPILED_PROMPT_CACHE_SIZE:
+        _compiled_prompts.popitem(last=False)
+    return compiled
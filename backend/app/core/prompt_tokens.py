@@ -0,0 +1,48 @@
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import tiktoken
+
+from app.core.prompt_blobs import canonical_content
+
+# 패키지에 포함한 BPE 어휘 파일 디렉터리 (tiktoken 캐시 형식: 파일 이름은 어휘 URL의 SHA-1)
+# cl100k_base 어휘를 포함하므로 기본 인코딩은 네트워크 없이 로드됨
+TOKENIZER_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tokenizer_data")
+# tiktoken은 어휘를 로드할 때 캐시 디렉터리에서 먼저 찾고 해시를 검증하므로,
+# 따로 지정하지 않았으면 포함한 어휘를 사용
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", TOKENIZER_DATA_DIR)
+
+# 토큰 수 계산에 사용할 tiktoken 인코딩 이름 (포함되지 않은 인코딩은 처음 사용할 때 어휘를 내려받음)
+PROMPT_TOKENIZER_ENCODING = os.getenv("PROMPT_TOKENIZER_ENCODING", "cl100k_base")
+
+ROLES = ("system", "user", "assistant")
+
+_tokenizer: Optional[Tuple[str, Callable[[str], int]]] = None
+
+
+def get_tokenizer() -> Tuple[str, Callable[[str], int]]:
+    """
+    (토크나이저 이름, 토큰 수 계산 함수).
+    어휘와 사전 분할 규칙(pat_str)은 tiktoken에 등록된 인코딩 정의를 그대로 사용합니다.
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        encoding = tiktoken.get_encoding(PROMPT_TOKENIZER_ENCODING)
+        _tokenizer = (f"tiktoken:{encoding.name}", lambda text: len(encoding.encode_ordinary(text)))
+    return _tokenizer
+
+
+def count_prompt_tokens(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    역할별 토큰 수와 크기 정보를 prompts 컬럼 값으로 계산합니다.
+    프롬프트를 저장할 때 한 번만 계산하여 소비자가 다시 토큰화하지 않도록 합니다.
+    """
+    name, count = get_tokenizer()
+    values = {}
+    for role in ROLES:
+        prompt = (content.get(role) or {}).get("prompt")
+        values[f"token_count_{role}"] = count(prompt) if prompt else 0
+    values["token_count"] = sum(values[f"token_count_{role}"] for role in ROLES)
+    values["content_bytes"] = len(canonical_content(content).encode("utf-8"))
+    values["tokenizer"] = name
+    return values
@@ -1,6 +1,6 @@
 import os
 from databases import Database
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, DDL, event
 
 # 환경변수에서 DATABASE_URL을 가져오고, 없으면 기본값 사용
 DATABASE_URL = os.getenv(
@@ -10,4 +10,7 @@ DATABASE_URL = os.getenv(
 
 database = Database(DATABASE_URL)
 engine = create_engine(DATABASE_URL.replace("+asyncpg", ""))
-metadata = MetaData()
\ No newline at end of file
+metadata = MetaData()
+
+# 트라이그램 인덱스(gin_trgm_ops)에 필요한 확장
+event.listen(metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
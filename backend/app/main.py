@@ -4,9 +4,12 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.database import database, engine, metadata
-from app.routers import prompt_router, dataset_router, evaluation_router  # 라우터 추가
+from app.routers import prompt_router, dataset_router, evaluation_router, search_router  # 라우터 추가
 from app.schemas.response_schema import ResponseSchema
 from app.logging_config import setup_logging
+from app.core.prompt_events import prompt_change_listener
+from app.core.node_summary import rebuild_node_summaries
+from app.core.prompt_tokens import get_tokenizer
 
 # 로깅 설정 초기화
 logger = setup_logging()
@@ -19,8 +22,16 @@ async def lifespan(app: FastAPI):
     metadata.create_all(engine)
     logger.info("🔌 데이터베이스 연결 중...")
     await database.connect()
+    # 어휘 로드를 첫 프롬프트 저장 전에 처리
+    tokenizer_name, _ = get_tokenizer()
+    logger.info(f"🔤 프롬프트 토크나이저: {tokenizer_name}")
+    logger.info("📊 노드 요약 정보 동기화 중...")
+    await rebuild_node_summaries()
+    logger.info("📡 프롬프트 변경 알림 수신 연결 중...")
+    await prompt_change_listener.start()
     logger.info("✅ 애플리케이션 시작 완료")
     yield
+    await prompt_change_listener.stop()
     logger.info("🔌 데이터베이스 연결 해제 중...")
     await database.disconnect()
     logger.info("✅ 애플리케이션 종료 완료")
@@ -86,12 +97,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Snapshot-Id"],
 )
 
 # 라우터 등록
 app.include_router(prompt_router.router)
 app.include_router(dataset_router.router)
 app.include_router(evaluation_router.router)
+app.include_router(search_router.router)
 
 
 @app.get("/")
@@ -1,5 +1,7 @@
-from sqlalchemy import Table, Column, Integer, String, DateTime, Text
+from sqlalchemy import Table, Column, Integer, BigInteger, String, DateTime, Text, JSON, LargeBinary, Index, ForeignKey, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from app.database import metadata
+from app.utils.search_utils import search_vector
 from datetime import datetime, timezone
 
 datasets = Table(
@@ -8,7 +10,13 @@ datasets = Table(
     Column("id", Integer, primary_key=True, index=True),
     Column("name", String(100), nullable=False),
     Column("description", String(255), nullable=True),
-    Column("content", Text, nullable=False),  # CSV 내용 저장
+    # CSV 내용 (이전 스키마 호환용, 업로드 내용은 dataset_chunks에 나누어 저장)
+    Column("content", Text, nullable=True),
+    # 업로드 시 계산한 CSV 메타데이터 (목록/검색에서 content를 읽지 않도록)
+    Column("row_count", Integer, nullable=True),
+    Column("byte_size", BigInteger, nullable=True),
+    Column("column_names", JSON, nullable=True),
+    Column("content_sha256", String(64), nullable=True),
     Column(
         "created_at",
         DateTime(timezone=True),
@@ -20,4 +28,75 @@ datasets = Table(
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc)
     ),
-)
\ No newline at end of file
+)
+
+# 업로드한 CSV 원본 바이트를 순서대로 나눈 조각 (스트리밍 업로드 시 COPY로 적재)
+dataset_chunks = Table(
+    "dataset_chunks",
+    metadata,
+    Column("dataset_id", Integer, ForeignKey("datasets.id", ondelete="CASCADE"), primary_key=True),
+    Column("chunk_index", Integer, primary_key=True),
+    Column("byte_offset", BigInteger, nullable=False),  # 원본 파일에서 조각이 시작하는 위치
+    Column("data", LargeBinary, nullable=False),
+)
+
+# 파싱한 CSV 데이터 행 (행 번호 범위로 미리보기, 샘플링, 분할 평가를 인덱스로 조회)
+dataset_rows = Table(
+    "dataset_rows",
+    metadata,
+    Column("dataset_id", Integer, ForeignKey("datasets.id", ondelete="CASCADE"), primary_key=True),
+    Column("row_index", Integer, primary_key=True),  # 헤더를 제외한 0부터의 행 번호
+    Column("data", JSONB, nullable=False),  # datasets.column_names 순서의 값 배열
+)
+
+# CSV 전체 내용 (이전 업로드는 content, 이후 업로드는 조각을 이어 붙여 UTF-8로 변환)
+dataset_content = func.coalesce(
+    datasets.c.content,
+    select(
+        func.convert_from(
+            func.string_agg(
+                dataset_chunks.c.data,
+                aggregate_order_by(literal_column("''::bytea"), dataset_chunks.c.chunk_index),
+            ),
+            literal_column("'UTF8'"),
+            type_=Text,
+        )
+    )
+    .where(dataset_chunks.c.dataset_id == datasets.c.id)
+    .scalar_subquery(),
+    type_=Text,
+)
+
+# 목록/검색/요약 응답 컬럼 (CSV 본문 content 제외)
+DATASET_METADATA_COLUMNS = [
+    datasets.c.id,
+    datasets.c.name,
+    datasets.c.description,
+    datasets.c.row_count,
+    datasets.c.byte_size,
+    datasets.c.column_names,
+    datasets.c.content_sha256,
+    datasets.c.created_at,
+    datasets.c.updated_at,
+]
+
+# 이름 중복 확인
+Index("ix_datasets_name", datasets.c.name)
+# 최신순 키셋 페이지네이션
+Index("ix_datasets_created_at_id", datasets.c.created_at, datasets.c.id)
+# 이름/설명 검색 (이름 가중치 A, 설명 가중치 B)
+DATASET_SEARCH_COLUMNS = (datasets.c.name, datasets.c.description)
+dataset_search_vector = search_vector((datasets.c.name, "A"), (datasets.c.description, "B"))
+Index("ix_datasets_search_vector", dataset_search_vector, postgresql_using="gin")
+Index(
+    "ix_datasets_name_trgm",
+    datasets.c.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+Index(
+    "ix_datasets_description_trgm",
+    datasets.c.description,
+    postgresql_using="gin",
+    postgresql_ops={"description": "gin_trgm_ops"},
+)
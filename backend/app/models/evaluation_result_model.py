@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Table, Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index
 from app.database import metadata
 from datetime import datetime, timezone
 import enum
@@ -34,6 +34,11 @@ evaluation_requests = Table(
     ),
 )
 
+# 상태별 대기열 조회 (status = ? ORDER BY created_at)
+Index("ix_evaluation_requests_status_created_at", evaluation_requests.c.status, evaluation_requests.c.created_at)
+# 최신순 키셋 페이지네이션
+Index("ix_evaluation_requests_created_at_id", evaluation_requests.c.created_at, evaluation_requests.c.id)
+
 # 기존 평가 결과 테이블
 evaluation_results = Table(
     "evaluation_results",
@@ -49,4 +54,17 @@ evaluation_results = Table(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc)
     ),
-)
\ No newline at end of file
+)
+
+# 프롬프트/데이터셋/메트릭별 결과 조회와 최신순 정렬
+Index(
+    "ix_evaluation_results_prompt_dataset_metric_created_at",
+    evaluation_results.c.prompt_id,
+    evaluation_results.c.dataset_id,
+    evaluation_results.c.metric_name,
+    evaluation_results.c.created_at,
+)
+# 평가 요청별 결과 조회
+Index("ix_evaluation_results_evaluation_request_id", evaluation_results.c.evaluation_request_id)
+# 최신순 키셋 페이지네이션
+Index("ix_evaluation_results_created_at_id", evaluation_results.c.created_at, evaluation_results.c.id)
@@ -0,0 +1,20 @@
+from sqlalchemy import Table, Column, Integer, String, DateTime
+from app.database import metadata
+from datetime import datetime, timezone
+
+# 노드별 요약 정보 (프롬프트 쓰기 시 같은 트랜잭션에서 갱신)
+node_summary = Table(
+    "node_summary",
+    metadata,
+    Column("node_name", String(50), primary_key=True),
+    Column("prompt_count", Integer, nullable=False, default=0),
+    Column("latest_version", Integer, nullable=True),
+    Column("production_prompt_id", Integer, nullable=True),
+    Column("latest_created_at", DateTime(timezone=True), nullable=True),
+    Column(
+        "updated_at",
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    ),
+)
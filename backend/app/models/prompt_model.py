@@ -1,16 +1,118 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Table, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Table, JSON, Text, Sequence, Index, ForeignKey, Computed, DDL, column, event, func, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.database import metadata
+from app.utils.search_utils import search_vector
 from datetime import datetime, timezone
 
+# 프롬프트 내용 저장소 (정규화된 JSON의 SHA-256으로 식별, 같은 내용은 한 번만 저장)
+# 키프레임은 content에 전체 내용을, 델타는 base_hash 키프레임 대비 변경분을 delta에 저장
+prompt_blobs = Table(
+    "prompt_blobs",
+    metadata,
+    Column("content_hash", String(64), primary_key=True),
+    Column("content", JSON, nullable=True),
+    Column("base_hash", String(64), ForeignKey("prompt_blobs.content_hash"), nullable=True),
+    Column("delta", JSON, nullable=True),
+    # 검색용 system/user 텍스트 (델타 blob도 인덱싱할 수 있도록 저장 시 추출)
+    Column("system_text", Text, nullable=True),
+    Column("user_text", Text, nullable=True),
+    # 템플릿 변수 이름 목록 (저장 시 app.core.prompt_templates로 추출, order 순서의 첫 등장 순)
+    Column("template_variables", JSON, nullable=True),
+    # 긴 본문의 tsvector를 매 검색마다 다시 만들지 않도록 저장 (system 가중치 A, user 가중치 B)
+    Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(search_vector((column("system_text"), "A"), (column("user_text"), "B")), persisted=True),
+    ),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    ),
+)
+
+# 키프레임을 기준으로 한 델타 목록 (키프레임별 델타 수 확인)
+Index("ix_prompt_blobs_base_hash", prompt_blobs.c.base_hash)
+
+# 프롬프트 내용 검색
+PROMPT_BLOB_SEARCH_COLUMNS = (prompt_blobs.c.system_text, prompt_blobs.c.user_text)
+Index("ix_prompt_blobs_search_vector", prompt_blobs.c.search_vector, postgresql_using="gin")
+Index(
+    "ix_prompt_blobs_system_text_trgm",
+    prompt_blobs.c.system_text,
+    postgresql_using="gin",
+    postgresql_ops={"system_text": "gin_trgm_ops"},
+)
+Index(
+    "ix_prompt_blobs_user_text_trgm",
+    prompt_blobs.c.user_text,
+    postgresql_using="gin",
+    postgresql_ops={"user_text": "gin_trgm_ops"},
+)
+
+# 키프레임 내용에 델타를 적용하는 DB 함수 (app.core.prompt_delta.apply_delta와 같은 결과)
+# 델타 형식: {역할: {"order": ..., "prompt": [[시작, 길이] 또는 "삽입 문자열", ...] 또는 null}}
+PROMPT_APPLY_DELTA_FUNCTION = """
+CREATE OR REPLACE FUNCTION prompt_apply_delta(keyframe json, delta json) RETURNS json
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT json_object_agg(
+        role.key,
+        json_build_object(
+            'order', role.value -> 'order',
+            'prompt', CASE
+                WHEN json_typeof(role.value -> 'prompt') = 'array' THEN (
+                    SELECT to_json(coalesce(string_agg(
+                        CASE
+                            WHEN json_typeof(op.value) = 'string' THEN op.value #>> '{}'
+                            ELSE substr(
+                                keyframe -> role.key ->> 'prompt',
+                                (op.value ->> 0)::int + 1,
+                                (op.value ->> 1)::int
+                            )
+                        END,
+                        '' ORDER BY op.ordinality
+                    ), ''))
+                    FROM json_array_elements(role.value -> 'prompt') WITH ORDINALITY AS op(value, ordinality)
+                )
+                ELSE role.value -> 'prompt'
+            END
+        )
+        ORDER BY role.ordinality
+    )
+    FROM json_each(delta) WITH ORDINALITY AS role(key, value, ordinality)
+$$
+"""
+event.listen(prompt_blobs, "after_create", DDL(PROMPT_APPLY_DELTA_FUNCTION))
+
+# 델타 blob의 키프레임 (조회 시 내용 복원에 사용)
+keyframe_blobs = prompt_blobs.alias("keyframe_blobs")
+# prompt_blobs에 키프레임을 붙인 조인 (prompt_blobs와 키프레임 컬럼을 함께 사용)
+blobs_with_keyframes = prompt_blobs.outerjoin(
+    keyframe_blobs, prompt_blobs.c.base_hash == keyframe_blobs.c.content_hash
+)
+# 키프레임은 저장된 내용, 델타는 키프레임에 델타를 적용한 내용
+resolved_blob_content = func.coalesce(
+    prompt_blobs.c.content,
+    func.prompt_apply_delta(keyframe_blobs.c.content, prompt_blobs.c.delta, type_=JSON),
+    type_=JSON,
+)
+
 prompts = Table(
     "prompts",
     metadata,
     Column("id", Integer, primary_key=True, index=True),
     Column("node_name", String(50), nullable=False),
-    Column("content", JSON, nullable=False),
+    Column("content_hash", String(64), ForeignKey("prompt_blobs.content_hash"), nullable=False),
     Column("message", String(255), nullable=True),
     Column("production", Boolean, default=False),
     Column("version", Integer, nullable=False, default=1),
+    # 저장 시 계산한 역할별 토큰 수와 크기 (app.core.prompt_tokens.count_prompt_tokens)
+    Column("token_count_system", Integer, nullable=True),
+    Column("token_count_user", Integer, nullable=True),
+    Column("token_count_assistant", Integer, nullable=True),
+    Column("token_count", Integer, nullable=True),
+    Column("content_bytes", Integer, nullable=True),
+    Column("tokenizer", String(50), nullable=True),
     Column(
         "created_at",
         DateTime(timezone=True),
@@ -23,3 +125,58 @@ prompts = Table(
         onupdate=lambda: datetime.now(timezone.utc),
     ),
 )
+
+# 노드별 버전은 유일하며 (node_name, version) 조회에 사용
+Index("uq_prompts_node_name_version", prompts.c.node_name, prompts.c.version, unique=True)
+# 노드당 프로덕션 프롬프트는 하나만 허용 (부분 유니크 인덱스, 프로덕션 조회에도 사용)
+Index(
+    "uq_prompts_node_name_production",
+    prompts.c.node_name,
+    unique=True,
+    postgresql_where=prompts.c.production == True,
+)
+# 최신순 키셋 페이지네이션 (created_at DESC, id DESC)
+Index("ix_prompts_created_at_id", prompts.c.created_at, prompts.c.id)
+# 토큰 수 필터/정렬 (token_count, id 키셋)
+Index("ix_prompts_token_count_id", prompts.c.token_count, prompts.c.id)
+# 노드 안에서 같은 내용의 버전 찾기
+Index("ix_prompts_node_name_content_hash", prompts.c.node_name, prompts.c.content_hash)
+# 검색된 blob을 사용하는 버전 찾기
+Index("ix_prompts_content_hash", prompts.c.content_hash)
+# 변경 메시지 검색
+prompt_message_search_vector = search_vector((prompts.c.message, "A"))
+Index("ix_prompts_message_search_vector", prompt_message_search_vector, postgresql_using="gin")
+Index(
+    "ix_prompts_message_trgm",
+    prompts.c.message,
+    postgresql_using="gin",
+    postgresql_ops={"message": "gin_trgm_ops"},
+)
+
+# 조회용 프롬프트 행: prompts에 blob 내용을 붙인 형태 (API 응답 컬럼 순서 유지)
+PROMPT_ROW_COLUMNS = [
+    prompts.c.id,
+    prompts.c.node_name,
+    resolved_blob_content.label("content"),
+    prompts.c.message,
+    prompts.c.production,
+    prompts.c.version,
+    prompts.c.created_at,
+    prompts.c.updated_at,
+    prompts.c.content_hash,
+    prompts.c.token_count_system,
+    prompts.c.token_count_user,
+    prompts.c.token_count_assistant,
+    prompts.c.token_count,
+    prompts.c.content_bytes,
+    prompts.c.tokenizer,
+    prompt_blobs.c.template_variables,
+]
+prompt_rows = (
+    select(*PROMPT_ROW_COLUMNS)
+    .select_from(prompts.join(blobs_with_keyframes, prompts.c.content_hash == prompt_blobs.c.content_hash))
+    .subquery("prompt_rows")
+)
+
+# 프롬프트 변경마다 증가하는 리비전 번호 (프로덕션 스냅샷 식별자로 사용)
+prompt_revision_seq = Sequence("prompt_revision_seq", metadata=metadata)
@@ -7,22 +7,70 @@ from fastapi import (
     Body,
     Query,
     Depends,
+    Request,
 )
+import json
+import os
 from typing import List, Optional
 from app.database import database
-from app.models.dataset_model import datasets
+from app.core.dataset_columnar import (
+    COLUMNAR_MEDIA_TYPES,
+    ColumnarImportError,
+    columnar_available,
+    columnar_cache_path,
+    detect_upload_format,
+    ensure_columnar_cache,
+    read_columnar_upload,
+    remove_cache_file,
+    remove_columnar_cache,
+    temporary_cache_path,
+)
+from app.core.dataset_content import (
+    CsvRecordTooLarge,
+    iter_dataset_chunks,
+    read_upload_chunks,
+    store_dataset_upload,
+)
+from app.models.dataset_model import (
+    DATASET_METADATA_COLUMNS,
+    DATASET_SEARCH_COLUMNS,
+    dataset_content,
+    dataset_rows,
+    dataset_search_vector,
+    datasets,
+)
 from app.schemas.dataset_schema import DatasetRead, DatasetUpdate
 from app.schemas.response_schema import ResponseSchema
 from app.schemas.pagination_schema import PaginationParams, PaginatedResponse
+from app.utils.pagination_utils import (
+    decode_sort_cursor,
+    encode_sort_cursor,
+    fetch_page,
+    fetch_total,
+)
+from app.utils.search_utils import text_match, text_rank
+from app.utils.download_utils import (
+    RangeNotSatisfiable,
+    compress_stream,
+    if_range_matches,
+    negotiate_encoding,
+    parse_range,
+)
 from app.utils.response_utils import (
     create_success_response,
     create_error_response,
     create_paginated_response,
     get_total_count,
+    create_etag,
+    create_fast_success_response,
+    create_records_etag,
+    is_not_modified,
+    set_etag_headers,
+    create_not_modified_response,
 )
-from sqlalchemy import select, insert, delete, update, or_, func
+from sqlalchemy import select, insert, delete, update, func
 from datetime import datetime, timezone
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import FileResponse, Response, JSONResponse, StreamingResponse
 
 router = APIRouter(prefix="/datasets", tags=["📊 2. 데이터셋 관리"])
 
@@ -31,8 +79,8 @@ router = APIRouter(prefix="/datasets", tags=["📊 2. 데이터셋 관리"])
 @router.post(
     "/",
     tags=["📊 2. 데이터셋 관리"],
-    summary="📤 데이터셋 업로드 (CSV)",
-    description="CSV 파일을 업로드하여 새로운 데이터셋을 생성합니다.",
+    summary="📤 데이터셋 업로드 (CSV, Parquet, Arrow)",
+    description="CSV, Parquet 또는 Arrow IPC 파일을 업로드하여 새로운 데이터셋을 생성합니다.",
 )
 async def upload_dataset(
     name: str = Form(
@@ -45,21 +93,25 @@ async def upload_dataset(
         description="데이터셋에 대한 상세 설명 (선택 사항).",
         example="설명1",
     ),
-    file: UploadFile = File(..., description="업로드할 CSV 형식의 파일."),
+    file: UploadFile = File(..., description="업로드할 CSV, Parquet 또는 Arrow IPC 파일."),
 ):
     """
     새로운 데이터셋을 생성합니다.
 
     - **name**: 데이터셋의 고유한 이름.
     - **description**: 데이터셋에 대한 설명.
-    - **file**: `.csv` 확장자를 가진 파일.
+    - **file**: `.csv`, `.parquet` 또는 `.arrow`(`.feather`, `.arrows`) 파일.
 
-    파일 내용은 UTF-8로 인코딩되어야 합니다.
+    CSV 파일 내용은 UTF-8로 인코딩되어야 합니다.
+    Parquet/Arrow 파일은 pyarrow가 설치된 경우에만 지원하며, 배치 단위로 CSV로 변환하여 저장하고
+    원래 컬럼 타입은 Arrow 캐시 파일로 보관합니다.
+    파일은 조각 단위로 읽어 저장하므로 크기와 관계없이 메모리 사용량이 일정합니다.
+    한 행이 DATASET_MAX_RECORD_SIZE를 넘으면 413을 반환합니다.
     성공적으로 생성되면, 생성된 데이터셋의 정보를 반환합니다.
     """
     # 중복 이름 체크 추가
     existing_dataset = await database.fetch_one(
-        select(datasets).where(datasets.c.name == name)
+        select(datasets.c.id).where(datasets.c.name == name)
     )
 
     if existing_dataset:
@@ -70,27 +122,58 @@ async def upload_dataset(
             message=f"Dataset with name '{name}' already exists.",
         )
 
-    if file.content_type != "text/csv":
-        raise HTTPException(status_code=400, detail="CSV 파일만 업로드 가능합니다.")
+    upload_format = detect_upload_format(file.content_type, file.filename)
+    if upload_format is None:
+        raise HTTPException(
+            status_code=400, detail="CSV, Parquet, Arrow IPC 파일만 업로드 가능합니다."
+        )
+    if upload_format != "csv" and not columnar_available():
+        raise HTTPException(
+            status_code=400,
+            detail="Parquet/Arrow 업로드에는 pyarrow가 필요합니다. CSV 파일로 업로드해 주세요.",
+        )
+
+    now = datetime.now(timezone.utc)
+    arrow_path = None
 
-    content_bytes = await file.read()
     try:
-        content_str = content_bytes.decode("utf-8")
+        # 데이터셋 행을 먼저 만들고 조각과 데이터 행을 COPY로 적재 (파일 오류 시 모두 롤백)
+        async with database.transaction():
+            dataset_id = await database.execute(
+                insert(datasets)
+                .values(name=name, description=description, created_at=now)
+                .returning(datasets.c.id)
+            )
+            if upload_format == "csv":
+                chunks = read_upload_chunks(file)
+            else:
+                arrow_path = temporary_cache_path()
+                chunks = read_columnar_upload(file, upload_format, arrow_path)
+            content_metadata = await store_dataset_upload(dataset_id, chunks)
+            created_dataset = await database.fetch_one(
+                update(datasets)
+                .where(datasets.c.id == dataset_id)
+                .values(**content_metadata, updated_at=datasets.c.updated_at)
+                .returning(*DATASET_METADATA_COLUMNS)
+            )
+        if arrow_path is not None:
+            # 업로드한 타입 그대로의 Arrow 캐시를 내용 해시 경로로 옮김 (커밋 이후)
+            os.replace(
+                arrow_path,
+                columnar_cache_path(dataset_id, content_metadata["content_sha256"], "arrow"),
+            )
     except UnicodeDecodeError:
         raise HTTPException(
             status_code=400,
             detail="파일 인코딩이 올바르지 않습니다. UTF-8로 인코딩된 파일이어야 합니다.",
         )
-
-    now = datetime.now(timezone.utc)
-
-    query = (
-        insert(datasets)
-        .values(name=name, description=description, content=content_str, created_at=now)
-        .returning(datasets)
-    )
-
-    created_dataset = await database.fetch_one(query)
+    except CsvRecordTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ColumnarImportError as e:
+        raise HTTPException(status_code=400, detail=f"Parquet/Arrow 파일을 읽을 수 없습니다: {e}")
+    finally:
+        # 실패 시 남은 임시 캐시 파일 정리 (성공 시에는 이미 옮겨져 없음)
+        remove_cache_file(arrow_path)
 
     # 성공 시 message를 null로 설정 (프론트엔드 에러 감지용)
     if isinstance(created_dataset, dict):
@@ -128,7 +211,12 @@ async def upload_dataset(
                                     "id": 1,
                                     "name": "dataset1",
                                     "description": "설명",
+                                    "row_count": 120,
+                                    "byte_size": 48213,
+                                    "column_names": ["question", "answer"],
+                                    "content_sha256": "3f1a...",
                                     "created_at": 1750064190,
+                                    "updated_at": 1750064190,
                                 }
                             ],
                             "page": 1,
@@ -152,33 +240,23 @@ async def get_datasets_paginated(
     """
     모든 데이터셋을 페이지네이션으로 조회합니다.
     검색어로 필터링도 가능합니다.
+    CSV 본문(`content`)은 포함하지 않으며 행 수, 크기, 컬럼 이름 등 메타데이터만 반환합니다.
     """
     try:
-        # 기본 쿼리 구성
-        base_query = select(datasets)
+        # 기본 쿼리 구성 (CSV 본문 제외)
+        base_query = select(*DATASET_METADATA_COLUMNS)
 
-        # 검색 필터링 적용
+        # 검색 필터링 적용 (전문 검색/트라이그램 인덱스 사용)
         if search:
             base_query = base_query.where(
-                or_(
-                    datasets.c.name.ilike(f"%{search}%"),
-                    datasets.c.description.ilike(f"%{search}%"),
-                )
+                text_match(dataset_search_vector, DATASET_SEARCH_COLUMNS, search)
             )
 
         # 전체 개수 조회
-        count_query = select(func.count()).select_from(base_query.alias())
-        total = await database.fetch_one(count_query)
-        total_count = total[0] if total else 0
+        total_count = await fetch_total(database, base_query, datasets, pagination)
 
         # 페이지네이션 적용된 데이터 조회
-        paginated_query = (
-            base_query.order_by(datasets.c.created_at.desc())
-            .limit(pagination.size)
-            .offset((pagination.page - 1) * pagination.size)
-        )
-
-        items = await database.fetch_all(paginated_query)
+        items, next_cursor = await fetch_page(database, base_query, datasets, pagination)
 
         filter_message = f" (검색: {search})" if search else ""
         message = f"데이터셋 목록을 성공적으로 조회했습니다{filter_message}."
@@ -189,6 +267,9 @@ async def get_datasets_paginated(
             size=pagination.size,
             total=total_count,
             message=message,
+            next_cursor=next_cursor,
+            cursor_mode=pagination.cursor is not None,
+            total_estimated=pagination.estimate_total,
         )
 
     except Exception as e:
@@ -287,15 +368,16 @@ async def delete_dataset(dataset_id: int):
     데이터셋이 존재하지 않으면 404 오류를 반환합니다.
     """
     # 먼저 데이터셋이 존재하는지 확인
-    query = select(datasets).where(datasets.c.id == dataset_id)
+    query = select(datasets.c.id).where(datasets.c.id == dataset_id)
     existing_dataset = await database.fetch_one(query)
 
     if not existing_dataset:
         raise HTTPException(status_code=404, detail="Dataset not found.")
 
-    # 데이터셋 삭제
+    # 데이터셋 삭제 (조각과 행은 외래 키로 함께 삭제)
     delete_query = delete(datasets).where(datasets.c.id == dataset_id)
     await database.execute(delete_query)
+    remove_columnar_cache(dataset_id)
 
     return create_success_response(
         {"detail": f"Dataset {dataset_id} has been deleted."},
@@ -310,7 +392,7 @@ async def delete_dataset(dataset_id: int):
     summary="🔍 특정 데이터셋 조회",
     description="데이터셋 ID로 특정 데이터셋의 상세 정보를 조회합니다.",
 )
-async def get_dataset(dataset_id: int):
+async def get_dataset(dataset_id: int, request: Request, response: Response):
     """
     지정된 ID를 가진 데이터셋의 상세 정보를 반환합니다.
 
@@ -318,13 +400,36 @@ async def get_dataset(dataset_id: int):
 
     데이터셋 내용(`content`)을 포함한 모든 정보를 반환합니다.
     데이터셋이 존재하지 않으면 404 오류를 반환합니다.
+    `If-None-Match` 헤더가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
     """
-    query = select(datasets).where(datasets.c.id == dataset_id)
+    # content 본문 대신 업로드 시 저장한 해시만 먼저 조회하여 ETag 비교
+    version_query = select(
+        datasets.c.id,
+        datasets.c.name,
+        datasets.c.description,
+        datasets.c.updated_at,
+        datasets.c.content_sha256,
+    ).where(datasets.c.id == dataset_id)
+    dataset_version = await database.fetch_one(version_query)
+
+    if not dataset_version:
+        raise HTTPException(status_code=404, detail="Dataset not found.")
+
+    etag = create_records_etag(
+        [dataset_version], "id", "name", "description", "updated_at", "content_sha256"
+    )
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+
+    query = select(*DATASET_METADATA_COLUMNS, dataset_content.label("content")).where(
+        datasets.c.id == dataset_id
+    )
     dataset = await database.fetch_one(query)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found.")
 
+    set_etag_headers(response, etag)
     return create_success_response(dataset, "데이터셋을 성공적으로 조회했습니다.")
 
 
@@ -368,7 +473,7 @@ async def update_dataset(
     """
 
     # 기존 데이터셋 조회
-    query = select(datasets).where(datasets.c.id == dataset_id)
+    query = select(datasets.c.id, datasets.c.name).where(datasets.c.id == dataset_id)
     existing_dataset = await database.fetch_one(query)
 
     if not existing_dataset:
@@ -389,7 +494,7 @@ async def update_dataset(
     # 이름 중복 체크 (이름이 변경되는 경우에만)
     if "name" in update_data and update_data["name"] != existing_dataset.name:
         duplicate_check = await database.fetch_one(
-            select(datasets).where(
+            select(datasets.c.id).where(
                 datasets.c.name == update_data["name"], datasets.c.id != dataset_id
             )
         )
@@ -407,7 +512,7 @@ async def update_dataset(
         update(datasets)
         .where(datasets.c.id == dataset_id)
         .values(**update_data)
-        .returning(datasets)
+        .returning(*DATASET_METADATA_COLUMNS)
     )
 
     updated_dataset = await database.fetch_one(update_query)
@@ -422,7 +527,16 @@ async def update_dataset(
     "/{dataset_id}/download",
     tags=["📊 2. 데이터셋 관리"],
     summary="📥 데이터셋 다운로드",
-    description="데이터셋을 CSV 파일로 다운로드합니다.",
+    description="""
+데이터셋을 CSV, Parquet 또는 Arrow IPC 파일로 다운로드합니다.
+
+- `format=parquet|arrow`는 데이터셋별 컬럼 캐시 파일을 전송합니다 (pyarrow 필요).
+  처음 요청할 때 한 번 만들며, 이후에는 파일을 그대로 보내고 `Range` 요청도 지원합니다.
+- CSV는 저장된 조각을 순서대로 스트리밍하므로 파일 크기와 관계없이 첫 바이트가 바로 전송됩니다.
+- `Accept-Encoding`에 따라 zstd(설치된 경우) 또는 gzip으로 압축하여 전송합니다.
+- `Range: bytes=시작-끝` 요청은 206으로 해당 범위만 보내므로 끊긴 다운로드를 이어받을 수 있습니다
+  (범위 응답은 압축하지 않으며, `If-Range`가 현재 ETag와 다르면 전체를 보냅니다).
+    """,
     responses={
         200: {
             "description": "데이터셋의 CSV 파일 내용",
@@ -433,35 +547,231 @@ async def update_dataset(
                 }
             },
         },
+        206: {"description": "요청한 바이트 범위의 파일 내용 (Content-Range 포함)"},
+        304: {"description": "If-None-Match가 현재 ETag와 같아 본문 없이 응답"},
         404: {
             "description": "데이터셋을 찾을 수 없음",
             "content": {
                 "application/json": {"example": {"detail": "Dataset not found."}}
             },
         },
+        400: {
+            "description": "pyarrow가 설치되지 않아 컬럼 형식을 지원하지 않음",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Parquet/Arrow 다운로드에는 pyarrow가 필요합니다."}
+                }
+            },
+        },
+        416: {"description": "요청한 범위가 파일 크기를 벗어남 (Content-Range: bytes */크기)"},
     },
 )
-async def download_dataset(dataset_id: int):
+async def download_dataset(
+    dataset_id: int,
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|parquet|arrow)$", description="파일 형식 (csv, parquet, arrow)"),
+):
     """
-    지정된 ID의 데이터셋을 `.csv` 파일로 다운로드합니다.
+    지정된 ID의 데이터셋을 `.csv`(또는 `.parquet`, `.arrow`) 파일로 다운로드합니다.
 
     - **dataset_id**: 다운로드할 데이터셋의 고유 ID.
+    - **format**: 파일 형식.
 
     `Content-Disposition` 헤더가 `attachment`로 설정되어 브라우저에서 파일 다운로드를 유도합니다.
+    본문은 DB에서 조각 단위로 읽어 바로 전송하므로 워커 메모리 사용량이 일정합니다.
     """
-    query = select(datasets).where(datasets.c.id == dataset_id)
+    query = select(
+        datasets.c.name, datasets.c.byte_size, datasets.c.content_sha256
+    ).where(datasets.c.id == dataset_id)
     dataset = await database.fetch_one(query)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found.")
 
-    csv_content = dataset.content
+    if format != "csv":
+        if not columnar_available():
+            raise HTTPException(
+                status_code=400, detail="Parquet/Arrow 다운로드에는 pyarrow가 필요합니다."
+            )
+        # ETag는 원본 해시와 형식으로 정해지므로 캐시 파일을 만들거나 확인하기 전에 304 응답
+        etag = create_etag(dataset.content_sha256, format)
+        if is_not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        path = await ensure_columnar_cache(dataset_id, dataset.content_sha256, format)
+        # 이미 압축된 컬럼 형식이므로 파일 그대로 전송 (FileResponse가 Range 처리)
+        return FileResponse(
+            path,
+            media_type=COLUMNAR_MEDIA_TYPES[format],
+            filename=f"{dataset.name}.{format}",
+            headers={"ETag": etag},
+        )
+
+    size = dataset.byte_size
     filename = f"{dataset.name}.csv"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+    }
+
+    # 범위 요청은 원본 바이트 기준으로 처리 (압축하지 않음)
+    etag = create_etag(dataset.content_sha256)
+    try:
+        byte_range = (
+            parse_range(request.headers.get("range"), size)
+            if if_range_matches(request, etag)
+            else None
+        )
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is not None:
+        start, end = byte_range
+        return StreamingResponse(
+            iter_dataset_chunks(dataset_id, start, end),
+            status_code=206,
+            media_type="text/csv",
+            headers={
+                **headers,
+                "ETag": etag,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            },
+        )
 
-    return Response(
-        content=csv_content,
+    encoding = negotiate_encoding(request)
+    if encoding is not None:
+        # 압축 표현은 원본과 다른 ETag 사용
+        etag = create_etag(dataset.content_sha256, encoding)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+
+    headers["ETag"] = etag
+    if encoding is None:
+        headers["Content-Length"] = str(size)
+    else:
+        headers["Content-Encoding"] = encoding
+
+    return StreamingResponse(
+        compress_stream(iter_dataset_chunks(dataset_id), encoding),
         media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers=headers,
+    )
+
+
+# 데이터셋 행 조회
+@router.get(
+    "/{dataset_id}/rows",
+    tags=["📋 4. 조회 및 검색"],
+    summary="📄 데이터셋 행 조회",
+    description="""
+데이터셋의 데이터 행을 행 번호 순서로 일부만 조회합니다 (미리보기, 샘플링, 분할 평가용).
+
+- `offset`은 헤더를 제외한 0부터의 행 번호이며, 건너뛰지 않고 행 번호 인덱스로 바로 찾습니다.
+- `cursor`를 지정하면 이전 응답의 마지막 행 다음부터 조회합니다 (`offset`보다 우선).
+- `columns`에 쉼표로 구분한 컬럼 이름을 주면 해당 컬럼만 반환합니다.
+    """,
+    responses={
+        200: {
+            "description": "데이터셋 행 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "columns": ["question", "answer"],
+                            "items": [
+                                {"row_index": 0, "values": {"question": "파리의 날씨는?", "answer": "맑음"}},
+                                {"row_index": 1, "values": {"question": "서울의 날씨는?", "answer": "비"}},
+                            ],
+                            "offset": 0,
+                            "limit": 2,
+                            "total": 120,
+                            "next_cursor": "WzQsMV0",
+                        },
+                        "message": "데이터셋 행을 성공적으로 조회했습니다.",
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "잘못된 컬럼 이름 또는 커서",
+            "content": {
+                "application/json": {"example": {"detail": "Unknown columns: ['score']"}}
+            },
+        },
+        404: {
+            "description": "데이터셋을 찾을 수 없음",
+            "content": {
+                "application/json": {"example": {"detail": "Dataset not found."}}
+            },
+        },
+    },
+)
+async def get_dataset_rows(
+    dataset_id: int,
+    offset: int = Query(0, ge=0, description="시작 행 번호 (헤더 제외, 0부터)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 최대 행 수"),
+    columns: Optional[str] = Query(None, description="반환할 컬럼 이름 (쉼표로 구분, 생략 시 전체)"),
+):
+    dataset = await database.fetch_one(
+        select(datasets.c.column_names, datasets.c.row_count).where(datasets.c.id == dataset_id)
+    )
+    if not dataset:
+        raise HTTPException(status_code=404, detail="Dataset not found.")
+
+    column_names = dataset.column_names or []
+    if columns:
+        selected = [name.strip() for name in columns.split(",") if name.strip()]
+        unknown = [name for name in selected if name not in column_names]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown columns: {unknown}")
+    else:
+        selected = column_names
+
+    if cursor:
+        try:
+            cursor_dataset_id, last_row_index = decode_sort_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if cursor_dataset_id != dataset_id:
+            raise HTTPException(status_code=400, detail="Cursor belongs to another dataset.")
+        offset = last_row_index + 1
+
+    # 선택한 컬럼만 DB에서 잘라서 가져옴 (전체 컬럼이면 배열 그대로)
+    if columns:
+        positions = [column_names.index(name) for name in selected]
+        values = func.jsonb_build_array(*(dataset_rows.c.data.op("->")(position) for position in positions))
+    else:
+        values = dataset_rows.c.data
+    records = await database.fetch_all(
+        select(dataset_rows.c.row_index, values.label("data"))
+        .where(dataset_rows.c.dataset_id == dataset_id, dataset_rows.c.row_index >= offset)
+        .order_by(dataset_rows.c.row_index)
+        .limit(limit + 1)
+    )
+
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_sort_cursor(dataset_id, records[-1].row_index)
+
+    items = []
+    for record in records:
+        data = json.loads(record.data) if isinstance(record.data, str) else record.data
+        items.append({"row_index": record.row_index, "values": dict(zip(selected, data))})
+
+    return create_fast_success_response(
+        {
+            "columns": selected,
+            "items": items,
+            "offset": offset,
+            "limit": limit,
+            "total": dataset.row_count,
+            "next_cursor": next_cursor,
+        },
+        "데이터셋 행을 성공적으로 조회했습니다.",
     )
 
 
@@ -470,14 +780,13 @@ async def download_dataset(dataset_id: int):
     "/search/",
     tags=["📋 4. 조회 및 검색"],
     summary="🔍 데이터셋 검색",
-    description="이름이나 설명에서 키워드로 데이터셋을 검색합니다.",
+    description="이름이나 설명에서 키워드로 데이터셋을 검색합니다. CSV 본문은 포함하지 않습니다.",
 )
 async def search_datasets(query: str = Query(..., description="검색할 키워드")):
-    query_stmt = select(datasets).where(
-        or_(
-            datasets.c.name.ilike(f"%{query}%"),
-            datasets.c.description.ilike(f"%{query}%"),
-        )
+    query_stmt = (
+        select(*DATASET_METADATA_COLUMNS)
+        .where(text_match(dataset_search_vector, DATASET_SEARCH_COLUMNS, query))
+        .order_by(text_rank(dataset_search_vector, query, DATASET_SEARCH_COLUMNS).desc(), datasets.c.id.desc())
     )
 
     search_results = await database.fetch_all(query_stmt)
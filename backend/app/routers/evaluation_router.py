@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Body, Query, Depends
 from app.core.evaluators import run_evaluation, get_available_metrics
+from app.core.prompt_cache import get_prompt
 from app.database import database
-from app.models.prompt_model import prompts
-from app.models.dataset_model import datasets
+from app.models.prompt_model import prompt_rows
+from app.models.dataset_model import dataset_content, datasets
 from app.models.evaluation_result_model import evaluation_results, evaluation_requests, EvaluationStatus
 from sqlalchemy import select, insert, func
 from datetime import datetime, timezone
@@ -10,6 +11,7 @@ from pydantic import BaseModel
 from typing import List, Optional
 from app.schemas.response_schema import ResponseSchema
 from app.schemas.pagination_schema import PaginationParams, PaginatedResponse
+from app.utils.pagination_utils import fetch_page, fetch_total
 from app.utils.response_utils import create_success_response, create_error_response, create_paginated_response, get_total_count
 import uuid
 import json
@@ -129,21 +131,9 @@ async def request_node_evaluation(request: NodeEvaluationRequest = Body(...)):
     - 비동기 처리를 위한 상태 관리
     """
     try:
-        # 1. 노드와 버전 검증
-        if request.version == "production":
-            # 프로덕션 버전 조회
-            prompt_query = select(prompts).where(
-                prompts.c.node_name == request.node_name,
-                prompts.c.production == True
-            )
-        else:
-            # 특정 버전 조회
-            prompt_query = select(prompts).where(
-                prompts.c.node_name == request.node_name,
-                prompts.c.version == int(request.version)
-            )
-        
-        prompt = await database.fetch_one(prompt_query)
+        # 1. 노드와 버전 검증 (프로덕션 또는 특정 버전, 캐시 경유)
+        version = None if request.version == "production" else int(request.version)
+        prompt = await get_prompt(request.node_name, version)
         if not prompt:
             raise HTTPException(
                 status_code=404, 
@@ -151,7 +141,7 @@ async def request_node_evaluation(request: NodeEvaluationRequest = Body(...)):
             )
 
         # 2. 데이터셋 검증
-        dataset_query = select(datasets).where(datasets.c.id == request.dataset_id)
+        dataset_query = select(datasets.c.id).where(datasets.c.id == request.dataset_id)
         dataset = await database.fetch_one(dataset_query)
         if not dataset:
             raise HTTPException(status_code=404, detail="Dataset not found")
@@ -225,13 +215,13 @@ class EvaluationResult(BaseModel):
 )
 async def evaluate_prompt(request: EvaluationRequest = Body(...)):
     # 프롬프트 조회
-    prompt_query = select(prompts).where(prompts.c.id == request.prompt_id)
+    prompt_query = select(prompt_rows).where(prompt_rows.c.id == request.prompt_id)
     prompt = await database.fetch_one(prompt_query)
     if not prompt:
         raise HTTPException(status_code=404, detail="Prompt not found.")
 
     # 데이터셋 조회
-    dataset_query = select(datasets).where(datasets.c.id == request.dataset_id)
+    dataset_query = select(dataset_content.label("content")).where(datasets.c.id == request.dataset_id)
     dataset = await database.fetch_one(dataset_query)
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found.")
@@ -337,21 +327,10 @@ async def get_evaluation_results_paginated(
             base_query = base_query.where(evaluation_results.c.prompt_id == prompt_id)
         
         # 전체 개수 조회
-        count_query = select(func.count()).select_from(
-            base_query.alias()
-        )
-        total = await database.fetch_one(count_query)
-        total_count = total[0] if total else 0
+        total_count = await fetch_total(database, base_query, evaluation_results, pagination)
         
         # 페이지네이션 적용된 데이터 조회
-        paginated_query = (
-            base_query
-            .order_by(evaluation_results.c.created_at.desc())
-            .limit(pagination.size)
-            .offset((pagination.page - 1) * pagination.size)
-        )
-        
-        items = await database.fetch_all(paginated_query)
+        items, next_cursor = await fetch_page(database, base_query, evaluation_results, pagination)
         
         # 필터링 메시지 구성
         filters = []
@@ -368,7 +347,10 @@ async def get_evaluation_results_paginated(
             page=pagination.page,
             size=pagination.size,
             total=total_count,
-            message=message
+            message=message,
+            next_cursor=next_cursor,
+            cursor_mode=pagination.cursor is not None,
+            total_estimated=pagination.estimate_total
         )
         
     except Exception as e:
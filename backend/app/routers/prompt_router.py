@@ -1,17 +1,195 @@
-from fastapi import APIRouter, HTTPException, Body, Path, status, Query, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Body, Path, status, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Tuple
 from app.database import database
-from app.models.prompt_model import prompts
-from app.schemas.prompt_schema import PromptCreate, PromptRead, PromptUpdate
+from app.models.prompt_model import prompts, prompt_rows
+from app.core.prompt_blobs import compute_content_hash, diff_prompt_blobs, store_prompt_blob, with_content
+from app.core.prompt_tokens import count_prompt_tokens
+from app.core.prompt_templates import MissingTemplateVariables, compile_prompt, get_compiled_prompt
+from app.schemas.prompt_schema import (
+    PromptCreate,
+    PromptRead,
+    PromptUpdate,
+    PromptResolveRequest,
+    PromptReleaseRequest,
+    PromptRenderRequest,
+)
 from app.schemas.response_schema import ResponseSchema
 from app.schemas.pagination_schema import PaginationParams, PaginatedResponse
-from app.utils.response_utils import create_success_response, create_error_response, create_paginated_response, get_total_count
+from app.utils.pagination_utils import fetch_page, fetch_sorted_page, fetch_total
+from app.utils.serialization_utils import serialize_records
+from app.utils.response_utils import (
+    create_success_response,
+    create_fast_success_response,
+    create_error_response,
+    create_paginated_response,
+    get_total_count,
+    convert_record_to_dict,
+    create_records_etag,
+    is_not_modified,
+    set_etag_headers,
+    create_not_modified_response,
+)
+from app.core.prompt_cache import get_prompt, resolve_prompts
+from app.core.prompt_events import (
+    invalidate_prompt_change,
+    invalidate_prompt_changes,
+    notify_prompt_change,
+    prompt_change_broker,
+)
+from app.core.prompt_release import ReleaseTargetNotFound, lock_nodes_query, release_prompts
+from app.core.prompt_snapshot import build_production_snapshot, encode_snapshot
+from app.core.node_summary import refresh_node_summary, refresh_node_summaries
+from app.models.node_summary_model import node_summary
 
-from sqlalchemy import select, insert, update, delete, func, distinct
+from sqlalchemy import select, insert, update, delete, func, distinct, exists, literal
 from datetime import datetime, timezone, timedelta
+from asyncpg.exceptions import UniqueViolationError
+import asyncio
+import json
 
 router = APIRouter(prefix="/prompts", tags=["📝 1. 프롬프트 관리"])
 
+# ETag 계산에 사용하는 필드 (production 전환 시 비활성화되는 행은 updated_at이 바뀌지 않으므로 포함)
+PROMPT_ETAG_FIELDS = ("id", "node_name", "version", "production", "updated_at")
+
+# 워치 스트림 연결 유지용 하트비트 간격 (초)
+WATCH_HEARTBEAT_SECONDS = 15
+
+async def get_node_prompt_count(node_name: str) -> int:
+    """쓰기 시 갱신되는 node_summary의 프롬프트 개수 (요약 행이 없으면 프롬프트가 없는 노드)"""
+    query = select(node_summary.c.prompt_count).where(node_summary.c.node_name == node_name)
+    return await database.fetch_val(query) or 0
+
+
+def token_count_conditions(table, min_tokens: Optional[int], max_tokens: Optional[int]) -> list:
+    """저장된 전체 토큰 수(token_count) 범위 조건"""
+    conditions = []
+    if min_tokens is not None:
+        conditions.append(table.c.token_count >= min_tokens)
+    if max_tokens is not None:
+        conditions.append(table.c.token_count <= max_tokens)
+    return conditions
+
+
+def next_version_insert_query(prompt: PromptCreate, content_hash: str, token_values: dict, now: datetime):
+    """
+    노드의 다음 버전을 계산하여 삽입하는 단일 INSERT ... SELECT 쿼리 (내용은 prompt_blobs에 먼저 저장).
+    버전은 COALESCE(MAX(version), 0) + 1이며, 노드의 첫 프롬프트면 자동으로 프로덕션으로 설정합니다.
+    호출 측에서 lock_nodes_query로 노드를 잠근 뒤 실행하며,
+    (node_name, version) 유니크 인덱스가 잠금을 거치지 않은 쓰기와의 중복을 막습니다.
+    """
+    node_prompts = select(prompts.c.id).where(prompts.c.node_name == prompt.node_name)
+    values = select(
+        literal(prompt.node_name, prompts.c.node_name.type),
+        literal(content_hash, prompts.c.content_hash.type),
+        literal(prompt.message, prompts.c.message.type),
+        ~exists(node_prompts),
+        select(func.coalesce(func.max(prompts.c.version), 0) + 1)
+        .where(prompts.c.node_name == prompt.node_name)
+        .scalar_subquery(),
+        literal(now, prompts.c.created_at.type),
+        literal(now, prompts.c.updated_at.type),
+        *(literal(value, prompts.c[name].type) for name, value in token_values.items()),
+    )
+    return with_content(
+        insert(prompts).from_select(
+            ["node_name", "content_hash", "message", "production", "version", "created_at", "updated_at", *token_values],
+            values,
+        )
+    )
+
+
+def identical_version_query(node_name: str, content_hash: str):
+    """노드에서 같은 내용을 가진 가장 최근 버전 (내용 해시 비교만으로 확인)"""
+    return (
+        select(prompts.c.version)
+        .where(prompts.c.node_name == node_name, prompts.c.content_hash == content_hash)
+        .order_by(prompts.c.version.desc())
+        .limit(1)
+    )
+
+
+def affected_node_names(existing_prompt, update_data: dict) -> List[str]:
+    """수정으로 요약 정보가 바뀌는 노드 목록 (노드 이동 시 이전/새 노드 모두)"""
+    node_names = {existing_prompt.node_name}
+    if update_data.get("node_name"):
+        node_names.add(update_data["node_name"])
+    return sorted(node_names)
+
+
+def production_handover_query(existing_prompt, update_data: dict):
+    """
+    수정 후 프로덕션이 되는 프롬프트가 있으면 대상 노드의 기존 프로덕션을 해제하는 쿼리.
+    노드당 프로덕션은 부분 유니크 인덱스로 하나만 허용되므로 수정 전에 같은 트랜잭션에서 실행합니다.
+    """
+    target_node_name = update_data.get("node_name") or existing_prompt.node_name
+    becomes_production = update_data.get("production", existing_prompt.production)
+    already_owner = existing_prompt.production and target_node_name == existing_prompt.node_name
+    if not becomes_production or already_owner:
+        return None
+
+    return (
+        update(prompts)
+        .where(
+            prompts.c.node_name == target_node_name,
+            prompts.c.production == True,
+            prompts.c.id != existing_prompt.id,
+        )
+        .values(production=False)
+    )
+
+
+async def apply_prompt_update(existing_prompt, update_data: dict):
+    """프롬프트 수정과 내용 저장, 프로덕션 이관, 노드 요약 갱신을 한 트랜잭션으로 실행"""
+    handover_query = production_handover_query(existing_prompt, update_data)
+    node_names = affected_node_names(existing_prompt, update_data)
+    values = dict(update_data)
+    content = values.pop("content", None)
+    if content is not None:
+        values.update(count_prompt_tokens(content))
+    try:
+        async with database.transaction():
+            # 생성/배포와 같은 노드 잠금을 사용하여 프로덕션 이관이 겹치지 않도록 함
+            await database.execute(lock_nodes_query(node_names))
+            if content is not None:
+                target_node_name = values.get("node_name") or existing_prompt.node_name
+                values["content_hash"] = await store_prompt_blob(content, target_node_name)
+            if handover_query is not None:
+                await database.execute(handover_query)
+            updated_prompt = await database.fetch_one(
+                with_content(
+                    update(prompts).where(prompts.c.id == existing_prompt.id).values(**values)
+                )
+            )
+            await refresh_node_summaries(node_names)
+            for node_name, version in updated_prompt_changes(existing_prompt, update_data):
+                await notify_prompt_change(node_name, version)
+    except UniqueViolationError:
+        # 노드 이동 시 대상 노드에 같은 버전이 이미 있는 경우
+        raise HTTPException(
+            status_code=409,
+            detail="A prompt with the same node and version already exists.",
+        )
+    return updated_prompt
+
+
+def updated_prompt_changes(existing_prompt, update_data: dict) -> List[Tuple[str, Optional[int]]]:
+    """수정으로 변경된 (노드, 버전) 목록. 버전이 None이면 노드 전체"""
+    # 노드 이동이나 production 변경은 노드의 다른 항목에도 영향을 주므로 노드 전체 무효화
+    if "node_name" in update_data or "production" in update_data:
+        changes = [(existing_prompt.node_name, None)]
+        if update_data.get("node_name"):
+            changes.append((update_data["node_name"], None))
+        return changes
+    return [(existing_prompt.node_name, existing_prompt.version)]
+
+
+def invalidate_updated_prompt(existing_prompt, update_data: dict) -> None:
+    """수정이 커밋된 뒤 현재 워커의 캐시 무효화 (변경 알림은 apply_prompt_update 트랜잭션에서 전송)"""
+    for node_name, version in updated_prompt_changes(existing_prompt, update_data):
+        invalidate_prompt_change(node_name, version)
+
 
 # 모든 프롬프트 페이지네이션 조회
 @router.get(
@@ -56,36 +234,54 @@ router = APIRouter(prefix="/prompts", tags=["📝 1. 프롬프트 관리"])
 )
 async def get_prompts_paginated(
     pagination: PaginationParams = Depends(),
-    node_name: str = Query(None, description="특정 노드로 필터링")
+    node_name: str = Query(None, description="특정 노드로 필터링"),
+    min_tokens: Optional[int] = Query(None, ge=0, description="전체 토큰 수 하한"),
+    max_tokens: Optional[int] = Query(None, ge=0, description="전체 토큰 수 상한"),
+    sort_by: str = Query("created_at", pattern="^(created_at|token_count)$", description="정렬 기준 (created_at: 최신순, token_count: 토큰 수순)"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="token_count 정렬 방향"),
 ):
     """
     모든 프롬프트를 페이지네이션으로 조회합니다.
-    노드 이름으로 필터링도 가능합니다.
+    노드 이름과 저장된 토큰 수로 필터링하고, 토큰 수로 정렬할 수 있습니다.
     """
     try:
         # 기본 쿼리 구성
-        base_query = select(prompts)
+        base_query = select(prompt_rows)
+        count_query = select(prompts)
         
         # 노드 필터링 적용
         if node_name:
-            base_query = base_query.where(prompts.c.node_name == node_name)
+            base_query = base_query.where(prompt_rows.c.node_name == node_name)
+            count_query = count_query.where(prompts.c.node_name == node_name)
+
+        # 토큰 수 필터링 (토큰 수 정렬은 토큰 수가 없는 행을 제외)
+        token_filtered = min_tokens is not None or max_tokens is not None or sort_by == "token_count"
+        base_query = base_query.where(*token_count_conditions(prompt_rows, min_tokens, max_tokens))
+        count_query = count_query.where(*token_count_conditions(prompts, min_tokens, max_tokens))
+        if sort_by == "token_count":
+            count_query = count_query.where(prompts.c.token_count.isnot(None))
         
-        # 전체 개수 조회
-        count_query = select(func.count()).select_from(
-            base_query.alias()
-        )
-        total = await database.fetch_one(count_query)
-        total_count = total[0] if total else 0
+        # 전체 개수 조회 (노드 필터만 있으면 node_summary에 유지되는 정확한 개수 사용)
+        total_estimated = False
+        if node_name and not token_filtered and pagination.include_total:
+            total_count = await get_node_prompt_count(node_name)
+        else:
+            total_estimated = pagination.estimate_total
+            # 조인 없이 prompts 테이블만 세도록 별도 쿼리 사용
+            total_count = await fetch_total(database, count_query, prompts, pagination)
         
         # 페이지네이션 적용된 데이터 조회
-        paginated_query = (
-            base_query
-            .order_by(prompts.c.created_at.desc())
-            .limit(pagination.size)
-            .offset((pagination.page - 1) * pagination.size)
-        )
-        
-        items = await database.fetch_all(paginated_query)
+        if sort_by == "token_count":
+            items, next_cursor = await fetch_sorted_page(
+                database,
+                base_query,
+                prompt_rows,
+                pagination,
+                prompt_rows.c.token_count,
+                ascending=sort_order == "asc",
+            )
+        else:
+            items, next_cursor = await fetch_page(database, base_query, prompt_rows, pagination)
         
         filter_message = f" (노드: {node_name})" if node_name else ""
         message = f"프롬프트 목록을 성공적으로 조회했습니다{filter_message}."
@@ -95,7 +291,10 @@ async def get_prompts_paginated(
             page=pagination.page,
             size=pagination.size,
             total=total_count,
-            message=message
+            message=message,
+            next_cursor=next_cursor,
+            cursor_mode=pagination.cursor is not None,
+            total_estimated=total_estimated
         )
         
     except Exception as e:
@@ -191,39 +390,33 @@ async def create_prompt(
     if not prompt.content.system.prompt or not prompt.content.system.prompt.strip():
         raise HTTPException(status_code=400, detail="System prompt is required.")
 
-    # 현재 가장 최신 버전 조회
-    query_latest_version = (
-        select(prompts.c.version)
-        .where(prompts.c.node_name == prompt.node_name)
-        .order_by(prompts.c.version.desc())
-        .limit(1)
-    )
-
-    latest_version = await database.fetch_one(query_latest_version)
-    new_version = latest_version.version + 1 if latest_version else 1
-    
-    # 첫 번째 프롬프트라면 자동으로 프로덕션 설정
-    is_first_prompt = latest_version is None
-    production_status = True if is_first_prompt else False
-
-    now = datetime.now(timezone.utc)
+    content = prompt.content.model_dump()
+    content_hash = compute_content_hash(content)
+    token_values = count_prompt_tokens(content)
+    query = next_version_insert_query(prompt, content_hash, token_values, datetime.now(timezone.utc))
 
-    query = (
-        insert(prompts)
-        .values(
-            node_name=prompt.node_name,
-            content=prompt.content.model_dump(),
-            message=prompt.message,
-            production=production_status,
-            version=new_version,
-            created_at=now,
-            updated_at=now,
+    try:
+        async with database.transaction():
+            # 같은 노드의 생성은 커밋까지 직렬화하여 동시 요청이 같은 버전을 계산하지 않도록 함
+            await database.execute(lock_nodes_query([prompt.node_name]))
+            identical_version = await database.fetch_val(
+                identical_version_query(prompt.node_name, content_hash)
+            )
+            await store_prompt_blob(content, prompt.node_name)
+            created_prompt = await database.fetch_one(query)
+            await refresh_node_summary(prompt.node_name)
+            await notify_prompt_change(prompt.node_name, created_prompt.version)
+    except UniqueViolationError:
+        # 잠금을 거치지 않는 경로(노드 이동 수정 등)와 충돌한 경우
+        raise HTTPException(
+            status_code=409,
+            detail="A prompt with the same node and version already exists. Please retry.",
         )
-        .returning(prompts)
-    )
 
-    created_prompt = await database.fetch_one(query)
-    return create_success_response(created_prompt, "프롬프트가 성공적으로 생성되었습니다.")
+    # 다른 워커는 커밋 시 전달되는 알림으로, 현재 워커는 커밋 후 여기서 무효화
+    invalidate_prompt_change(prompt.node_name, created_prompt.version)
+    identical_message = f" (버전 {identical_version}과 내용이 같습니다)" if identical_version else ""
+    return create_success_response(created_prompt, f"프롬프트가 성공적으로 생성되었습니다.{identical_message}")
 
 
 # ID로 프롬프트 조회
@@ -263,14 +456,21 @@ async def create_prompt(
     },
 )
 async def read_prompt(
+    request: Request,
+    response: Response,
     prompt_id: int = Path(
         ..., description="🆔 조회할 프롬프트의 고유 ID", example=1, gt=0
     ),
 ):
-    query = select(prompts).where(prompts.c.id == prompt_id)
+    query = select(prompt_rows).where(prompt_rows.c.id == prompt_id)
     prompt = await database.fetch_one(query)
     if not prompt:
         raise HTTPException(status_code=404, detail="Prompt not found")
+
+    etag = create_records_etag([prompt], *PROMPT_ETAG_FIELDS)
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+    set_etag_headers(response, etag)
     return create_success_response(prompt, "프롬프트를 성공적으로 조회했습니다.")
 
 
@@ -321,6 +521,7 @@ async def read_prompt(
     },
 )
 async def read_prompts_by_node(
+    request: Request,
     node_name: str = Path(
         ...,
         description="🏷️ 조회할 노드의 이름 (대소문자 구분)",
@@ -328,14 +529,179 @@ async def read_prompts_by_node(
         min_length=1,
         max_length=50,
     ),
+    min_tokens: Optional[int] = Query(None, ge=0, description="전체 토큰 수 하한"),
+    max_tokens: Optional[int] = Query(None, ge=0, description="전체 토큰 수 상한"),
+    sort_by: str = Query("version", pattern="^(version|token_count)$", description="정렬 기준 (내림차순)"),
 ):
+    sort_column = prompt_rows.c.token_count if sort_by == "token_count" else prompt_rows.c.version
     query = (
-        select(prompts)
-        .where(prompts.c.node_name == node_name)
-        .order_by(prompts.c.version.desc())
+        select(prompt_rows)
+        .where(
+            prompt_rows.c.node_name == node_name,
+            *token_count_conditions(prompt_rows, min_tokens, max_tokens),
+        )
+        .order_by(sort_column.desc().nulls_last(), prompt_rows.c.version.desc())
     )
     result = await database.fetch_all(query)
-    return create_success_response(result, "노드의 프롬프트 목록을 성공적으로 조회했습니다.")
+
+    etag = create_records_etag(result, *PROMPT_ETAG_FIELDS)
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+    # 버전이 많은 노드는 응답 변환 비용이 크므로 직접 인코딩하는 경로 사용
+    response = create_fast_success_response(result, "노드의 프롬프트 목록을 성공적으로 조회했습니다.")
+    set_etag_headers(response, etag)
+    return response
+
+
+# 노드의 두 버전 비교
+@router.get(
+    "/node/{node_name}/diff",
+    tags=["📋 4. 조회 및 검색"],
+    summary="🔀 노드의 두 버전 비교",
+    description="""
+두 버전의 내용 차이를 역할별로 계산하여 반환합니다.
+
+- 두 버전이 같은 키프레임을 공유하면 저장된 델타 연산에서 변경 구간을 바로 만들고, 키프레임이 다를 때만 두 내용을 복원해 비교합니다.
+- `prompt`는 줄 단위 변경 구간(`hunks`)으로, `order`는 이전/이후 값으로 표시합니다.
+- 내용 해시가 같으면 `identical`이 `true`이고 변경 구간은 비어 있습니다.
+    """,
+    responses={
+        200: {
+            "description": "버전 비교 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "node_name": "검색노드",
+                            "from_version": 2,
+                            "to_version": 3,
+                            "from_content_hash": "3f1c...",
+                            "to_content_hash": "9ab2...",
+                            "identical": False,
+                            "roles": [
+                                {
+                                    "role": "system",
+                                    "changed": True,
+                                    "order": {"from": 1, "to": 1, "changed": False},
+                                    "prompt": {
+                                        "changed": True,
+                                        "hunks": [
+                                            {
+                                                "op": "replace",
+                                                "from_line": 2,
+                                                "from_count": 1,
+                                                "to_line": 2,
+                                                "to_count": 1,
+                                                "removed": ["간단히 답하세요."],
+                                                "added": ["출처와 함께 답하세요."],
+                                            }
+                                        ],
+                                    },
+                                }
+                            ],
+                        },
+                        "message": "프롬프트 버전 비교가 완료되었습니다.",
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "비교할 버전을 찾을 수 없음",
+            "content": {
+                "application/json": {"example": {"detail": "Prompt versions not found: [4]"}}
+            },
+        },
+    },
+)
+async def diff_prompt_versions(
+    node_name: str = Path(..., description="🏷️ 노드 이름", example="검색노드"),
+    from_version: int = Query(..., alias="from", description="🔢 기준 버전", example=2, ge=1),
+    to_version: int = Query(..., alias="to", description="🔢 비교할 버전", example=3, ge=1),
+):
+    records = await database.fetch_all(
+        select(prompts.c.version, prompts.c.content_hash).where(
+            prompts.c.node_name == node_name,
+            prompts.c.version.in_([from_version, to_version]),
+        )
+    )
+    content_hashes = {record.version: record.content_hash for record in records}
+    missing = sorted({from_version, to_version} - set(content_hashes))
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Prompt versions not found: {missing}")
+
+    from_hash = content_hashes[from_version]
+    to_hash = content_hashes[to_version]
+    return create_success_response(
+        {
+            "node_name": node_name,
+            "from_version": from_version,
+            "to_version": to_version,
+            "from_content_hash": from_hash,
+            "to_content_hash": to_hash,
+            "identical": from_hash == to_hash,
+            "roles": await diff_prompt_blobs(from_hash, to_hash),
+        },
+        "프롬프트 버전 비교가 완료되었습니다.",
+    )
+
+
+# 노드의 프로덕션 프롬프트 조회
+@router.get(
+    "/node/{node_name}/production",
+    tags=["📋 4. 조회 및 검색"],
+    summary="🚀 노드의 프로덕션 프롬프트 조회",
+    description="특정 노드에 현재 배포된 프로덕션 프롬프트를 조회합니다. 서버 메모리 캐시에서 응답합니다.",
+    responses={
+        200: {
+            "description": "프로덕션 프롬프트 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": 3,
+                        "node_name": "검색노드",
+                        "content": {
+                            "system": {"order": 1, "prompt": "최신 검색 어시스턴트"},
+                            "user": {"order": 2, "prompt": None},
+                            "assistant": {"order": None, "prompt": None}
+                        },
+                        "message": "성능 최적화 버전",
+                        "production": True,
+                        "version": 3,
+                        "created_at": "2024-01-03T10:00:00Z",
+                        "updated_at": "2024-01-03T10:00:00Z",
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "프로덕션 프롬프트가 없음",
+            "content": {
+                "application/json": {"example": {"detail": "Production prompt not found"}}
+            },
+        },
+    },
+)
+async def read_production_prompt(
+    request: Request,
+    response: Response,
+    node_name: str = Path(
+        ...,
+        description="🏷️ 조회할 노드의 이름 (대소문자 구분)",
+        example="검색노드",
+        min_length=1,
+        max_length=50,
+    ),
+):
+    prompt = await get_prompt(node_name)
+    if not prompt:
+        raise HTTPException(status_code=404, detail="Production prompt not found")
+
+    etag = create_records_etag([prompt], *PROMPT_ETAG_FIELDS)
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+    set_etag_headers(response, etag)
+    return create_success_response(prompt, "프로덕션 프롬프트를 성공적으로 조회했습니다.")
 
 
 # 프롬프트 수정
@@ -455,14 +821,9 @@ async def update_prompt(
 
     update_data["updated_at"] = datetime.now(timezone.utc)
 
-    update_query = (
-        update(prompts)
-        .where(prompts.c.id == prompt_id)
-        .values(**update_data)
-        .returning(prompts)
-    )
+    updated_prompt = await apply_prompt_update(existing_prompt, update_data)
 
-    updated_prompt = await database.fetch_one(update_query)
+    invalidate_updated_prompt(existing_prompt, update_data)
     return create_success_response(updated_prompt, "프롬프트가 성공적으로 수정되었습니다.")
 
 
@@ -502,7 +863,21 @@ async def delete_prompt(
         raise HTTPException(status_code=404, detail="Prompt not found")
 
     # 프롬프트 삭제
-    await database.execute(delete(prompts).where(prompts.c.id == prompt_id))
+    async with database.transaction():
+        # 생성/수정/배포와 같은 노드 잠금을 사용하여 노드 요약 갱신이 겹치지 않도록 함
+        await database.execute(lock_nodes_query([existing_prompt.node_name]))
+        # 잠금 전에 다른 노드로 이동했거나 삭제된 경우
+        deleted_id = await database.fetch_val(
+            delete(prompts)
+            .where(prompts.c.id == prompt_id, prompts.c.node_name == existing_prompt.node_name)
+            .returning(prompts.c.id)
+        )
+        if deleted_id is None:
+            raise HTTPException(status_code=404, detail="Prompt not found")
+        await refresh_node_summary(existing_prompt.node_name)
+        await notify_prompt_change(existing_prompt.node_name, existing_prompt.version)
+
+    invalidate_prompt_change(existing_prompt.node_name, existing_prompt.version)
 
     return create_success_response({"detail": f"Prompt with id {prompt_id} has been deleted."}, "프롬프트가 성공적으로 삭제되었습니다.")
 
@@ -555,27 +930,371 @@ async def set_production_prompt(
     if not prompt_to_activate:
         raise HTTPException(status_code=404, detail="Prompt not found")
 
-    # 기존 프로덕션 프롬프트 비활성화
-    deactivate_query = (
-        update(prompts)
-        .where(
-            prompts.c.node_name == prompt_to_activate.node_name,
-            prompts.c.production == True,
+    # 노드를 잠근 한 트랜잭션에서 기존 프로덕션 해제와 새 프로덕션 지정을 처리
+    try:
+        released = await release_prompts(
+            [(prompt_to_activate.node_name, prompt_to_activate.version)]
         )
-        .values(production=False)
+    except ReleaseTargetNotFound:
+        # 조회 후 배포 전에 삭제되거나 다른 노드로 이동된 경우
+        raise HTTPException(status_code=404, detail="Prompt not found")
+    activated_prompt = released[0]
+
+    # 이전 프로덕션 버전의 production 값도 바뀌므로 노드 전체 무효화 (알림은 배포 트랜잭션에서 전송)
+    invalidate_prompt_changes([prompt_to_activate.node_name])
+
+    return create_success_response(activated_prompt, "프롬프트가 성공적으로 프로덕션으로 배포되었습니다.")
+
+
+# 여러 노드 프로덕션 일괄 배포
+@router.post(
+    "/releases",
+    tags=["⚙️ 5. 고급 관리"],
+    summary="🚀 여러 노드 프로덕션 일괄 배포",
+    description="여러 노드의 프로덕션 버전을 하나의 트랜잭션으로 전환합니다. 하나라도 찾지 못하면 아무것도 변경하지 않습니다.",
+    responses={
+        200: {
+            "description": "일괄 배포 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": [
+                            {
+                                "id": 3,
+                                "node_name": "검색노드",
+                                "content": {
+                                    "system": {"order": 1, "prompt": "최신 검색 어시스턴트"},
+                                    "user": {"order": 2, "prompt": None},
+                                    "assistant": {"order": None, "prompt": None}
+                                },
+                                "message": "성능 최적화 버전",
+                                "production": True,
+                                "version": 3,
+                                "created_at": 1704276000,
+                                "updated_at": 1704276000,
+                            }
+                        ],
+                        "message": "1개 노드의 프로덕션 프롬프트가 배포되었습니다."
+                    }
+                }
+            },
+        },
+        400: {"description": "배포 목록이 비어 있거나 같은 노드가 중복됨"},
+        404: {"description": "배포할 노드/버전을 찾을 수 없음 (변경 없음)"},
+    },
+)
+async def release_production_prompts(
+    release_request: PromptReleaseRequest = Body(...),
+):
+    """
+    요청한 노드/버전을 모두 프로덕션으로 지정합니다.
+    모든 노드가 함께 전환되거나 하나도 전환되지 않습니다.
+    """
+    targets = [(item.node_name, item.version) for item in release_request.releases]
+    if not targets:
+        raise HTTPException(status_code=400, detail="No releases provided")
+    if len({node_name for node_name, _ in targets}) != len(targets):
+        raise HTTPException(status_code=400, detail="Each node can be released only once per request")
+
+    try:
+        released = await release_prompts(targets)
+    except ReleaseTargetNotFound as e:
+        raise HTTPException(status_code=404, detail=f"Prompts not found: {e}")
+
+    invalidate_prompt_changes(node_name for node_name, _ in targets)
+    return create_success_response(
+        released, f"{len(released)}개 노드의 프로덕션 프롬프트가 배포되었습니다."
     )
-    await database.execute(deactivate_query)
 
-    # 선택된 프롬프트 프로덕션으로 설정
-    activate_query = (
-        update(prompts)
-        .where(prompts.c.id == prompt_id)
-        .values(production=True, updated_at=datetime.now(timezone.utc))
-        .returning(prompts)
+
+# 여러 노드의 프롬프트 일괄 조회
+@router.post(
+    "/production/resolve",
+    tags=["📋 4. 조회 및 검색"],
+    summary="📦 여러 노드의 프롬프트 일괄 조회",
+    description="노드 목록(선택적으로 고정 버전 포함)의 프롬프트를 한 번의 요청으로 조회합니다. 버전을 생략하면 프로덕션 버전을 반환합니다.",
+    responses={
+        200: {
+            "description": "프롬프트 일괄 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "prompts": [
+                                {
+                                    "id": 3,
+                                    "node_name": "검색노드",
+                                    "content": {
+                                        "system": {"order": 1, "prompt": "최신 검색 어시스턴트"},
+                                        "user": {"order": 2, "prompt": None},
+                                        "assistant": {"order": None, "prompt": None}
+                                    },
+                                    "message": "성능 최적화 버전",
+                                    "production": True,
+                                    "version": 3,
+                                    "created_at": 1704276000,
+                                    "updated_at": 1704276000,
+                                }
+                            ],
+                            "missing": [{"node_name": "요약노드", "version": 2}]
+                        },
+                        "message": "프롬프트 1개를 조회했습니다. (누락 1개)"
+                    }
+                }
+            },
+        }
+    },
+)
+async def resolve_production_prompts(
+    resolve_request: PromptResolveRequest = Body(...),
+):
+    """
+    요청한 순서대로 조회된 프롬프트를 반환합니다.
+    찾지 못한 노드/버전은 `missing`에 담깁니다.
+    """
+    keys = [(item.node_name, item.version) for item in resolve_request.nodes]
+    resolved = await resolve_prompts(keys)
+
+    found = []
+    missing = []
+    for node_name, version in dict.fromkeys(keys):
+        record = resolved.get((node_name, version))
+        if record is None:
+            missing.append({"node_name": node_name, "version": version})
+        else:
+            found.append(record)
+
+    missing_message = f" (누락 {len(missing)}개)" if missing else ""
+    return create_fast_success_response(
+        {"prompts": serialize_records(found), "missing": missing},
+        f"프롬프트 {len(found)}개를 조회했습니다.{missing_message}",
     )
-    activated_prompt = await database.fetch_one(activate_query)
 
-    return create_success_response(activated_prompt, "프롬프트가 성공적으로 프로덕션으로 배포되었습니다.")
+
+# 프롬프트 템플릿 일괄 렌더링
+@router.post(
+    "/render",
+    tags=["📋 4. 조회 및 검색"],
+    summary="🧩 프롬프트 템플릿 일괄 렌더링",
+    description="""
+하나의 프롬프트를 여러 변수 세트로 렌더링하여 세트마다 `order` 순서의 메시지 배열을 반환합니다.
+
+- 템플릿의 `{변수}`를 치환하며, `{{변수}}`는 `{변수}` 그대로 출력합니다. 그 외 중괄호는 일반 텍스트입니다.
+- `prompt`가 없는 역할은 메시지에서 제외합니다.
+- 템플릿은 내용 해시 단위로 한 번만 컴파일되어 캐시됩니다.
+- 변수가 빠진 세트가 있으면 400과 함께 세트 번호와 빠진 변수를 반환합니다.
+    """,
+    responses={
+        200: {
+            "description": "렌더링 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "node_name": "검색노드",
+                            "version": 3,
+                            "content_hash": "9ab2...",
+                            "variables": ["question"],
+                            "messages": [
+                                [
+                                    {"role": "system", "content": "검색 어시스턴트입니다."},
+                                    {"role": "user", "content": "파리의 날씨는 어때요?"},
+                                ],
+                                [
+                                    {"role": "system", "content": "검색 어시스턴트입니다."},
+                                    {"role": "user", "content": "서울의 인구는 얼마인가요?"},
+                                ],
+                            ],
+                        },
+                        "message": "변수 세트 2개를 렌더링했습니다.",
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "변수가 빠진 변수 세트가 있음",
+            "content": {
+                "application/json": {
+                    "example": {"detail": {"missing": [{"index": 1, "variables": ["question"]}]}}
+                }
+            },
+        },
+        404: {
+            "description": "프롬프트를 찾을 수 없음",
+            "content": {
+                "application/json": {"example": {"detail": "Prompt not found"}}
+            },
+        },
+    },
+)
+async def render_prompt(
+    render_request: PromptRenderRequest = Body(...),
+):
+    prompt = await get_prompt(render_request.node_name, render_request.version)
+    if not prompt:
+        raise HTTPException(status_code=404, detail="Prompt not found")
+
+    compiled = get_compiled_prompt(prompt.content_hash)
+    if compiled is None:
+        content = json.loads(prompt.content) if isinstance(prompt.content, str) else prompt.content
+        compiled = compile_prompt(prompt.content_hash, content)
+
+    try:
+        messages = compiled.render_many(render_request.variables)
+    except MissingTemplateVariables as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "missing": [
+                    {"index": index, "variables": names} for index, names in e.missing
+                ]
+            },
+        )
+
+    return create_fast_success_response(
+        {
+            "node_name": prompt.node_name,
+            "version": prompt.version,
+            "content_hash": prompt.content_hash,
+            "variables": list(compiled.variables),
+            "messages": messages,
+        },
+        f"변수 세트 {len(messages)}개를 렌더링했습니다.",
+    )
+
+
+# 프로덕션 프롬프트 스냅샷 조회
+@router.get(
+    "/production/snapshot",
+    tags=["⚙️ 5. 고급 관리"],
+    summary="📸 프로덕션 프롬프트 스냅샷",
+    description="모든 노드의 현재 프로덕션 프롬프트를 하나의 JSON 스냅샷으로 내려받습니다. 클라이언트 부팅 시 로컬 파일로 사용할 수 있습니다.",
+    responses={
+        200: {
+            "description": "스냅샷 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "format_version": 1,
+                        "snapshot_id": 42,
+                        "content_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+                        "created_at": 1704276000,
+                        "prompts": {
+                            "검색노드": {
+                                "id": 3,
+                                "version": 3,
+                                "content": {
+                                    "system": {"order": 1, "prompt": "최신 검색 어시스턴트"},
+                                    "user": {"order": 2, "prompt": None},
+                                    "assistant": {"order": None, "prompt": None}
+                                },
+                                "message": "성능 최적화 버전",
+                                "updated_at": 1704276000,
+                            }
+                        },
+                    }
+                }
+            },
+        },
+        304: {"description": "If-None-Match와 스냅샷 해시가 같음"},
+    },
+)
+async def get_production_snapshot(request: Request):
+    """
+    스냅샷 본문을 그대로 반환합니다 (ResponseSchema로 감싸지 않음).
+
+    - `snapshot_id`: 프롬프트가 변경될 때마다 증가하는 리비전 번호
+    - `content_hash`: 프롬프트 내용의 SHA-256. ETag로도 사용됩니다.
+    """
+    snapshot = await build_production_snapshot()
+    etag = f'"{snapshot["content_hash"]}"'
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+
+    response = Response(content=encode_snapshot(snapshot), media_type="application/json")
+    set_etag_headers(response, etag)
+    response.headers["X-Snapshot-Id"] = str(snapshot["snapshot_id"])
+    return response
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 형식으로 변환"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_production_changes(request: Request, node_names: List[str]):
+    """구독한 노드의 프로덕션 프롬프트가 바뀔 때마다 이벤트를 전송하는 제너레이터"""
+    subscription = prompt_change_broker.subscribe(node_names)
+    # 마지막으로 전송한 (id, version, updated_at). 처음 연결 시 모든 노드의 현재 상태를 전송
+    sent = {}
+    pending = set(node_names)
+    try:
+        while True:
+            if pending:
+                resolved = await resolve_prompts((node_name, None) for node_name in pending)
+                for node_name in sorted(pending):
+                    record = resolved.get((node_name, None))
+                    fingerprint = (
+                        (record.id, record.version, record.updated_at) if record else None
+                    )
+                    if node_name in sent and sent[node_name] == fingerprint:
+                        continue
+                    sent[node_name] = fingerprint
+                    yield format_sse(
+                        "production",
+                        {
+                            "node_name": node_name,
+                            "prompt": convert_record_to_dict(record),
+                        },
+                    )
+
+            try:
+                await asyncio.wait_for(
+                    subscription.changed.wait(), timeout=WATCH_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+            pending = subscription.drain()
+    finally:
+        prompt_change_broker.unsubscribe(subscription)
+
+
+# 프로덕션 프롬프트 변경 구독 (SSE)
+@router.get(
+    "/watch",
+    tags=["📋 4. 조회 및 검색"],
+    summary="📡 프로덕션 프롬프트 변경 구독",
+    description="지정한 노드들의 프로덕션 버전이나 내용이 바뀔 때마다 Server-Sent Events로 알림을 받습니다.",
+    responses={
+        200: {
+            "description": "이벤트 스트림",
+            "content": {
+                "text/event-stream": {
+                    "example": 'event: production\ndata: {"node_name": "검색노드", "prompt": {"id": 3, "version": 3, "production": true}}\n\n'
+                }
+            },
+        }
+    },
+)
+async def watch_production_prompts(
+    request: Request,
+    node_names: List[str] = Query(..., description="구독할 노드 이름 목록 (반복 지정)"),
+):
+    """
+    구독을 시작하면 각 노드의 현재 프로덕션 프롬프트를 먼저 전송하고,
+    이후 변경이 있을 때마다 `production` 이벤트를 전송합니다.
+    프로덕션 프롬프트가 없어지면 `prompt`가 null로 전송됩니다.
+    """
+    return StreamingResponse(
+        stream_production_changes(request, node_names),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # 모든 노드 목록 조회
@@ -614,31 +1333,25 @@ async def get_all_nodes():
     각 노드별로 프롬프트 개수, 프로덕션 프롬프트, 최신 버전 정보를 포함합니다.
     """
     try:
-        # 모든 노드 이름과 기본 통계 정보 조회
+        # 쓰기 시 갱신되는 node_summary 테이블에서 한 번에 조회
         query = select(
-            prompts.c.node_name,
-            func.count(prompts.c.id).label('prompt_count'),
-            func.max(prompts.c.version).label('latest_version')
-        ).group_by(prompts.c.node_name).order_by(prompts.c.node_name)
+            node_summary.c.node_name,
+            node_summary.c.prompt_count,
+            node_summary.c.production_prompt_id,
+            node_summary.c.latest_version,
+        ).order_by(node_summary.c.node_name)
         
         nodes_stats = await database.fetch_all(query)
         
-        result = []
-        for node_stat in nodes_stats:
-            # 각 노드의 프로덕션 프롬프트 ID 조회
-            production_query = select(prompts.c.id).where(
-                prompts.c.node_name == node_stat.node_name,
-                prompts.c.production == True
-            )
-            production_prompt = await database.fetch_one(production_query)
-            
-            node_info = {
+        result = [
+            {
                 "node_name": node_stat.node_name,
                 "prompt_count": node_stat.prompt_count,
-                "production_prompt_id": production_prompt.id if production_prompt else None,
+                "production_prompt_id": node_stat.production_prompt_id,
                 "latest_version": node_stat.latest_version
             }
-            result.append(node_info)
+            for node_stat in nodes_stats
+        ]
         
         # 결과를 직접 반환 (이미 딕셔너리 형태이므로 convert 불필요)
         return ResponseSchema(
@@ -690,30 +1403,23 @@ async def get_nodes_summary():
     각 노드별로 프롬프트 개수, 프로덕션 프롬프트, 최신 버전 정보를 포함합니다.
     """
     try:
-        # 모든 노드 이름과 기본 통계 정보 조회
+        # 쓰기 시 갱신되는 node_summary 테이블에서 한 번에 조회
         query = select(
-            prompts.c.node_name,
-            func.count(prompts.c.id).label('prompt_count'),
-            func.max(prompts.c.created_at).label('latest_created_at')
-        ).group_by(prompts.c.node_name).order_by(prompts.c.node_name)
+            node_summary.c.node_name,
+            node_summary.c.prompt_count,
+            node_summary.c.latest_created_at,
+        ).order_by(node_summary.c.node_name)
         
         nodes_stats = await database.fetch_all(query)
         
-        result = []
-        for node_stat in nodes_stats:
-            # 각 노드의 프로덕션 프롬프트 ID 조회
-            production_query = select(prompts.c.id).where(
-                prompts.c.node_name == node_stat.node_name,
-                prompts.c.production == True
-            )
-            production_prompt = await database.fetch_one(production_query)
-            
-            node_info = {
+        result = [
+            {
                 "node_name": node_stat.node_name,
                 "prompt_count": node_stat.prompt_count,
                 "latest_created_at": int(node_stat.latest_created_at.timestamp()) if node_stat.latest_created_at else None
             }
-            result.append(node_info)
+            for node_stat in nodes_stats
+        ]
         
         # 결과를 직접 반환 (이미 딕셔너리 형태이므로 convert 불필요)
         return ResponseSchema(
@@ -746,12 +1452,87 @@ async def count_prompts_by_node_name(
         ..., description="🏷️ 개수를 조회할 노드 이름", example="검색노드"
     ),
 ):
-    query = select(prompts).where(prompts.c.node_name == node_name)
-    result = await database.fetch_all(query)
-    count = len(result)
+    count = await get_node_prompt_count(node_name)
     return create_success_response({"node_name": node_name, "count": count}, "프롬프트 개수를 성공적으로 조회했습니다.")
 
 
+# 노드별 프롬프트 통계 조회
+@router.get(
+    "/stats",
+    tags=["📋 4. 조회 및 검색"],
+    summary="📊 노드별 프롬프트 통계",
+    description="노드별 프롬프트 개수, 최신 버전, 프로덕션 버전과 전체 합계를 한 번의 쿼리로 조회합니다.",
+    responses={
+        200: {
+            "description": "프롬프트 통계 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "total_nodes": 2,
+                            "total_prompts": 7,
+                            "nodes": [
+                                {
+                                    "node_name": "검색노드",
+                                    "prompt_count": 5,
+                                    "latest_version": 5,
+                                    "production_version": 3,
+                                    "production_prompt_id": 3,
+                                    "latest_created_at": 1704276000
+                                },
+                                {
+                                    "node_name": "요약노드",
+                                    "prompt_count": 2,
+                                    "latest_version": 2,
+                                    "production_version": None,
+                                    "production_prompt_id": None,
+                                    "latest_created_at": 1704190000
+                                }
+                            ]
+                        },
+                        "message": "프롬프트 통계를 성공적으로 조회했습니다."
+                    }
+                }
+            },
+        }
+    },
+)
+async def get_prompt_stats(
+    node_name: List[str] = Query(None, description="통계를 조회할 노드 (여러 번 지정 가능, 생략 시 전체)"),
+):
+    """
+    node_summary와 프로덕션 프롬프트를 조인한 단일 쿼리로 노드별 통계를 반환합니다.
+    프롬프트 행이나 content를 읽지 않으므로 노드와 버전 수가 많아도 비용이 일정합니다.
+    """
+    query = (
+        select(
+            node_summary.c.node_name,
+            node_summary.c.prompt_count,
+            node_summary.c.latest_version,
+            prompts.c.version.label("production_version"),
+            node_summary.c.production_prompt_id,
+            node_summary.c.latest_created_at,
+        )
+        .select_from(
+            node_summary.outerjoin(prompts, prompts.c.id == node_summary.c.production_prompt_id)
+        )
+        .order_by(node_summary.c.node_name)
+    )
+    if node_name:
+        query = query.where(node_summary.c.node_name.in_(node_name))
+
+    nodes = serialize_records(await database.fetch_all(query))
+    return create_fast_success_response(
+        {
+            "total_nodes": len(nodes),
+            "total_prompts": sum(node["prompt_count"] for node in nodes),
+            "nodes": nodes,
+        },
+        "프롬프트 통계를 성공적으로 조회했습니다.",
+    )
+
+
 @router.delete(
     "/delete-all/{node_name}",
     tags=["⚙️ 5. 고급 관리"],
@@ -776,7 +1557,13 @@ async def delete_prompts_by_node_name(
     ),
 ):
     query = delete(prompts).where(prompts.c.node_name == node_name)
-    result = await database.execute(query)
+    async with database.transaction():
+        await database.execute(lock_nodes_query([node_name]))
+        await database.execute(query)
+        await refresh_node_summary(node_name)
+        await notify_prompt_change(node_name)
+
+    invalidate_prompt_change(node_name)
     return create_success_response({"detail": f"All prompts with node_name '{node_name}' deleted."}, "노드의 모든 프롬프트가 성공적으로 삭제되었습니다.")
 
 
@@ -817,15 +1604,19 @@ async def delete_prompts_by_node_name(
     },
 )
 async def read_prompt_by_version(
+    request: Request,
+    response: Response,
     node_name: str = Path(..., description="🏷️ 노드 이름", example="검색노드"),
     version: int = Path(..., description="🔢 조회할 버전 번호", example=2, ge=1),
 ):
-    query = select(prompts).where(
-        prompts.c.node_name == node_name, prompts.c.version == version
-    )
-    prompt = await database.fetch_one(query)
+    prompt = await get_prompt(node_name, version)
     if not prompt:
         raise HTTPException(status_code=404, detail="Prompt version not found")
+
+    etag = create_records_etag([prompt], *PROMPT_ETAG_FIELDS)
+    if is_not_modified(request, etag):
+        return create_not_modified_response(etag)
+    set_etag_headers(response, etag)
     return create_success_response(prompt, "특정 버전의 프롬프트를 성공적으로 조회했습니다.")
 
 
@@ -865,23 +1656,29 @@ async def delete_prompt_by_version(
         ..., description="🔢 삭제할 프롬프트의 버전 번호", example=3, ge=1
     ),
 ):
-    # 프롬프트 존재 여부 확인
     query = select(prompts).where(
         prompts.c.node_name == node_name, prompts.c.version == version
     )
-    existing_prompt = await database.fetch_one(query)
-
-    if not existing_prompt:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Prompt with node '{node_name}' and version '{version}' not found.",
-        )
-
-    # 프롬프트 삭제 수행
     delete_query = delete(prompts).where(
         prompts.c.node_name == node_name, prompts.c.version == version
     )
-    await database.execute(delete_query)
+    async with database.transaction():
+        await database.execute(lock_nodes_query([node_name]))
+
+        # 프롬프트 존재 여부 확인 (잠금 안에서 확인하여 동시 삭제/수정과 겹치지 않도록 함)
+        existing_prompt = await database.fetch_one(query)
+        if not existing_prompt:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Prompt with node '{node_name}' and version '{version}' not found.",
+            )
+
+        # 프롬프트 삭제 수행
+        await database.execute(delete_query)
+        await refresh_node_summary(node_name)
+        await notify_prompt_change(node_name, version)
+
+    invalidate_prompt_change(node_name, version)
 
     return create_success_response({
         "detail": f"Prompt with node '{node_name}' and version '{version}' has been deleted."
@@ -982,12 +1779,7 @@ async def update_prompt_by_version(
     update_data["updated_at"] = datetime.now(timezone.utc)
 
     # 프롬프트 수정 수행
-    update_query = (
-        update(prompts)
-        .where(prompts.c.node_name == node_name, prompts.c.version == version)
-        .values(**update_data)
-        .returning(prompts)
-    )
+    updated_prompt = await apply_prompt_update(existing_prompt, update_data)
 
-    updated_prompt = await database.fetch_one(update_query)
+    invalidate_updated_prompt(existing_prompt, update_data)
     return create_success_response(updated_prompt, "특정 버전의 프롬프트가 성공적으로 수정되었습니다.")
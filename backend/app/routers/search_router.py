@@ -0,0 +1,208 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List
+from app.database import database
+from app.models.prompt_model import (
+    PROMPT_BLOB_SEARCH_COLUMNS,
+    prompt_blobs,
+    prompt_message_search_vector,
+    prompts,
+)
+from app.models.dataset_model import (
+    DATASET_METADATA_COLUMNS,
+    DATASET_SEARCH_COLUMNS,
+    dataset_search_vector,
+    datasets,
+)
+from app.utils.response_utils import create_fast_success_response
+from app.utils.search_utils import highlight, search_terms, text_match, text_rank
+
+from sqlalchemy import func, select, union
+
+router = APIRouter(prefix="/search", tags=["📋 4. 조회 및 검색"])
+
+SEARCH_SCOPES = ("prompts", "datasets")
+
+
+def prompt_search_query(term: str, limit: int, production_only: bool):
+    """
+    내용(blob)이나 변경 메시지가 일치하는 프롬프트 버전을 순위순으로 조회하는 쿼리.
+    blob과 메시지는 각각의 GIN 인덱스로 후보를 찾아 합친 뒤 후보에 대해서만 순위를 계산합니다.
+    """
+    message_columns = (prompts.c.message,)
+    matched_blobs = select(prompt_blobs.c.content_hash).where(
+        text_match(prompt_blobs.c.search_vector, PROMPT_BLOB_SEARCH_COLUMNS, term)
+    )
+    candidates = union(
+        select(prompts.c.id).where(prompts.c.content_hash.in_(matched_blobs)),
+        select(prompts.c.id).where(text_match(prompt_message_search_vector, message_columns, term)),
+    )
+    # 긴 본문은 저장된 tsvector 순위만 사용 (부분 일치로만 찾은 본문은 메시지 순위와 최신순으로 정렬)
+    rank = func.greatest(
+        text_rank(prompt_blobs.c.search_vector, term),
+        text_rank(prompt_message_search_vector, term, message_columns),
+    )
+
+    query = (
+        select(
+            prompts.c.id,
+            prompts.c.node_name,
+            prompts.c.version,
+            prompts.c.production,
+            prompts.c.message,
+            prompts.c.content_hash,
+            prompt_blobs.c.system_text,
+            prompt_blobs.c.user_text,
+            rank.label("rank"),
+        )
+        .select_from(prompts.join(prompt_blobs, prompts.c.content_hash == prompt_blobs.c.content_hash))
+        .where(prompts.c.id.in_(candidates))
+        .order_by(rank.desc(), prompts.c.id.desc())
+        .limit(limit)
+    )
+    if production_only:
+        query = query.where(prompts.c.production == True)
+    return query
+
+
+def dataset_search_query(term: str, limit: int):
+    """이름이나 설명이 일치하는 데이터셋을 순위순으로 조회하는 쿼리 (CSV 본문은 조회하지 않음)"""
+    rank = text_rank(dataset_search_vector, term, DATASET_SEARCH_COLUMNS)
+    return (
+        select(*DATASET_METADATA_COLUMNS, rank.label("rank"))
+        .where(text_match(dataset_search_vector, DATASET_SEARCH_COLUMNS, term))
+        .order_by(rank.desc(), datasets.c.id.desc())
+        .limit(limit)
+    )
+
+
+def highlights(terms: List[str], **fields) -> dict:
+    """일치하는 필드만 하이라이트 조각으로 반환"""
+    result = {}
+    for name, value in fields.items():
+        fragment = highlight(value, terms)
+        if fragment is not None:
+            result[name] = fragment
+    return result
+
+
+# 프롬프트/데이터셋 통합 검색
+@router.get(
+    "/",
+    summary="🔍 프롬프트/데이터셋 통합 검색",
+    description="""
+프롬프트 내용(system, user), 변경 메시지, 데이터셋 이름과 설명을 검색하여 순위순으로 반환합니다.
+
+- 단어 단위 전문 검색(tsvector)과 부분 일치(pg_trgm 트라이그램)를 함께 사용하며, 모두 인덱스로 처리됩니다.
+- 검색어는 웹 검색 문법을 따릅니다: `"구문 검색"`, `or`, `-제외어`.
+- 결과마다 `rank`와 일치 부분을 `<mark>`로 감싼 `highlights`를 포함합니다 (HTML 이스케이프됨).
+- 부분 일치는 3자 이상일 때 인덱스를 사용하므로 짧은 검색어는 단어 단위로만 찾는 것이 빠릅니다.
+    """,
+    responses={
+        200: {
+            "description": "검색 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "data": {
+                            "query": "날씨",
+                            "prompts": [
+                                {
+                                    "id": 12,
+                                    "node_name": "검색노드",
+                                    "version": 3,
+                                    "production": True,
+                                    "message": "날씨 질문 대응 개선",
+                                    "content_hash": "9ab2...",
+                                    "rank": 0.6,
+                                    "highlights": {
+                                        "user": "파리의 <mark>날씨</mark>는 어때요?",
+                                        "message": "<mark>날씨</mark> 질문 대응 개선",
+                                    },
+                                }
+                            ],
+                            "datasets": [
+                                {
+                                    "id": 4,
+                                    "name": "weather_qa",
+                                    "description": "날씨 질의응답 평가셋",
+                                    "row_count": 120,
+                                    "byte_size": 48213,
+                                    "created_at": 1750064190,
+                                    "rank": 0.4,
+                                    "highlights": {"description": "<mark>날씨</mark> 질의응답 평가셋"},
+                                }
+                            ],
+                        },
+                        "message": "검색 결과 2개를 찾았습니다.",
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "잘못된 검색 범위",
+            "content": {
+                "application/json": {"example": {"detail": "Unknown search scope: ['nodes']"}}
+            },
+        },
+    },
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    scope: List[str] = Query(list(SEARCH_SCOPES), description="검색 대상 (prompts, datasets)"),
+    limit: int = Query(20, ge=1, le=100, description="대상별 최대 결과 수"),
+    production_only: bool = Query(False, description="프로덕션 프롬프트만 검색"),
+):
+    term = q.strip()
+    if not term:
+        raise HTTPException(status_code=400, detail="Search query is empty.")
+    unknown = sorted(set(scope) - set(SEARCH_SCOPES))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search scope: {unknown}")
+
+    terms = search_terms(term)
+    data = {"query": term}
+    found = 0
+
+    if "prompts" in scope:
+        records = await database.fetch_all(prompt_search_query(term, limit, production_only))
+        data["prompts"] = [
+            {
+                "id": record.id,
+                "node_name": record.node_name,
+                "version": record.version,
+                "production": record.production,
+                "message": record.message,
+                "content_hash": record.content_hash,
+                "rank": record.rank,
+                "highlights": highlights(
+                    terms,
+                    system=record.system_text,
+                    user=record.user_text,
+                    message=record.message,
+                ),
+            }
+            for record in records
+        ]
+        found += len(records)
+
+    if "datasets" in scope:
+        records = await database.fetch_all(dataset_search_query(term, limit))
+        data["datasets"] = [
+            {
+                "id": record.id,
+                "name": record.name,
+                "description": record.description,
+                "row_count": record.row_count,
+                "byte_size": record.byte_size,
+                "created_at": record.created_at,
+                "rank": record.rank,
+                "highlights": highlights(
+                    terms, name=record.name, description=record.description
+                ),
+            }
+            for record in records
+        ]
+        found += len(records)
+
+    return create_fast_success_response(data, f"검색 결과 {found}개를 찾았습니다.")
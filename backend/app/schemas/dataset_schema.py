@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 # 데이터셋 생성 시 사용하는 스키마
@@ -13,6 +13,10 @@ class DatasetCreate(BaseModel):
 # 데이터셋 조회 및 반환 시 사용하는 스키마
 class DatasetRead(DatasetCreate):
     id: int
+    row_count: Optional[int] = None
+    byte_size: Optional[int] = None
+    column_names: Optional[List[str]] = None
+    content_sha256: Optional[str] = None
     created_at: datetime
 
     class Config:
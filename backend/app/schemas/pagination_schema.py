@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Generic, TypeVar, List, Any
+from typing import Generic, TypeVar, List, Any, Optional
 from math import ceil
 
 T = TypeVar("T")
@@ -8,6 +8,9 @@ class PaginationParams(BaseModel):
     """페이지네이션 요청 파라미터"""
     page: int = Field(default=1, ge=1, description="페이지 번호 (1부터 시작)")
     size: int = Field(default=10, ge=1, le=100, description="페이지당 항목 수 (1-100)")
+    cursor: Optional[str] = Field(default=None, description="이전 응답의 next_cursor. 지정하면 page 대신 커서 위치부터 조회")
+    include_total: bool = Field(default=True, description="전체 항목 수 조회 여부 (false면 COUNT 쿼리 생략)")
+    estimate_total: bool = Field(default=False, description="정확한 COUNT 대신 통계 기반 추정치 사용")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """페이지네이션 응답 스키마"""
@@ -20,26 +23,61 @@ class PaginationData(BaseModel, Generic[T]):
     items: List[T]
     page: int = Field(description="현재 페이지 번호")
     size: int = Field(description="페이지당 항목 수")
-    total: int = Field(description="전체 항목 수")
-    total_pages: int = Field(description="전체 페이지 수")
+    total: Optional[int] = Field(description="전체 항목 수 (include_total=false면 null, total_estimated=true면 추정치)")
+    total_pages: Optional[int] = Field(description="전체 페이지 수 (include_total=false면 null, total_estimated=true면 추정치)")
+    total_estimated: bool = Field(default=False, description="total과 total_pages가 통계 기반 추정치인지 여부 (estimate_total=true)")
     has_next: bool = Field(description="다음 페이지 존재 여부")
     has_prev: bool = Field(description="이전 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+
+def pagination_fields(
+    page: int,
+    size: int,
+    total: Optional[int],
+    next_cursor: Optional[str] = None,
+    cursor_mode: bool = False,
+    total_estimated: bool = False
+) -> dict:
+    """
+    PaginationData의 items를 제외한 필드 계산.
+    next_cursor는 한 행을 더 조회하여 정한 값이므로 항상 정확하며,
+    has_next는 정확한 전체 개수가 있는 page 조회에서만 page 번호로 판단합니다.
+    """
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = ceil(total / size) if total > 0 else 1
+
+    return {
+        "page": page,
+        "size": size,
+        "total": total,
+        "total_pages": total_pages,
+        "total_estimated": total_estimated and total is not None,
+        # 커서 조회, 전체 개수가 없거나 추정치일 때는 page 번호 대신 다음 커서 존재 여부로 판단
+        "has_next": (
+            next_cursor is not None
+            if cursor_mode or total is None or total_estimated
+            else page < total_pages
+        ),
+        "has_prev": True if cursor_mode else page > 1,
+        "next_cursor": next_cursor,
+    }
 
 def create_pagination_data(
     items: List[Any], 
     page: int, 
     size: int, 
-    total: int
+    total: Optional[int],
+    next_cursor: Optional[str] = None,
+    cursor_mode: bool = False,
+    total_estimated: bool = False
 ) -> PaginationData:
     """페이지네이션 데이터 생성"""
-    total_pages = ceil(total / size) if total > 0 else 1
-    
     return PaginationData(
         items=items,
-        page=page,
-        size=size,
-        total=total,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1
+        **pagination_fields(
+            page, size, total,
+            next_cursor=next_cursor, cursor_mode=cursor_mode, total_estimated=total_estimated
+        )
     ) 
\ No newline at end of file
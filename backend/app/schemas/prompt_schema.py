@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class MessageContent(BaseModel):
@@ -42,6 +42,14 @@ class PromptCreate(BaseModel):
 class PromptRead(BaseModel):
     id: int
     production: bool
+    content_hash: Optional[str] = None  # 내용의 SHA-256 (같으면 내용이 동일한 버전)
+    token_count_system: Optional[int] = None
+    token_count_user: Optional[int] = None
+    token_count_assistant: Optional[int] = None
+    token_count: Optional[int] = None  # 역할별 토큰 수 합계 (저장 시 계산)
+    content_bytes: Optional[int] = None
+    tokenizer: Optional[str] = None  # 토큰 수를 계산한 토크나이저
+    template_variables: Optional[List[str]] = None  # 렌더링에 필요한 변수 이름 (저장 시 추출)
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -54,3 +62,58 @@ class PromptUpdate(BaseModel):
     content: Optional[PromptContent] = None
     message: Optional[str] = None
     production: Optional[bool] = None
+
+
+class PromptResolveItem(BaseModel):
+    node_name: str
+    version: Optional[int] = None  # 생략 시 프로덕션 버전
+
+
+class PromptResolveRequest(BaseModel):
+    nodes: List[PromptResolveItem]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "nodes": [
+                    {"node_name": "검색노드"},
+                    {"node_name": "요약노드", "version": 2},
+                ]
+            }
+        }
+
+
+class PromptReleaseItem(BaseModel):
+    node_name: str
+    version: int  # 프로덕션으로 지정할 버전
+
+
+class PromptReleaseRequest(BaseModel):
+    releases: List[PromptReleaseItem]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "releases": [
+                    {"node_name": "검색노드", "version": 3},
+                    {"node_name": "요약노드", "version": 2},
+                ]
+            }
+        }
+
+
+class PromptRenderRequest(BaseModel):
+    node_name: str
+    version: Optional[int] = None  # 생략 시 프로덕션 버전
+    variables: List[Dict[str, Any]] = Field(..., min_length=1, max_length=1000)  # 렌더링할 변수 세트 목록
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "node_name": "검색노드",
+                "variables": [
+                    {"question": "파리의 날씨는 어때요?"},
+                    {"question": "서울의 인구는 얼마인가요?"},
+                ],
+            }
+        }
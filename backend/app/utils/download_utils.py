@@ -0,0 +1,100 @@
+import re
+import zlib
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import Request
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성이며, 없으면 gzip 또는 무압축으로 응답
+    zstandard = None
+
+# 지원하는 응답 압축 방식 (서버 선호 순)
+SUPPORTED_ENCODINGS = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(ValueError):
+    """요청한 범위가 파일 크기를 벗어남 (416)"""
+
+
+def negotiate_encoding(request: Request) -> Optional[str]:
+    """Accept-Encoding에서 q>0으로 허용된 방식 중 서버 선호 순으로 첫 번째 (없으면 None)"""
+    header = request.headers.get("accept-encoding")
+    if not header:
+        return None
+
+    accepted = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위 Range 헤더를 (시작, 끝) 포함 범위로 변환합니다.
+    헤더가 없거나 해석할 수 없거나 여러 범위면 None (전체 응답),
+    파일 크기를 벗어나면 RangeNotSatisfiable을 발생시킵니다.
+    """
+    if not header:
+        return None
+    match = RANGE_PATTERN.match(header.strip().replace(" ", ""))
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # 마지막 N바이트 (bytes=-N)
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or (last and end < start):
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def if_range_matches(request: Request, etag: str) -> bool:
+    """If-Range가 없거나 현재 ETag와 같으면 True (다르면 범위 대신 전체를 보내야 함)"""
+    if_range = request.headers.get("if-range")
+    return not if_range or if_range.strip() == etag
+
+
+async def compress_stream(chunks: AsyncIterator[bytes], encoding: Optional[str]) -> AsyncIterator[bytes]:
+    """바이트 조각 스트림을 조각 단위로 압축 (압축기 상태만 유지하므로 메모리 사용량이 일정)"""
+    if encoding is None:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    if encoding == "zstd":
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
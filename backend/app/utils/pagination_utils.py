@@ -0,0 +1,152 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Table, and_, or_, tuple_
+from sqlalchemy.sql import ColumnElement
+
+from app.schemas.pagination_schema import PaginationParams
+from app.utils.response_utils import (
+    get_total_count_with_filter,
+    get_estimated_count,
+    get_estimated_count_with_filter,
+)
+
+
+def encode_cursor(record: Any) -> str:
+    """레코드의 (created_at, id)로 불투명 커서 생성"""
+    created_at = record.created_at.isoformat() if record.created_at else None
+    raw = json.dumps([created_at, record.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """커서를 (created_at, id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            int(record_id),
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def encode_sort_cursor(value: Any, record_id: int) -> str:
+    """정렬 컬럼 값과 id로 불투명 커서 생성 (created_at 이외의 정렬용)"""
+    raw = json.dumps([value, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sort_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, record_id = json.loads(base64.urlsafe_b64decode(padded))
+        return value, int(record_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def keyset_condition(table: Table, cursor: str):
+    """(created_at DESC, id DESC) 정렬에서 커서 다음 행들을 고르는 조건"""
+    created_at, record_id = decode_cursor(cursor)
+    if created_at is None:
+        # DESC 정렬에서 NULL은 맨 앞에 오므로, 남은 NULL 행과 NULL이 아닌 모든 행이 대상
+        return or_(
+            and_(table.c.created_at.is_(None), table.c.id < record_id),
+            table.c.created_at.isnot(None),
+        )
+    return tuple_(table.c.created_at, table.c.id) < tuple_(created_at, record_id)
+
+
+async def fetch_total(
+    database, base_query, table: Table, pagination: PaginationParams
+) -> Optional[int]:
+    """
+    요청 옵션에 따라 전체 항목 수를 조회합니다.
+    include_total=false면 None, estimate_total=true면 통계 기반 추정치를 반환합니다.
+    """
+    if not pagination.include_total:
+        return None
+    if pagination.estimate_total:
+        if base_query.whereclause is None:
+            return await get_estimated_count(database, table)
+        return await get_estimated_count_with_filter(database, base_query)
+    return await get_total_count_with_filter(database, base_query)
+
+
+def page_query(base_query, table: Table, pagination: PaginationParams):
+    """fetch_page가 실행하는 쿼리 (다음 페이지 확인용으로 한 행을 더 조회)"""
+    query = base_query.order_by(table.c.created_at.desc(), table.c.id.desc())
+    if pagination.cursor:
+        query = query.where(keyset_condition(table, pagination.cursor))
+    else:
+        query = query.offset((pagination.page - 1) * pagination.size)
+    return query.limit(pagination.size + 1)
+
+
+async def fetch_page(
+    database, base_query, table: Table, pagination: PaginationParams
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    최신 생성순으로 한 페이지를 조회합니다.
+    cursor가 있으면 OFFSET 없이 커서 다음부터 조회하므로 깊은 페이지도 첫 페이지와 비용이 같습니다.
+    한 행을 더 조회하여 다음 페이지가 있을 때만 next_cursor를 반환합니다.
+    """
+    items = await database.fetch_all(page_query(base_query, table, pagination))
+    if len(items) <= pagination.size:
+        return items, None
+
+    items = items[: pagination.size]
+    return items, encode_cursor(items[-1])
+
+
+def sorted_page_query(
+    base_query,
+    table: Table,
+    pagination: PaginationParams,
+    sort_column: ColumnElement,
+    ascending: bool = False,
+):
+    """fetch_sorted_page가 실행하는 쿼리 (다음 페이지 확인용으로 한 행을 더 조회)"""
+    if ascending:
+        order_by = (sort_column.asc(), table.c.id.asc())
+    else:
+        order_by = (sort_column.desc(), table.c.id.desc())
+    query = base_query.where(sort_column.isnot(None)).order_by(*order_by)
+
+    if pagination.cursor:
+        value, record_id = decode_sort_cursor(pagination.cursor)
+        position = tuple_(sort_column, table.c.id)
+        if ascending:
+            query = query.where(position > tuple_(value, record_id))
+        else:
+            query = query.where(position < tuple_(value, record_id))
+    else:
+        query = query.offset((pagination.page - 1) * pagination.size)
+    return query.limit(pagination.size + 1)
+
+
+async def fetch_sorted_page(
+    database,
+    base_query,
+    table: Table,
+    pagination: PaginationParams,
+    sort_column: ColumnElement,
+    ascending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (sort_column, id) 순서로 한 페이지를 조회합니다. fetch_page와 같이 커서가 있으면 키셋으로 조회합니다.
+    정렬 값이 NULL인 행은 제외하며, sort_column은 결과 행에 같은 이름의 컬럼으로 포함되어야 합니다.
+    """
+    items = await database.fetch_all(
+        sorted_page_query(base_query, table, pagination, sort_column, ascending)
+    )
+    if len(items) <= pagination.size:
+        return items, None
+
+    items = items[: pagination.size]
+    last = items[-1]
+    return items, encode_sort_cursor(getattr(last, sort_column.name), last.id)
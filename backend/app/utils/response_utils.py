@@ -1,8 +1,15 @@
-from typing import Any, List, Union, Dict
+from typing import Any, List, Union, Dict, Optional
 from app.schemas.response_schema import ResponseSchema
-from app.schemas.pagination_schema import PaginatedResponse, PaginationData, create_pagination_data
+from app.schemas.pagination_schema import PaginatedResponse, PaginationData, create_pagination_data, pagination_fields
+from app.utils.serialization_utils import FastJSONResponse, serialize_records
 from datetime import datetime
 from sqlalchemy import func, select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
+from fastapi import Request
+from fastapi.responses import Response
+import hashlib
+import json
 
 
 def convert_record_to_dict(record: Any) -> Dict[str, Any]:
@@ -41,6 +48,23 @@ def create_success_response(data: Any, message: str = "요청이 성공적으로
     )
 
 
+def create_fast_success_response(
+    data: Any, message: str = "요청이 성공적으로 처리되었습니다."
+) -> FastJSONResponse:
+    """
+    성공 응답을 pydantic 검증 없이 바로 JSON 바이트로 인코딩 (레코드 목록 응답용).
+    본문 형식은 create_success_response와 같습니다.
+    """
+    if isinstance(data, list):
+        converted_data = serialize_records(data)
+    elif hasattr(data, '_mapping'):  # Database record
+        converted_data = serialize_records([data])[0]
+    else:
+        converted_data = data
+
+    return FastJSONResponse({"status": "success", "data": converted_data, "message": message})
+
+
 def create_error_response(message: str, data: Any = None) -> ResponseSchema:
     """에러 응답 ResponseSchema 생성"""
     return ResponseSchema(
@@ -54,27 +78,38 @@ def create_paginated_response(
     items: List[Any], 
     page: int, 
     size: int, 
-    total: int,
-    message: str = "페이지네이션 조회가 성공적으로 완료되었습니다."
-) -> PaginatedResponse:
-    """페이지네이션 응답 생성"""
-    # 아이템들을 딕셔너리로 변환
-    converted_items = []
-    for item in items:
-        if isinstance(item, list):
-            converted_items.extend(convert_records_to_list(item))
-        elif hasattr(item, '_mapping'):  # Database record
-            converted_items.append(convert_record_to_dict(item))
-        else:
-            converted_items.append(item)
-    
-    pagination_data = create_pagination_data(converted_items, page, size, total)
-    
-    return PaginatedResponse(
-        status="success",
-        data=pagination_data,
-        message=message
-    )
+    total: Optional[int],
+    message: str = "페이지네이션 조회가 성공적으로 완료되었습니다.",
+    next_cursor: str = None,
+    cursor_mode: bool = False,
+    total_estimated: bool = False
+) -> FastJSONResponse:
+    """
+    페이지네이션 응답 생성.
+    본문은 PaginatedResponse 형식이며, 레코드는 컬럼별 변환 함수로 한 번에 변환한 뒤
+    pydantic 검증 없이 바로 JSON 바이트로 인코딩합니다.
+    """
+    if all(hasattr(item, '_mapping') for item in items):
+        converted_items = serialize_records(items)
+    else:
+        # 아이템들을 딕셔너리로 변환
+        converted_items = []
+        for item in items:
+            if isinstance(item, list):
+                converted_items.extend(serialize_records(item))
+            elif hasattr(item, '_mapping'):  # Database record
+                converted_items.extend(serialize_records([item]))
+            else:
+                converted_items.append(item)
+
+    data = {
+        "items": converted_items,
+        **pagination_fields(
+            page, size, total,
+            next_cursor=next_cursor, cursor_mode=cursor_mode, total_estimated=total_estimated
+        ),
+    }
+    return FastJSONResponse({"status": "success", "data": data, "message": message})
 
 
 async def get_total_count(database, table) -> int:
@@ -86,7 +121,89 @@ async def get_total_count(database, table) -> int:
 
 async def get_total_count_with_filter(database, query) -> int:
     """필터가 적용된 쿼리의 전체 레코드 수 조회"""
-    # 기존 쿼리에서 SELECT 부분만 COUNT로 변경
-    count_query = select(func.count()).select_from(query.alias())
+    if query._group_by_clauses or query._distinct or query._limit_clause is not None or query._offset_clause is not None:
+        # 집계/중복 제거/범위가 있으면 결과 행 수를 세야 하므로 서브쿼리로 감쌈
+        count_query = select(func.count()).select_from(query.alias())
+    else:
+        # 같은 FROM/WHERE로 COUNT(*)만 조회 (컬럼을 읽지 않으므로 인덱스 전용 스캔 가능)
+        count_query = query.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
     result = await database.fetch_one(count_query)
-    return result[0] if result else 0 
\ No newline at end of file
+    return result[0] if result else 0
+
+
+async def get_estimated_count(database, table) -> int:
+    """pg_class 통계(reltuples)로 테이블 전체 레코드 수 추정 (통계가 없으면 정확한 개수 조회)"""
+    result = await database.fetch_one(
+        "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass(:table_name)",
+        {"table_name": table.name},
+    )
+    # ANALYZE 전에는 reltuples가 -1(PG14 이상) 또는 0
+    if not result or result["estimate"] <= 0:
+        return await get_total_count(database, table)
+    return result["estimate"]
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <쿼리> 구문 (실행 중인 DB 드라이버의 방언으로 컴파일)"""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(ExplainJSON)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def get_estimated_count_with_filter(database, query) -> int:
+    """필터가 적용된 쿼리의 레코드 수를 실행 계획의 예상 행 수로 추정"""
+    result = await database.fetch_one(ExplainJSON(query))
+    plan = result[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def create_etag(*parts: Any) -> str:
+    """구성 요소(id, 버전, 수정 시각, 해시 등)로 강한 ETag 생성"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, datetime):
+            part = part.isoformat()
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def create_records_etag(records: List[Any], *fields: str) -> str:
+    """레코드 목록의 지정 필드들로 ETag 생성"""
+    parts = [len(records)]
+    for record in records:
+        parts.extend(getattr(record, field) for field in fields)
+    return create_etag(*parts)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인 (약한 비교)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """ETag와 재검증용 Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def create_not_modified_response(etag: str) -> Response:
+    """304 Not Modified 응답 생성"""
+    response = Response(status_code=304)
+    set_etag_headers(response, etag)
+    return response
@@ -0,0 +1,109 @@
+import html
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, or_, text
+
+# 전문 검색 설정. 한국어 사전이 없으므로 공백/기호 기준으로만 나누는 simple 사용
+# 인덱스 식과 조회 식이 같아야 인덱스를 사용하므로 상수는 바인드 파라미터 대신 리터럴로 둠
+SEARCH_CONFIG = text("'simple'::regconfig")
+
+# 하이라이트 조각 앞뒤로 보여줄 글자 수와 최대 조각 수
+HIGHLIGHT_CONTEXT = 40
+HIGHLIGHT_MAX_FRAGMENTS = 2
+
+
+def weighted_vector(column, weight: str):
+    """컬럼의 tsvector에 가중치(A~D)를 붙인 식"""
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(column, text("''"))),
+        text(f"'{weight}'"),
+    )
+
+
+def search_vector(*weighted_columns):
+    """(컬럼, 가중치) 목록을 합친 tsvector 식 (GIN 인덱스 식과 검색 조건에 같이 사용)"""
+    vectors = [weighted_vector(column, weight) for column, weight in weighted_columns]
+    combined = vectors[0]
+    for vector in vectors[1:]:
+        combined = combined.op("||")(vector)
+    return combined
+
+
+def search_query(term: str):
+    """검색어를 tsquery로 변환 (따옴표 구문, OR, -제외 지원)"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, term)
+
+
+def contains_pattern(term: str) -> str:
+    """ILIKE 부분 일치 패턴 (%, _는 문자 그대로 검색). 3자 이상이면 트라이그램 인덱스 사용"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def text_match(vector, columns, term: str):
+    """전문 검색 일치 또는 컬럼 중 하나에 부분 일치 (조사가 붙는 한국어 등 단어 단위로 안 맞는 경우)"""
+    pattern = contains_pattern(term)
+    return or_(
+        vector.op("@@")(search_query(term)),
+        *(column.ilike(pattern, escape="\\") for column in columns),
+    )
+
+
+def text_rank(vector, term: str, similarity_columns=()):
+    """
+    전문 검색 순위와 트라이그램 단어 유사도 중 큰 값.
+    유사도는 행마다 텍스트 전체를 훑으므로 이름, 메시지 같은 짧은 컬럼에만 사용합니다.
+    """
+    rank = func.ts_rank_cd(vector, search_query(term))
+    if not similarity_columns:
+        return rank
+    return func.greatest(
+        rank,
+        *(func.coalesce(func.word_similarity(term, column), 0) for column in similarity_columns),
+    )
+
+
+def search_terms(term: str) -> List[str]:
+    """하이라이트할 검색어 목록 (websearch 문법의 따옴표, 제외어, or 제거)"""
+    terms = []
+    for word in re.findall(r'"([^"]+)"|(\S+)', term):
+        text = word[0] or word[1]
+        if text.lower() == "or" or text.startswith("-"):
+            continue
+        text = text.strip('"')
+        if text:
+            terms.append(text)
+    return terms
+
+
+def highlight(text: Optional[str], terms: List[str]) -> Optional[str]:
+    """
+    검색어가 나오는 부분을 <mark>로 감싼 조각을 만듭니다 (일치가 없으면 None).
+    조각은 HTML 이스케이프되어 있으므로 그대로 렌더링할 수 있습니다.
+    """
+    if not text or not terms:
+        return None
+
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    matches = list(pattern.finditer(text))
+    if not matches:
+        return None
+
+    fragments = []
+    last_end = -1
+    for match in matches:
+        if len(fragments) >= HIGHLIGHT_MAX_FRAGMENTS:
+            break
+        if match.start() < last_end:
+            continue
+        start = max(0, last_end, match.start() - HIGHLIGHT_CONTEXT)
+        end = min(len(text), match.end() + HIGHLIGHT_CONTEXT)
+        window = text[start:end]
+        marked = pattern.sub(lambda found: f"\0{found.group(0)}\1", window)
+        escaped = html.escape(marked).replace("\0", "<mark>").replace("\1", "</mark>")
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        fragments.append(f"{prefix}{escaped}{suffix}")
+        last_end = end
+    return " ".join(fragments)
@@ -0,0 +1,127 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+import json
+
+from fastapi.responses import Response
+from sqlalchemy.types import DateTime
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성이며, 없으면 표준 json으로 같은 결과를 만듦
+    orjson = None
+
+# (키, 원본 행에서의 인덱스, 값 변환 함수)
+ColumnConverter = Tuple[str, int, Optional[Callable[[Any], Any]]]
+
+
+def _to_timestamp(value: Any) -> Any:
+    return int(value.timestamp()) if value is not None else None
+
+
+def _json_default(value: Any) -> Any:
+    """네이티브로 인코딩되지 않는 값 처리 (기존 응답과 같이 datetime은 유닉스 타임스탬프)"""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def dumps(value: Any) -> bytes:
+        """응답 본문 인코딩 (datetime도 default로 넘겨 타임스탬프로 통일)"""
+        return orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+
+else:
+
+    def dumps(value: Any) -> bytes:
+        """응답 본문 인코딩 (datetime도 default로 넘겨 타임스탬프로 통일)"""
+        return json.dumps(
+            value, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def _processed(processor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """databases 레코드와 같은 조건으로 SQLAlchemy 결과 처리기 적용 (Enum 등)"""
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, (int, str, float)):
+            return processor(value)
+        return value
+
+    return convert
+
+
+def build_column_converters(record: Any) -> Optional[List[ColumnConverter]]:
+    """
+    레코드의 결과 컬럼 타입으로 컬럼별 변환 함수를 한 번만 계산합니다.
+    값은 databases 레코드 접근(getattr)과 convert_record_to_dict를 거친 결과와 같습니다.
+    databases 레코드가 아니면(컬럼 정보 없음) None을 반환합니다.
+    """
+    column_map = getattr(record, "_column_map", None)
+    if not column_map:
+        return None
+
+    dialect = record._dialect
+    converters = []
+    for key, (index, datatype) in column_map.items():
+        if not isinstance(key, str):
+            continue
+        if isinstance(datatype, DateTime):
+            converter = _to_timestamp
+        else:
+            processor = datatype._cached_result_processor(dialect, None)
+            converter = _processed(processor) if processor is not None else None
+        converters.append((key, index, converter))
+    return converters
+
+
+def serialize_records(records: List[Any]) -> List[Dict[str, Any]]:
+    """
+    레코드 목록을 JSON 인코딩 가능한 딕셔너리 목록으로 변환합니다.
+    컬럼별 변환 함수를 첫 행에서 한 번 계산하고, 각 행은 원본 asyncpg 행에서 인덱스로 바로 읽습니다.
+    """
+    if not records:
+        return []
+
+    converters = build_column_converters(records[0])
+    if converters is None:
+        # datetime 등은 dumps의 default에서 처리됨
+        return [
+            {key: getattr(record, key) for key in record._mapping.keys()}
+            for record in records
+        ]
+
+    rows = []
+    for record in records:
+        row = record._mapping
+        rows.append(
+            {
+                key: row[index] if converter is None else converter(row[index])
+                for key, index, converter in converters
+            }
+        )
+    return rows
+
+
+class FastJSONResponse(Response):
+    """pydantic 검증 없이 미리 변환된 데이터를 바로 바이트로 인코딩하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -17,8 +18,16 @@ if config.config_file_name is not None:
 # add your model's MetaData object here
 # for 'autogenerate' support
 from app.database import metadata
+# 모델 모듈을 import 해야 테이블/인덱스/시퀀스가 metadata에 등록됨
+from app.models import dataset_model, evaluation_result_model, node_summary_model, prompt_model  # noqa: F401
 target_metadata = metadata
 
+# 앱과 같은 DATABASE_URL 환경변수가 있으면 alembic.ini 값 대신 사용 (동기 드라이버로 변환)
+if os.getenv("DATABASE_URL"):
+    config.set_main_option(
+        "sqlalchemy.url", os.environ["DATABASE_URL"].replace("+asyncpg", "")
+    )
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
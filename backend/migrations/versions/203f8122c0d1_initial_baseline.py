@@ -20,13 +20,82 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    # 기존 DB는 앱 시작 시 create_all로 만들어진 뒤 이 리비전으로 stamp 되었으므로
+    # 테이블이 이미 있으면 건너뛰고, 빈 DB에서만 초기 스키마를 생성합니다.
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "datasets" not in existing_tables:
+        op.create_table(
+            "datasets",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("description", sa.String(length=255), nullable=True),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_datasets_id", "datasets", ["id"])
+
+    if "prompts" not in existing_tables:
+        op.create_table(
+            "prompts",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("node_name", sa.String(length=50), nullable=False),
+            sa.Column("content", sa.JSON(), nullable=False),
+            sa.Column("message", sa.String(length=255), nullable=True),
+            sa.Column("production", sa.Boolean(), nullable=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_prompts_id", "prompts", ["id"])
+
+    if "evaluation_requests" not in existing_tables:
+        op.create_table(
+            "evaluation_requests",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("node_name", sa.String(length=50), nullable=False),
+            sa.Column("version", sa.String(length=20), nullable=False),
+            sa.Column("dataset_id", sa.Integer(), nullable=False),
+            sa.Column("metrics", sa.String(length=500), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "RUNNING", "COMPLETED", "FAILED", name="evaluationstatus"),
+                nullable=True,
+            ),
+            sa.Column("callback_url", sa.String(length=255), nullable=True),
+            sa.Column("error_message", sa.String(length=1000), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_evaluation_requests_id", "evaluation_requests", ["id"])
+
+    if "evaluation_results" not in existing_tables:
+        op.create_table(
+            "evaluation_results",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("evaluation_request_id", sa.String(length=36), nullable=True),
+            sa.Column("prompt_id", sa.Integer(), nullable=False),
+            sa.Column("dataset_id", sa.Integer(), nullable=False),
+            sa.Column("metric_name", sa.String(length=100), nullable=False),
+            sa.Column("score", sa.Float(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"]),
+            sa.ForeignKeyConstraint(["evaluation_request_id"], ["evaluation_requests.id"]),
+            sa.ForeignKeyConstraint(["prompt_id"], ["prompts.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_evaluation_results_id", "evaluation_results", ["id"])
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.drop_table("evaluation_results")
+    op.drop_table("evaluation_requests")
+    op.drop_table("prompts")
+    op.drop_table("datasets")
+    sa.Enum(name="evaluationstatus").drop(op.get_bind(), checkfirst=True)
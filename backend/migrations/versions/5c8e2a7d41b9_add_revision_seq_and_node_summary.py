@@ -0,0 +1,66 @@
+"""Add prompt revision sequence and node summary table
+
+Revision ID: 5c8e2a7d41b9
+Revises: 203f8122c0d1
+Create Date: 2026-10-18 10:12:31.504218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e2a7d41b9'
+down_revision: Union[str, None] = '203f8122c0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 앱이 create_all로 먼저 만들었을 수 있으므로 없을 때만 생성
+    op.execute("CREATE SEQUENCE IF NOT EXISTS prompt_revision_seq")
+
+    if "node_summary" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "node_summary",
+            sa.Column("node_name", sa.String(length=50), nullable=False),
+            sa.Column("prompt_count", sa.Integer(), nullable=False),
+            sa.Column("latest_version", sa.Integer(), nullable=True),
+            sa.Column("production_prompt_id", sa.Integer(), nullable=True),
+            sa.Column("latest_created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("node_name"),
+        )
+
+    # 기존 프롬프트로 요약 채우기 (앱 시작 시 rebuild_node_summaries와 같은 집계)
+    op.execute(
+        """
+        INSERT INTO node_summary (
+            node_name, prompt_count, latest_version,
+            production_prompt_id, latest_created_at, updated_at
+        )
+        SELECT
+            node_name,
+            count(id),
+            max(version),
+            max(id) FILTER (WHERE production),
+            max(created_at),
+            now()
+        FROM prompts
+        GROUP BY node_name
+        ON CONFLICT (node_name) DO UPDATE SET
+            prompt_count = excluded.prompt_count,
+            latest_version = excluded.latest_version,
+            production_prompt_id = excluded.production_prompt_id,
+            latest_created_at = excluded.latest_created_at,
+            updated_at = excluded.updated_at
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("node_summary")
+    op.execute("DROP SEQUENCE IF EXISTS prompt_revision_seq")
@@ -0,0 +1,107 @@
+"""Add indexes for prompt, evaluation and pagination query patterns
+
+Revision ID: 9a4f1d6b3e27
+Revises: 5c8e2a7d41b9
+Create Date: 2026-10-18 10:27:05.118934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f1d6b3e27'
+down_revision: Union[str, None] = '5c8e2a7d41b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (이름, 테이블, 컬럼, 추가 옵션)
+INDEXES = [
+    ("uq_prompts_node_name_version", "prompts", ["node_name", "version"], {"unique": True}),
+    (
+        "uq_prompts_node_name_production",
+        "prompts",
+        ["node_name"],
+        {"unique": True, "postgresql_where": sa.text("production = true")},
+    ),
+    ("ix_prompts_created_at_id", "prompts", ["created_at", "id"], {}),
+    ("ix_datasets_name", "datasets", ["name"], {}),
+    ("ix_datasets_created_at_id", "datasets", ["created_at", "id"], {}),
+    ("ix_evaluation_requests_status_created_at", "evaluation_requests", ["status", "created_at"], {}),
+    ("ix_evaluation_requests_created_at_id", "evaluation_requests", ["created_at", "id"], {}),
+    (
+        "ix_evaluation_results_prompt_dataset_metric_created_at",
+        "evaluation_results",
+        ["prompt_id", "dataset_id", "metric_name", "created_at"],
+        {},
+    ),
+    ("ix_evaluation_results_evaluation_request_id", "evaluation_results", ["evaluation_request_id"], {}),
+    ("ix_evaluation_results_created_at_id", "evaluation_results", ["created_at", "id"], {}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # (node_name, version) 중복은 어느 쪽을 남길지 자동으로 정할 수 없으므로 중단
+    duplicates = bind.execute(
+        sa.text(
+            """
+            SELECT node_name, version, count(*) AS copies
+            FROM prompts
+            GROUP BY node_name, version
+            HAVING count(*) > 1
+            ORDER BY node_name, version
+            """
+        )
+    ).fetchall()
+    if duplicates:
+        listed = ", ".join(f"{row.node_name} v{row.version} ({row.copies}개)" for row in duplicates)
+        raise RuntimeError(
+            f"중복된 (node_name, version) 프롬프트가 있어 유니크 인덱스를 만들 수 없습니다: {listed}"
+        )
+
+    # 노드에 프로덕션 프롬프트가 여러 개면 가장 높은 버전만 남김
+    op.execute(
+        """
+        UPDATE prompts AS p
+        SET production = false
+        WHERE p.production
+          AND EXISTS (
+              SELECT 1 FROM prompts AS q
+              WHERE q.node_name = p.node_name
+                AND q.production
+                AND q.version > p.version
+          )
+        """
+    )
+    # 프로덕션 변경이 있었을 수 있으므로 요약도 다시 맞춤
+    op.execute(
+        """
+        UPDATE node_summary AS s
+        SET production_prompt_id = p.id
+        FROM prompts AS p
+        WHERE p.node_name = s.node_name AND p.production
+        """
+    )
+
+    # 대용량 테이블에서 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행해야 함)
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
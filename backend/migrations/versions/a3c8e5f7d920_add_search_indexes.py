@@ -0,0 +1,96 @@
+"""Add full-text and trigram search indexes for prompts and datasets
+
+Revision ID: a3c8e5f7d920
+Revises: f2a7d9c1b5e3
+Create Date: 2026-10-18 16:58:42.507316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c8e5f7d920'
+down_revision: Union[str, None] = 'f2a7d9c1b5e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def weighted_vector(column: str, weight: str) -> str:
+    # app.utils.search_utils.weighted_vector와 같은 식이어야 조회 시 인덱스를 사용함
+    return f"setweight(to_tsvector('simple'::regconfig, coalesce({column}, '')), '{weight}')"
+
+
+PROMPT_BLOB_SEARCH_VECTOR = f"{weighted_vector('system_text', 'A')} || {weighted_vector('user_text', 'B')}"
+
+# (이름, CREATE INDEX 본문)
+INDEXES = [
+    ("ix_prompt_blobs_search_vector", "prompt_blobs USING gin (search_vector)"),
+    ("ix_prompt_blobs_system_text_trgm", "prompt_blobs USING gin (system_text gin_trgm_ops)"),
+    ("ix_prompt_blobs_user_text_trgm", "prompt_blobs USING gin (user_text gin_trgm_ops)"),
+    ("ix_prompts_content_hash", "prompts (content_hash)"),
+    ("ix_prompts_message_search_vector", f"prompts USING gin (({weighted_vector('message', 'A')}))"),
+    ("ix_prompts_message_trgm", "prompts USING gin (message gin_trgm_ops)"),
+    (
+        "ix_datasets_search_vector",
+        f"datasets USING gin (({weighted_vector('name', 'A')} || {weighted_vector('description', 'B')}))",
+    ),
+    ("ix_datasets_name_trgm", "datasets USING gin (name gin_trgm_ops)"),
+    ("ix_datasets_description_trgm", "datasets USING gin (description gin_trgm_ops)"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("prompt_blobs")}
+    # 앱 시작 시 create_all이 새 스키마로 테이블을 먼저 만들었을 수 있음
+    if "system_text" not in columns:
+        op.add_column("prompt_blobs", sa.Column("system_text", sa.Text(), nullable=True))
+        op.add_column("prompt_blobs", sa.Column("user_text", sa.Text(), nullable=True))
+
+    # 컬럼이 create_all로 이미 있어도 이전 마이그레이션이 옮긴 blob은 텍스트가 비어 있으므로 항상 채움
+    # 델타 blob은 키프레임에 적용한 내용에서 텍스트를 추출
+    op.execute(
+        """
+        UPDATE prompt_blobs AS b
+        SET system_text = resolved.content -> 'system' ->> 'prompt',
+            user_text = resolved.content -> 'user' ->> 'prompt'
+        FROM (
+            SELECT blob.content_hash,
+                   coalesce(blob.content, prompt_apply_delta(keyframe.content, blob.delta)) AS content
+            FROM prompt_blobs AS blob
+            LEFT JOIN prompt_blobs AS keyframe ON keyframe.content_hash = blob.base_hash
+            WHERE blob.system_text IS NULL AND blob.user_text IS NULL
+        ) AS resolved
+        WHERE resolved.content_hash = b.content_hash
+        """
+    )
+
+    if "search_vector" not in columns:
+        op.add_column(
+            "prompt_blobs",
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(PROMPT_BLOB_SEARCH_VECTOR, persisted=True),
+            ),
+        )
+
+    # 대용량 테이블에서 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행해야 함)
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.drop_column("prompt_blobs", "search_vector")
+    op.drop_column("prompt_blobs", "user_text")
+    op.drop_column("prompt_blobs", "system_text")
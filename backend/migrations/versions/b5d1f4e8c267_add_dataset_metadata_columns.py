@@ -0,0 +1,49 @@
+"""Add precomputed CSV metadata columns to datasets
+
+Revision ID: b5d1f4e8c267
+Revises: a3c8e5f7d920
+Create Date: 2026-10-18 17:21:09.184523
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1f4e8c267'
+down_revision: Union[str, None] = 'a3c8e5f7d920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    sa.Column("row_count", sa.Integer(), nullable=True),
+    sa.Column("byte_size", sa.BigInteger(), nullable=True),
+    sa.Column("column_names", sa.JSON(), nullable=True),
+    sa.Column("content_sha256", sa.String(length=64), nullable=True),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("datasets")}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column("datasets", column)
+
+    # 크기와 해시는 SQL로 바로 계산 (ETag가 바로 새 해시를 사용하도록)
+    op.execute(
+        """
+        UPDATE datasets
+        SET byte_size = octet_length(content),
+            content_sha256 = encode(sha256(convert_to(content, 'UTF8')), 'hex')
+        WHERE content_sha256 IS NULL
+        """
+    )
+    # 행 수와 컬럼 이름은 CSV 파싱이 필요하므로 scripts/backfill_dataset_metadata.py로 채움
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(COLUMNS):
+        op.drop_column("datasets", column.name)
@@ -0,0 +1,31 @@
+"""Add extracted template variables to prompt_blobs
+
+Revision ID: b9e2d4a7c361
+Revises: e4b8c2f6a193
+Create Date: 2026-10-18 21:05:42.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e2d4a7c361'
+down_revision: Union[str, None] = 'e4b8c2f6a193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("prompt_blobs")}
+    if "template_variables" not in existing:
+        op.add_column("prompt_blobs", sa.Column("template_variables", sa.JSON(), nullable=True))
+
+    # 기존 blob의 변수는 scripts/backfill_template_variables.py로 채움 (템플릿 파서가 앱 코드에 있음)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("prompt_blobs", "template_variables")
@@ -0,0 +1,128 @@
+"""Move prompt content to content-addressed prompt_blobs
+
+Revision ID: c47e9b2f8a15
+Revises: 9a4f1d6b3e27
+Create Date: 2026-10-18 11:02:47.390512
+
+"""
+from typing import Sequence, Union
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e9b2f8a15'
+down_revision: Union[str, None] = '9a4f1d6b3e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 한 번에 해시를 계산할 프롬프트 수
+BATCH_SIZE = 500
+
+
+def compute_content_hash(content) -> str:
+    # app.core.prompt_blobs.compute_content_hash와 같은 정규화 (마이그레이션은 앱 코드에 의존하지 않음)
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def move_content_to_blobs(bind) -> None:
+    """기존 prompts.content를 prompt_blobs로 옮기고 content_hash를 채움"""
+    # 기존 내용을 정규화 해시로 blob에 옮김 (같은 내용은 한 번만 저장)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, content::text AS content, created_at FROM prompts "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+
+        blobs = {}
+        assignments = []
+        for row in rows:
+            content = json.loads(row.content)
+            content_hash = compute_content_hash(content)
+            blobs.setdefault(content_hash, (content, row.created_at))
+            assignments.append({"id": row.id, "content_hash": content_hash})
+
+        bind.execute(
+            sa.text(
+                "INSERT INTO prompt_blobs (content_hash, content, created_at) "
+                "VALUES (:content_hash, CAST(:content AS json), :created_at) "
+                "ON CONFLICT (content_hash) DO NOTHING"
+            ),
+            [
+                {
+                    "content_hash": content_hash,
+                    "content": json.dumps(content, ensure_ascii=False),
+                    "created_at": created_at,
+                }
+                for content_hash, (content, created_at) in blobs.items()
+            ],
+        )
+        bind.execute(
+            sa.text("UPDATE prompts SET content_hash = :content_hash WHERE id = :id"),
+            assignments,
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # 앱 시작 시 create_all이 먼저 만들었을 수 있음
+    if "prompt_blobs" not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            "prompt_blobs",
+            sa.Column("content_hash", sa.String(length=64), nullable=False),
+            sa.Column("content", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("content_hash"),
+        )
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("prompts")}
+    if "content_hash" not in columns:
+        op.add_column("prompts", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+    # create_all로 만든 새 스키마에는 옮길 content 컬럼이 없음
+    if "content" in columns:
+        move_content_to_blobs(bind)
+        op.alter_column("prompts", "content_hash", nullable=False)
+        op.drop_column("prompts", "content")
+
+    foreign_keys = {foreign_key["name"] for foreign_key in inspector.get_foreign_keys("prompts")}
+    if "prompts_content_hash_fkey" not in foreign_keys:
+        op.create_foreign_key(
+            "prompts_content_hash_fkey",
+            "prompts",
+            "prompt_blobs",
+            ["content_hash"],
+            ["content_hash"],
+        )
+    op.create_index(
+        "ix_prompts_node_name_content_hash",
+        "prompts",
+        ["node_name", "content_hash"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("prompts", sa.Column("content", sa.JSON(), nullable=True))
+    op.execute(
+        "UPDATE prompts SET content = prompt_blobs.content "
+        "FROM prompt_blobs WHERE prompt_blobs.content_hash = prompts.content_hash"
+    )
+    op.alter_column("prompts", "content", nullable=False)
+    op.drop_index("ix_prompts_node_name_content_hash", table_name="prompts")
+    op.drop_constraint("prompts_content_hash_fkey", "prompts", type_="foreignkey")
+    op.drop_column("prompts", "content_hash")
+    op.drop_table("prompt_blobs")
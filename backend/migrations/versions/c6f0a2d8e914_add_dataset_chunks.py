@@ -0,0 +1,55 @@
+"""Store uploaded dataset files as ordered chunks
+
+Revision ID: c6f0a2d8e914
+Revises: b5d1f4e8c267
+Create Date: 2026-10-18 17:48:33.902174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f0a2d8e914'
+down_revision: Union[str, None] = 'b5d1f4e8c267'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 앱 시작 시 create_all이 새 스키마로 테이블을 먼저 만들었을 수 있음
+    if not sa.inspect(op.get_bind()).has_table("dataset_chunks"):
+        op.create_table(
+            "dataset_chunks",
+            sa.Column("dataset_id", sa.Integer(), nullable=False),
+            sa.Column("chunk_index", sa.Integer(), nullable=False),
+            sa.Column("byte_offset", sa.BigInteger(), nullable=False),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("dataset_id", "chunk_index"),
+        )
+
+    # 이후 업로드는 content 대신 dataset_chunks에 저장 (기존 데이터셋은 그대로 둠)
+    op.alter_column("datasets", "content", existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 조각으로 저장된 데이터셋은 content로 합친 뒤 NOT NULL 복원
+    op.execute(
+        """
+        UPDATE datasets AS d
+        SET content = convert_from(chunks.data, 'UTF8')
+        FROM (
+            SELECT dataset_id, string_agg(data, ''::bytea ORDER BY chunk_index) AS data
+            FROM dataset_chunks
+            GROUP BY dataset_id
+        ) AS chunks
+        WHERE chunks.dataset_id = d.id AND d.content IS NULL
+        """
+    )
+    op.execute("UPDATE datasets SET content = '' WHERE content IS NULL")
+    op.alter_column("datasets", "content", existing_type=sa.Text(), nullable=False)
+    op.drop_table("dataset_chunks")
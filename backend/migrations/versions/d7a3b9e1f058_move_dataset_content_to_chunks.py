@@ -0,0 +1,59 @@
+"""Move CSV content of earlier uploads into dataset_chunks
+
+Revision ID: d7a3b9e1f058
+Revises: c6f0a2d8e914
+Create Date: 2026-10-18 18:12:47.551806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3b9e1f058'
+down_revision: Union[str, None] = 'c6f0a2d8e914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.core.dataset_content.DATASET_CHUNK_SIZE와 같은 값
+CHUNK_SIZE = 1024 * 1024
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 다운로드와 범위 요청이 모두 조각을 읽도록 이전 업로드도 같은 크기로 나누어 옮김
+    # (UTF-8 변환은 데이터셋마다 한 번만 하도록 MATERIALIZED CTE 사용)
+    op.execute(
+        f"""
+        WITH legacy AS MATERIALIZED (
+            SELECT d.id, convert_to(d.content, 'UTF8') AS bytes
+            FROM datasets AS d
+            WHERE d.content IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM dataset_chunks AS c WHERE c.dataset_id = d.id)
+        )
+        INSERT INTO dataset_chunks (dataset_id, chunk_index, byte_offset, data)
+        SELECT legacy.id,
+               part.chunk_index,
+               part.chunk_index::bigint * {CHUNK_SIZE},
+               substring(legacy.bytes FROM part.chunk_index * {CHUNK_SIZE} + 1 FOR {CHUNK_SIZE})
+        FROM legacy
+        CROSS JOIN LATERAL generate_series(
+            0, greatest(ceil(octet_length(legacy.bytes) / {CHUNK_SIZE}.0)::int - 1, 0)
+        ) AS part(chunk_index)
+        """
+    )
+    op.execute(
+        """
+        UPDATE datasets AS d
+        SET content = NULL
+        WHERE d.content IS NOT NULL
+          AND EXISTS (SELECT 1 FROM dataset_chunks AS c WHERE c.dataset_id = d.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 조각은 그대로 두어도 dataset_content로 읽을 수 있으며,
+    # c6f0a2d8e914 downgrade에서 content로 다시 합침
+    pass
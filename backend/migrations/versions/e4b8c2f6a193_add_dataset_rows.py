@@ -0,0 +1,39 @@
+"""Add dataset_rows for row-level dataset access
+
+Revision ID: e4b8c2f6a193
+Revises: d7a3b9e1f058
+Create Date: 2026-10-18 18:40:15.230648
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c2f6a193'
+down_revision: Union[str, None] = 'd7a3b9e1f058'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 앱 시작 시 create_all이 새 스키마로 테이블을 먼저 만들었을 수 있음
+    if not sa.inspect(op.get_bind()).has_table("dataset_rows"):
+        op.create_table(
+            "dataset_rows",
+            sa.Column("dataset_id", sa.Integer(), nullable=False),
+            sa.Column("row_index", sa.Integer(), nullable=False),
+            sa.Column("data", postgresql.JSONB(), nullable=False),
+            sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("dataset_id", "row_index"),
+        )
+
+    # 기존 데이터셋의 행은 scripts/backfill_dataset_rows.py로 채움 (CSV 파싱이 앱 코드에 있음)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("dataset_rows")
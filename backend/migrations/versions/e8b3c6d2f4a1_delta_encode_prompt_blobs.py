@@ -0,0 +1,91 @@
+"""Store prompt blobs as deltas against keyframes
+
+Revision ID: e8b3c6d2f4a1
+Revises: c47e9b2f8a15
+Create Date: 2026-10-18 14:21:09.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c6d2f4a1'
+down_revision: Union[str, None] = 'c47e9b2f8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.prompt_model.PROMPT_APPLY_DELTA_FUNCTION과 같은 정의 (마이그레이션은 앱 코드에 의존하지 않음)
+PROMPT_APPLY_DELTA_FUNCTION = """
+CREATE OR REPLACE FUNCTION prompt_apply_delta(keyframe json, delta json) RETURNS json
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT json_object_agg(
+        role.key,
+        json_build_object(
+            'order', role.value -> 'order',
+            'prompt', CASE
+                WHEN json_typeof(role.value -> 'prompt') = 'array' THEN (
+                    SELECT to_json(coalesce(string_agg(
+                        CASE
+                            WHEN json_typeof(op.value) = 'string' THEN op.value #>> '{}'
+                            ELSE substr(
+                                keyframe -> role.key ->> 'prompt',
+                                (op.value ->> 0)::int + 1,
+                                (op.value ->> 1)::int
+                            )
+                        END,
+                        '' ORDER BY op.ordinality
+                    ), ''))
+                    FROM json_array_elements(role.value -> 'prompt') WITH ORDINALITY AS op(value, ordinality)
+                )
+                ELSE role.value -> 'prompt'
+            END
+        )
+        ORDER BY role.ordinality
+    )
+    FROM json_each(delta) WITH ORDINALITY AS role(key, value, ordinality)
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    columns = {column["name"] for column in sa.inspect(bind).get_columns("prompt_blobs")}
+
+    # 앱 시작 시 create_all이 새 스키마로 테이블을 먼저 만들었을 수 있음
+    if "base_hash" not in columns:
+        op.add_column(
+            "prompt_blobs",
+            sa.Column(
+                "base_hash",
+                sa.String(length=64),
+                sa.ForeignKey("prompt_blobs.content_hash", name="prompt_blobs_base_hash_fkey"),
+                nullable=True,
+            ),
+        )
+    if "delta" not in columns:
+        op.add_column("prompt_blobs", sa.Column("delta", sa.JSON(), nullable=True))
+    op.alter_column("prompt_blobs", "content", nullable=True)
+    op.create_index(
+        "ix_prompt_blobs_base_hash", "prompt_blobs", ["base_hash"], if_not_exists=True
+    )
+    op.execute(PROMPT_APPLY_DELTA_FUNCTION)
+
+    # 기존 blob은 모두 키프레임으로 남음. 델타로 다시 저장하려면 scripts/compact_prompt_blobs.py 실행
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 델타 blob을 전체 내용으로 되돌린 뒤 컬럼 제거
+    op.execute(
+        "UPDATE prompt_blobs SET content = prompt_apply_delta(keyframes.content, prompt_blobs.delta) "
+        "FROM prompt_blobs AS keyframes "
+        "WHERE prompt_blobs.content IS NULL AND keyframes.content_hash = prompt_blobs.base_hash"
+    )
+    op.alter_column("prompt_blobs", "content", nullable=False)
+    op.drop_index("ix_prompt_blobs_base_hash", table_name="prompt_blobs")
+    op.drop_column("prompt_blobs", "delta")
+    op.drop_column("prompt_blobs", "base_hash")
+    op.execute("DROP FUNCTION IF EXISTS prompt_apply_delta(json, json)")
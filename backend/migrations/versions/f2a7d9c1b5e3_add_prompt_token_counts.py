@@ -0,0 +1,46 @@
+"""Add precomputed token counts and size to prompts
+
+Revision ID: f2a7d9c1b5e3
+Revises: e8b3c6d2f4a1
+Create Date: 2026-10-18 15:40:26.731950
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a7d9c1b5e3'
+down_revision: Union[str, None] = 'e8b3c6d2f4a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    sa.Column("token_count_system", sa.Integer(), nullable=True),
+    sa.Column("token_count_user", sa.Integer(), nullable=True),
+    sa.Column("token_count_assistant", sa.Integer(), nullable=True),
+    sa.Column("token_count", sa.Integer(), nullable=True),
+    sa.Column("content_bytes", sa.Integer(), nullable=True),
+    sa.Column("tokenizer", sa.String(length=50), nullable=True),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("prompts")}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column("prompts", column)
+    op.create_index(
+        "ix_prompts_token_count_id", "prompts", ["token_count", "id"], if_not_exists=True
+    )
+
+    # 기존 버전의 토큰 수는 scripts/backfill_prompt_tokens.py로 채움 (토크나이저가 앱 코드에 있음)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_prompts_token_count_id", table_name="prompts")
+    for column in reversed(COLUMNS):
+        op.drop_column("prompts", column.name)
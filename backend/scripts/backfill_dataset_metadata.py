@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+데이터셋의 행 수, 크기, 컬럼 이름, 해시를 채우는 스크립트
+
+메타데이터 컬럼 추가 이전에 업로드된 데이터셋의 CSV를 한 건씩 읽어 계산합니다.
+content는 바꾸지 않으므로 updated_at은 유지합니다.
+`alembic upgrade head` 이후 실행하며, 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/backfill_dataset_metadata.py
+"""
+
+import asyncio
+import sys
+import os
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import or_, select, update
+
+from app.core.dataset_content import dataset_content_metadata
+from app.database import database
+from app.models.dataset_model import dataset_content, datasets
+
+
+async def backfill_dataset_metadata() -> int:
+    """메타데이터가 비어 있는 데이터셋을 모두 갱신하고 갱신한 행 수를 반환"""
+    pending = await database.fetch_all(
+        select(datasets.c.id)
+        .where(or_(datasets.c.row_count.is_(None), datasets.c.column_names.is_(None)))
+        .order_by(datasets.c.id)
+    )
+
+    updated = 0
+    for dataset in pending:
+        # CSV 본문이 클 수 있으므로 한 번에 하나씩만 읽음
+        record = await database.fetch_one(
+            select(dataset_content.label("content")).where(datasets.c.id == dataset.id)
+        )
+        if record is None:
+            continue
+        await database.execute(
+            update(datasets)
+            .where(datasets.c.id == dataset.id)
+            .values(**dataset_content_metadata(record.content), updated_at=datasets.c.updated_at)
+        )
+        updated += 1
+        print(f"   데이터셋 {dataset.id} 갱신 ({updated}/{len(pending)})")
+
+    return updated
+
+
+async def main():
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        updated = await backfill_dataset_metadata()
+        print(f"✅ 데이터셋 메타데이터 채우기 완료: {updated}개")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+기존 데이터셋의 데이터 행을 dataset_rows에 채우는 스크립트
+
+행 테이블 추가 이전에 업로드된 데이터셋의 저장된 조각을 다시 파싱하여 COPY로 적재합니다.
+데이터셋마다 한 트랜잭션으로 처리하며, 행이 이미 있는 데이터셋은 건너뜁니다.
+`alembic upgrade head` 이후 실행하며, 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/backfill_dataset_rows.py [데이터셋 ID ...]
+"""
+
+import asyncio
+import sys
+import os
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import exists, or_, select
+
+from app.core.dataset_content import rebuild_dataset_rows
+from app.database import database
+from app.models.dataset_model import dataset_rows, datasets
+
+
+async def backfill_dataset_rows(dataset_ids) -> int:
+    """행이 없는 데이터셋(또는 지정한 데이터셋)의 행을 채우고 처리한 데이터셋 수를 반환"""
+    query = select(datasets.c.id).order_by(datasets.c.id)
+    if dataset_ids:
+        query = query.where(datasets.c.id.in_(dataset_ids))
+    else:
+        query = query.where(
+            # 행 수를 아직 채우지 않은 데이터셋도 대상
+            or_(datasets.c.row_count.is_(None), datasets.c.row_count > 0),
+            ~exists().where(dataset_rows.c.dataset_id == datasets.c.id),
+        )
+    pending = await database.fetch_all(query)
+
+    for position, dataset in enumerate(pending, start=1):
+        async with database.transaction():
+            row_count = await rebuild_dataset_rows(dataset.id)
+        print(f"   데이터셋 {dataset.id}: {row_count}행 ({position}/{len(pending)})")
+
+    return len(pending)
+
+
+async def main():
+    dataset_ids = [int(arg) for arg in sys.argv[1:]]
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        processed = await backfill_dataset_rows(dataset_ids)
+        print(f"✅ 데이터셋 행 채우기 완료: {processed}개")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+프롬프트 버전의 토큰 수와 크기 정보를 채우는 스크립트
+
+토큰 수 컬럼 추가 이전에 저장된 버전이나 현재 설정과 다른 토크나이저로 계산된 버전을
+id 순서로 나누어 다시 계산합니다. updated_at은 바꾸지 않으며,
+배치마다 해당 노드의 캐시 무효화 알림을 보냅니다.
+`alembic upgrade head` 이후 실행하며, 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/backfill_prompt_tokens.py [배치 크기]
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import or_, select, update
+
+from app.core.prompt_events import notify_prompt_changes
+from app.core.prompt_tokens import count_prompt_tokens, get_tokenizer
+from app.database import database
+from app.models.prompt_model import prompt_rows, prompts
+
+
+async def backfill_prompt_tokens(batch_size: int) -> int:
+    """계산이 필요한 버전을 모두 갱신하고 갱신한 행 수를 반환"""
+    tokenizer, _ = get_tokenizer()
+    print(f"🧮 토크나이저: {tokenizer}")
+
+    updated = 0
+    last_id = 0
+    while True:
+        records = await database.fetch_all(
+            select(prompt_rows.c.id, prompt_rows.c.node_name, prompt_rows.c.content)
+            .where(
+                prompt_rows.c.id > last_id,
+                or_(prompt_rows.c.tokenizer.is_(None), prompt_rows.c.tokenizer != tokenizer),
+            )
+            .order_by(prompt_rows.c.id)
+            .limit(batch_size)
+        )
+        if not records:
+            break
+
+        async with database.transaction():
+            for record in records:
+                content = json.loads(record.content) if isinstance(record.content, str) else record.content
+                await database.execute(
+                    update(prompts)
+                    .where(prompts.c.id == record.id)
+                    # 메타데이터만 채우므로 수정 시각(ETag)은 유지
+                    .values(**count_prompt_tokens(content), updated_at=prompts.c.updated_at)
+                )
+            # 알림은 커밋 시점에 전달됨
+            await notify_prompt_changes({record.node_name for record in records})
+
+        updated += len(records)
+        last_id = records[-1].id
+        print(f"   {updated}개 갱신 (마지막 id {last_id})")
+
+    return updated
+
+
+async def main():
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        updated = await backfill_prompt_tokens(batch_size)
+        print(f"✅ 토큰 수 채우기 완료: {updated}개")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+프롬프트 blob의 템플릿 변수 목록을 채우는 스크립트
+
+template_variables 컬럼 추가 이전에 저장된 blob을 해시 순서로 나누어 내용에서 변수를 추출합니다.
+내용이 같으면 변수도 같으므로 캐시 무효화 알림은 보내지 않습니다.
+`alembic upgrade head` 이후 실행하며, 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/backfill_template_variables.py [배치 크기]
+"""
+
+import asyncio
+import sys
+import os
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, update
+
+from app.core.prompt_blobs import load_prompt_contents
+from app.core.prompt_templates import CompiledPrompt
+from app.database import database
+from app.models.prompt_model import prompt_blobs
+
+
+async def backfill_template_variables(batch_size: int) -> int:
+    """변수 목록이 없는 blob을 모두 갱신하고 갱신한 행 수를 반환"""
+    updated = 0
+    last_hash = ""
+    while True:
+        content_hashes = [
+            record.content_hash
+            for record in await database.fetch_all(
+                select(prompt_blobs.c.content_hash)
+                .where(
+                    prompt_blobs.c.content_hash > last_hash,
+                    prompt_blobs.c.template_variables.is_(None),
+                )
+                .order_by(prompt_blobs.c.content_hash)
+                .limit(batch_size)
+            )
+        ]
+        if not content_hashes:
+            break
+
+        contents = await load_prompt_contents(content_hashes)
+        async with database.transaction():
+            for content_hash in content_hashes:
+                variables = CompiledPrompt(content_hash, contents[content_hash]).variables
+                await database.execute(
+                    update(prompt_blobs)
+                    .where(prompt_blobs.c.content_hash == content_hash)
+                    .values(template_variables=list(variables))
+                )
+
+        updated += len(content_hashes)
+        last_hash = content_hashes[-1]
+        print(f"   {updated}개 갱신")
+
+    return updated
+
+
+async def main():
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        updated = await backfill_template_variables(batch_size)
+        print(f"✅ 템플릿 변수 채우기 완료: {updated}개")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+프롬프트 템플릿 렌더링 벤치마크
+
+서비스에서 요청마다 정규식으로 변수를 치환하던 방식과
+미리 컴파일한 템플릿(CompiledPrompt.render_many)의 렌더링 시간을 비교하고,
+두 방식의 결과가 같은지 확인합니다. DB 없이 실행됩니다.
+
+사용법:
+    python scripts/benchmark_prompt_render.py [변수 세트 수] [반복 횟수]
+"""
+
+import re
+import sys
+import os
+import timeit
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.prompt_blobs import compute_content_hash
+from app.core.prompt_templates import CompiledPrompt
+
+CONTENT = {
+    "system": {
+        "order": 1,
+        "prompt": (
+            "당신은 {product} 고객 지원 어시스턴트입니다. 응답은 {language}로 작성하세요.\n"
+            + "답변 규칙: 근거가 없으면 모른다고 답하고, 출력은 {\"answer\": ...} 형식을 따르세요.\n" * 12
+        ),
+    },
+    "user": {"order": 2, "prompt": "고객 등급: {tier}\n질문: {question}"},
+    "assistant": {"order": None, "prompt": None},
+}
+
+ADHOC_PATTERN = r"\{([^\W\d]\w*)\}"
+
+
+def adhoc_render(content, values):
+    """기존 서비스 방식: 요청마다 역할을 정렬하고 정규식으로 치환"""
+    messages = []
+    roles = sorted(
+        (item for item in content.items() if item[1]["prompt"] is not None),
+        key=lambda item: (item[1]["order"] is None, item[1]["order"] or 0),
+    )
+    for role, message in roles:
+        text = re.sub(ADHOC_PATTERN, lambda match: str(values[match.group(1)]), message["prompt"])
+        messages.append({"role": role, "content": text})
+    return messages
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    variable_sets = [
+        {
+            "product": "프롬프트 매니저",
+            "language": "한국어",
+            "tier": ["basic", "pro", "enterprise"][index % 3],
+            "question": f"{index}번 질문입니다. 배포는 어떻게 하나요?",
+        }
+        for index in range(count)
+    ]
+    compiled = CompiledPrompt(compute_content_hash(CONTENT), CONTENT)
+
+    adhoc = [adhoc_render(CONTENT, values) for values in variable_sets]
+    if adhoc != compiled.render_many(variable_sets):
+        print("❌ 두 방식의 렌더링 결과가 다릅니다")
+        sys.exit(1)
+
+    print(f"🧪 변수 세트 {count}개, 반복 {repeat}회 (변수: {', '.join(compiled.variables)})")
+    results = {}
+    for name, render in (
+        ("정규식 치환", lambda: [adhoc_render(CONTENT, values) for values in variable_sets]),
+        ("컴파일된 템플릿", lambda: compiled.render_many(variable_sets)),
+    ):
+        seconds = min(timeit.repeat(render, number=repeat, repeat=3)) / repeat
+        results[name] = seconds
+        print(f"   {name}: 요청당 {seconds * 1000:.3f}ms, 세트당 {seconds / count * 1e6:.2f}µs")
+
+    speedup = results["정규식 치환"] / results["컴파일된 템플릿"]
+    print(f"✅ 렌더링 결과 동일, {speedup:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
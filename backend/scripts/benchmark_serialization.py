@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+페이지네이션 응답 직렬화 벤치마크
+
+기존 경로(convert_record_to_dict → PaginatedResponse 검증 → jsonable_encoder → JSONResponse)와
+새 경로(create_paginated_response: 컬럼별 변환 함수 + FastJSONResponse)의
+한 페이지 응답 바이트 생성 시간을 비교하고, 두 경로의 결과가 같은지 확인합니다.
+DB 없이 databases 레코드를 prompts 테이블 조회 결과와 같은 형태로 만들어 측정합니다.
+
+사용법:
+    python scripts/benchmark_serialization.py [페이지 크기] [반복 횟수]
+"""
+
+import json
+import sys
+import os
+import timeit
+from datetime import datetime, timedelta, timezone
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from databases.backends.common.records import Record, create_column_maps
+from databases.backends.postgres import PostgresBackend
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+
+from app.database import DATABASE_URL
+from app.models.prompt_model import prompt_rows
+from app.schemas.pagination_schema import PaginatedResponse, create_pagination_data
+from app.utils.response_utils import convert_records_to_list, create_paginated_response
+from app.utils.serialization_utils import orjson
+
+
+class BenchmarkRow(tuple):
+    """asyncpg.Record처럼 인덱스와 keys()를 지원하는 행 (asyncpg.Record는 직접 생성할 수 없음)"""
+
+    def __new__(cls, keys, values):
+        row = super().__new__(cls, values)
+        row._keys = keys
+        return row
+
+    def keys(self):
+        return iter(self._keys)
+
+
+def build_records(count: int):
+    """select(prompt_rows) 결과와 같은 컬럼 구성의 databases 레코드 생성"""
+    dialect = PostgresBackend(DATABASE_URL)._dialect
+    compiled = select(prompt_rows).compile(dialect=dialect)
+    result_columns = compiled._result_columns
+    column_maps = create_column_maps(result_columns)
+    keys = [column[0] for column in result_columns]
+
+    # asyncpg는 json 컬럼을 문자열로 반환
+    content = json.dumps(
+        {
+            "system": {"order": 1, "prompt": "당신은 사용자의 질문에 정확하게 답하는 검색 어시스턴트입니다. " * 8},
+            "user": {"order": 2, "prompt": "파리의 날씨는 어때요?"},
+            "assistant": {"order": None, "prompt": None},
+        },
+        ensure_ascii=False,
+    )
+    now = datetime.now(timezone.utc)
+
+    records = []
+    for index in range(count):
+        values = (
+            index + 1,
+            "검색노드",
+            content,
+            f"버전 {index + 1} 개선",
+            index == 0,
+            count - index,
+            now - timedelta(minutes=index),
+            now - timedelta(minutes=index),
+            f"{index:064x}",
+            180,
+            12,
+            0,
+            192,
+            1450,
+            "tiktoken:cl100k_base",
+        )
+        records.append(Record(BenchmarkRow(keys, values), result_columns, dialect, column_maps))
+    return records
+
+
+def legacy_response_body(records, size: int) -> bytes:
+    """변경 전 경로: 행마다 getattr/isinstance 변환 후 pydantic 검증과 jsonable_encoder를 거침"""
+    items = convert_records_to_list(records)
+    model = PaginatedResponse(
+        status="success",
+        data=create_pagination_data(items, 1, size, 1000),
+        message="페이지네이션 조회가 성공적으로 완료되었습니다.",
+    )
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def fast_response_body(records, size: int) -> bytes:
+    return create_paginated_response(
+        items=records,
+        page=1,
+        size=size,
+        total=1000,
+        message="페이지네이션 조회가 성공적으로 완료되었습니다.",
+    ).body
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    records = build_records(size)
+
+    legacy = json.loads(legacy_response_body(records, size))
+    fast = json.loads(fast_response_body(records, size))
+    if legacy != fast:
+        print("❌ 두 경로의 응답 본문이 다릅니다")
+        sys.exit(1)
+
+    print(f"🧪 페이지 크기 {size}, 반복 {repeat}회 (인코더: {'orjson' if orjson else 'json'})")
+    results = {}
+    for name, render in (("기존 경로", legacy_response_body), ("빠른 경로", fast_response_body)):
+        seconds = min(timeit.repeat(lambda: render(records, size), number=repeat, repeat=3)) / repeat
+        results[name] = seconds
+        print(f"   {name}: 페이지당 {seconds * 1000:.3f}ms, 행당 {seconds / size * 1e6:.2f}µs")
+
+    speedup = results["기존 경로"] / results["빠른 경로"]
+    print(f"✅ 응답 본문 동일, {speedup:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+주요 조회 쿼리가 인덱스를 사용하는지 실행 계획으로 확인하는 스크립트
+
+API가 실제로 보내는 쿼리를 EXPLAIN (FORMAT JSON)으로 분석하여
+기대한 인덱스가 계획에 포함되는지 검사합니다. 프롬프트 조회와 페이지 쿼리는 라우터와 같은
+헬퍼(prompt_lookup_query, page_query, sorted_page_query 등)로 만들어 prompt_rows 조인까지 그대로 확인합니다.
+데이터가 적은 개발 DB에서는 플래너가 순차 스캔을 고르므로, 트랜잭션 안에서
+테이블마다 SEED_ROWS개의 확인용 행을 넣고 ANALYZE한 뒤 플래너 설정은 그대로 두고
+계획을 확인합니다. 확인용 행은 롤백되며, 끝나면 통계를 다시 수집합니다.
+`alembic upgrade head` 이후 실행하며, 하나라도 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/check_query_plans.py
+"""
+
+import asyncio
+import json
+import sys
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.core.prompt_blobs import node_keyframe_query
+from app.core.prompt_cache import prompt_lookup_query
+from app.database import database
+from app.models.dataset_model import DATASET_SEARCH_COLUMNS, dataset_rows, dataset_search_vector, datasets
+from app.models.evaluation_result_model import (
+    EvaluationStatus,
+    evaluation_requests,
+    evaluation_results,
+)
+from app.models.prompt_model import PROMPT_BLOB_SEARCH_COLUMNS, prompt_blobs, prompt_rows
+from app.routers.prompt_router import identical_version_query, token_count_conditions
+from app.schemas.pagination_schema import PaginationParams
+from app.utils.pagination_utils import encode_cursor, encode_sort_cursor, page_query, sorted_page_query
+from app.utils.search_utils import text_match
+from app.utils.response_utils import ExplainJSON
+
+NOW = datetime.now(timezone.utc)
+
+# 테이블마다 넣는 확인용 행 수 (플래너가 순차 스캔보다 인덱스를 고를 만큼의 크기)
+SEED_ROWS = 50000
+SEED_NODES = 500
+SEED_DATASETS = 1000
+
+# 확인용 행 (기존 행과 겹치지 않도록 음수 id와 plan-check- 접두사 사용, 시퀀스도 소비하지 않음)
+SEED_STATEMENTS = [
+    (
+        "prompt_blobs",
+        """
+        INSERT INTO prompt_blobs (content_hash, content, system_text, user_text, created_at)
+        SELECT md5('plan-check-' || g) || md5('plan-check-blob-' || g),
+               json_build_object('system', json_build_object('order', 1, 'prompt', 'seed system ' || g)),
+               'seed system prompt ' || md5(g::text),
+               'seed user prompt ' || md5((g * 7)::text),
+               now() - g * interval '1 second'
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+    (
+        "prompts",
+        """
+        INSERT INTO prompts (id, node_name, content_hash, message, production, version,
+                             token_count, created_at, updated_at)
+        SELECT -g, 'plan-check-' || (g % :nodes), md5('plan-check-' || g) || md5('plan-check-blob-' || g),
+               'seed message ' || g, g <= :nodes, g / :nodes + 1,
+               g % 8000, now() - g * interval '1 second', now() - g * interval '1 second'
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+    (
+        "datasets",
+        """
+        INSERT INTO datasets (id, name, description, row_count, created_at, updated_at)
+        SELECT -g, 'plan-check-' || g, 'seed dataset ' || md5(g::text), 0,
+               now() - g * interval '1 second', now() - g * interval '1 second'
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+    (
+        "dataset_rows",
+        """
+        INSERT INTO dataset_rows (dataset_id, row_index, data)
+        SELECT -(g % :datasets + 1), g / :datasets, jsonb_build_array(g::text)
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+    (
+        "evaluation_requests",
+        """
+        INSERT INTO evaluation_requests (id, node_name, version, dataset_id, metrics, status, created_at)
+        SELECT 'plan-check-' || g, 'plan-check-' || (g % :nodes), '1', -(g % :datasets + 1), '[]',
+               CASE WHEN g % 100 = 0 THEN 'PENDING' ELSE 'COMPLETED' END::evaluationstatus,
+               now() - g * interval '1 second'
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+    (
+        "evaluation_results",
+        """
+        INSERT INTO evaluation_results (id, prompt_id, dataset_id, metric_name, score, created_at)
+        SELECT -g, -(g % :rows + 1), -(g % :datasets + 1), (ARRAY['accuracy', 'f1', 'latency'])[g % 3 + 1],
+               random(), now() - g * interval '1 second'
+        FROM generate_series(1, :rows) AS g
+        """,
+    ),
+]
+
+
+def keyset_page(table):
+    """fetch_page가 커서 다음 페이지를 조회하는 쿼리 (라우터와 같이 select(table)로 시작)"""
+    cursor = encode_cursor(SimpleNamespace(created_at=NOW, id=1000))
+    return page_query(select(table), table, PaginationParams(size=20, cursor=cursor))
+
+
+# (설명, 쿼리, 사용되어야 하는 인덱스)
+CHECKS = [
+    (
+        "프로덕션 프롬프트 조회",
+        prompt_lookup_query("검색노드"),
+        "uq_prompts_node_name_production",
+    ),
+    (
+        "노드/버전 프롬프트 조회",
+        prompt_lookup_query("검색노드", 3),
+        "uq_prompts_node_name_version",
+    ),
+    (
+        "노드 최신 버전의 키프레임 조회",
+        node_keyframe_query("검색노드"),
+        "uq_prompts_node_name_version",
+    ),
+    (
+        "노드 안에서 같은 내용의 버전 찾기",
+        identical_version_query("검색노드", "0" * 64),
+        "ix_prompts_node_name_content_hash",
+    ),
+    (
+        "프롬프트 키셋 페이지",
+        keyset_page(prompt_rows),
+        "ix_prompts_created_at_id",
+    ),
+    (
+        "토큰 수순 프롬프트 페이지",
+        sorted_page_query(
+            select(prompt_rows).where(*token_count_conditions(prompt_rows, None, 4000)),
+            prompt_rows,
+            PaginationParams(size=20, cursor=encode_sort_cursor(4000, 1000)),
+            prompt_rows.c.token_count,
+        ),
+        "ix_prompts_token_count_id",
+    ),
+    (
+        "데이터셋 이름 중복 확인",
+        select(datasets).where(datasets.c.name == "data1"),
+        "ix_datasets_name",
+    ),
+    (
+        "프롬프트 내용 전문 검색",
+        select(prompt_blobs.c.content_hash).where(
+            text_match(prompt_blobs.c.search_vector, PROMPT_BLOB_SEARCH_COLUMNS, "날씨 예보")
+        ),
+        "ix_prompt_blobs_search_vector",
+    ),
+    (
+        "프롬프트 내용 부분 일치 검색",
+        select(prompt_blobs.c.content_hash).where(
+            text_match(prompt_blobs.c.search_vector, PROMPT_BLOB_SEARCH_COLUMNS, "날씨는")
+        ),
+        "ix_prompt_blobs_user_text_trgm",
+    ),
+    (
+        "데이터셋 이름/설명 검색",
+        select(datasets.c.id).where(
+            text_match(dataset_search_vector, DATASET_SEARCH_COLUMNS, "weather")
+        ),
+        "ix_datasets_search_vector",
+    ),
+    (
+        "데이터셋 행 범위 조회",
+        select(dataset_rows.c.row_index, dataset_rows.c.data)
+        .where(dataset_rows.c.dataset_id == 1, dataset_rows.c.row_index >= 5000)
+        .order_by(dataset_rows.c.row_index)
+        .limit(101),
+        "dataset_rows_pkey",
+    ),
+    (
+        "데이터셋 키셋 페이지",
+        keyset_page(datasets),
+        "ix_datasets_created_at_id",
+    ),
+    (
+        "프롬프트/데이터셋/지표별 평가 결과",
+        select(evaluation_results)
+        .where(
+            evaluation_results.c.prompt_id == 1,
+            evaluation_results.c.dataset_id == 1,
+            evaluation_results.c.metric_name == "accuracy",
+        )
+        .order_by(evaluation_results.c.created_at.desc()),
+        "ix_evaluation_results_prompt_dataset_metric_created_at",
+    ),
+    (
+        "평가 결과 키셋 페이지",
+        keyset_page(evaluation_results),
+        "ix_evaluation_results_created_at_id",
+    ),
+    (
+        "상태별 평가 요청 대기열",
+        select(evaluation_requests)
+        .where(evaluation_requests.c.status == EvaluationStatus.PENDING)
+        .order_by(evaluation_requests.c.created_at),
+        "ix_evaluation_requests_status_created_at",
+    ),
+    (
+        "평가 요청 키셋 페이지",
+        keyset_page(evaluation_requests),
+        "ix_evaluation_requests_created_at_id",
+    ),
+]
+
+
+def collect_index_names(plan: dict) -> set:
+    """실행 계획 트리에서 사용된 인덱스 이름을 모두 수집"""
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= collect_index_names(child)
+    return names
+
+
+async def explain_index_names(query) -> set:
+    result = await database.fetch_one(ExplainJSON(query))
+    plan = result[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return collect_index_names(plan[0]["Plan"])
+
+
+async def seed_plan_check_rows():
+    """확인용 행을 넣고 통계를 수집 (트랜잭션 안에서 호출)"""
+    params = {"rows": SEED_ROWS, "nodes": SEED_NODES, "datasets": SEED_DATASETS}
+    for table_name, statement in SEED_STATEMENTS:
+        # 문장에 쓰인 파라미터만 전달 (databases는 사용하지 않는 값이 있으면 오류)
+        values = {name: value for name, value in params.items() if f":{name}" in statement}
+        await database.execute(statement, values)
+        await database.execute(f"ANALYZE {table_name}")
+    print(f"🌱 테이블마다 확인용 행 {SEED_ROWS}개 추가 (확인 후 롤백)\n")
+
+
+async def check_query_plans() -> bool:
+    """모든 쿼리의 실행 계획을 확인하고 전부 통과하면 True 반환"""
+    failures = 0
+
+    # 확인용 행은 트랜잭션이 끝나면 롤백됨
+    async with database.transaction(force_rollback=True):
+        await seed_plan_check_rows()
+
+        for description, query, expected_index in CHECKS:
+            used_indexes = await explain_index_names(query)
+            if expected_index in used_indexes:
+                print(f"✅ {description}: {expected_index}")
+            else:
+                failures += 1
+                used = ", ".join(sorted(used_indexes)) or "인덱스 없음"
+                print(f"❌ {description}: {expected_index} 미사용 (사용: {used})")
+
+    # ANALYZE가 갱신한 행 수 추정치(pg_class)는 롤백되지 않으므로 실제 데이터로 다시 수집
+    for table_name, _ in SEED_STATEMENTS:
+        await database.execute(f"ANALYZE {table_name}")
+
+    print(f"\n📊 결과: {len(CHECKS) - failures}/{len(CHECKS)} 통과")
+    return failures == 0
+
+
+async def main():
+    print("🔍 쿼리 실행 계획 확인 시작")
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공\n")
+        passed = await check_query_plans()
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        passed = False
+    finally:
+        await database.disconnect()
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
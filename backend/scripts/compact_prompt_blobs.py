@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+기존 프롬프트 blob을 키프레임 대비 델타로 다시 저장하는 스크립트
+
+델타 저장 도입 전 blob은 모두 전체 내용(키프레임)으로 저장되어 있습니다.
+노드별로 버전 순서대로 훑으면서 새 프롬프트 저장과 같은 규칙(encode_blob)으로
+델타로 바꿀 수 있는 blob을 변환하고, 변환 직후 DB 함수로 복원한 내용의 해시가
+원래 해시와 같은지 확인합니다. 다르면 해당 노드의 변경을 롤백하고 종료 코드 1을 반환합니다.
+`alembic upgrade head` 이후 실행하며, --dry-run이면 변환과 검증만 하고 모두 롤백합니다.
+
+사용법:
+    python scripts/compact_prompt_blobs.py [--dry-run]
+"""
+
+import asyncio
+import json
+import sys
+import os
+from collections import Counter
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import distinct, func, select, update
+
+from app.core.prompt_blobs import canonical_content, compute_content_hash, encode_blob
+from app.core.prompt_release import lock_nodes_query
+from app.database import database
+from app.models.prompt_model import (
+    blobs_with_keyframes,
+    prompt_blobs,
+    prompts,
+    resolved_blob_content,
+)
+
+
+class BlobMismatch(Exception):
+    """DB에서 복원한 내용이 원래 해시와 다름"""
+
+
+def loads(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+async def load_delta_counts() -> Counter:
+    records = await database.fetch_all(
+        select(prompt_blobs.c.base_hash, func.count().label("count"))
+        .where(prompt_blobs.c.base_hash.isnot(None))
+        .group_by(prompt_blobs.c.base_hash)
+    )
+    return Counter({record.base_hash: record.count for record in records})
+
+
+async def load_keyframe_content(content_hash: str):
+    value = await database.fetch_val(
+        select(prompt_blobs.c.content).where(prompt_blobs.c.content_hash == content_hash)
+    )
+    return loads(value)
+
+
+async def verify_blob(content_hash: str) -> None:
+    restored = await database.fetch_val(
+        select(resolved_blob_content)
+        .select_from(blobs_with_keyframes)
+        .where(prompt_blobs.c.content_hash == content_hash)
+    )
+    if compute_content_hash(loads(restored)) != content_hash:
+        raise BlobMismatch(content_hash)
+
+
+async def compact_node(node_name: str, delta_counts: Counter, stats: Counter) -> None:
+    """노드의 키프레임 blob 중 델타로 바꿀 수 있는 것을 변환 (호출 측 트랜잭션 안에서 실행)"""
+    records = await database.fetch_all(
+        select(
+            prompt_blobs.c.content_hash,
+            prompt_blobs.c.content,
+            prompt_blobs.c.base_hash,
+        )
+        .select_from(prompts.join(prompt_blobs, prompts.c.content_hash == prompt_blobs.c.content_hash))
+        .where(prompts.c.node_name == node_name)
+        .order_by(prompts.c.version)
+    )
+
+    keyframe_hash, keyframe_content = None, None
+    for record in records:
+        if record.content_hash == keyframe_hash:
+            continue
+        if record.base_hash is not None:
+            # 이미 델타이면 그 키프레임을 이후 버전의 기준으로 사용
+            keyframe_hash = record.base_hash
+            keyframe_content = await load_keyframe_content(keyframe_hash)
+            continue
+
+        content = loads(record.content)
+        # 다른 blob의 키프레임이면 내용을 유지해야 함
+        if keyframe_hash is None or delta_counts[record.content_hash] > 0:
+            keyframe_hash, keyframe_content = record.content_hash, content
+            continue
+
+        values = encode_blob(content, keyframe_hash, keyframe_content, delta_counts[keyframe_hash])
+        if values["delta"] is None:
+            keyframe_hash, keyframe_content = record.content_hash, content
+            continue
+
+        await database.execute(
+            update(prompt_blobs)
+            .where(prompt_blobs.c.content_hash == record.content_hash)
+            .values(**values)
+        )
+        await verify_blob(record.content_hash)
+        delta_counts[keyframe_hash] += 1
+        stats["converted"] += 1
+        stats["bytes_before"] += len(canonical_content(content).encode("utf-8"))
+        stats["bytes_after"] += len(canonical_content(values["delta"]).encode("utf-8"))
+
+
+async def compact_prompt_blobs(dry_run: bool) -> bool:
+    """모든 노드의 blob을 변환하고 검증에 모두 통과하면 True 반환"""
+    node_names = [
+        record[0]
+        for record in await database.fetch_all(
+            select(distinct(prompts.c.node_name)).order_by(prompts.c.node_name)
+        )
+    ]
+    delta_counts = await load_delta_counts()
+    stats = Counter()
+    failures = 0
+
+    print(f"🧪 노드 {len(node_names)}개의 blob 변환 {'(dry-run, 모두 롤백)' if dry_run else ''}")
+    for node_name in node_names:
+        node_counts = delta_counts.copy()
+        node_stats = Counter()
+        try:
+            async with database.transaction(force_rollback=dry_run):
+                # 생성/수정과 같은 노드 잠금으로 변환 중 새 버전 저장과 겹치지 않도록 함
+                await database.execute(lock_nodes_query([node_name]))
+                await compact_node(node_name, node_counts, node_stats)
+        except BlobMismatch as e:
+            failures += 1
+            print(f"❌ {node_name}: blob {e} 복원 결과가 원래 내용과 다름, 롤백")
+            continue
+
+        delta_counts = node_counts
+        stats.update(node_stats)
+        if node_stats["converted"]:
+            print(f"   {node_name}: {node_stats['converted']}개 델타로 변환")
+
+    saved = stats["bytes_before"] - stats["bytes_after"]
+    print(
+        f"\n📊 결과: {stats['converted']}개 변환, "
+        f"{stats['bytes_before']:,} → {stats['bytes_after']:,} bytes ({saved:,} bytes 절감)"
+    )
+    return failures == 0
+
+
+async def main():
+    dry_run = "--dry-run" in sys.argv[1:]
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        passed = await compact_prompt_blobs(dry_run)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        passed = False
+    finally:
+        await database.disconnect()
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
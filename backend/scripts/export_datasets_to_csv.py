@@ -14,7 +14,8 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import database
-from sqlalchemy import text
+from app.models.dataset_model import dataset_content, datasets
+from sqlalchemy import select
 
 
 async def export_datasets_to_csv():
@@ -32,15 +33,21 @@ async def export_datasets_to_csv():
             print(f"📁 '{csv_dir}' 디렉토리 생성됨")
         
         # 모든 데이터셋 조회
-        query = text("SELECT id, name, description, content FROM datasets ORDER BY id")
-        datasets = await database.fetch_all(query)
+        # 업로드 내용은 dataset_chunks에 저장되므로 dataset_content로 합쳐서 조회
+        query = select(
+            datasets.c.id,
+            datasets.c.name,
+            datasets.c.description,
+            dataset_content.label("content"),
+        ).order_by(datasets.c.id)
+        rows = await database.fetch_all(query)
         
-        print(f"📊 총 {len(datasets)}개 데이터셋 발견")
+        print(f"📊 총 {len(rows)}개 데이터셋 발견")
         
         exported_count = 0
         file_list = []
         
-        for dataset in datasets:
+        for dataset in rows:
             try:
                 # 파일명 생성 (특수문자 제거)
                 safe_name = dataset['name'].replace('_', '-').replace(' ', '-')
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+프로덕션 프롬프트 스냅샷을 파일로 추출하는 스크립트
+
+추론 서버가 부팅 시 API를 기다리지 않고 로컬 디스크에서 프롬프트를 읽을 수 있도록
+모든 노드의 현재 프로덕션 프롬프트를 하나의 JSON 파일로 저장합니다.
+
+사용법:
+    python scripts/export_production_snapshot.py [출력 파일 경로]
+"""
+
+import asyncio
+import sys
+import os
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import database
+from app.core.prompt_snapshot import build_production_snapshot, encode_snapshot
+
+
+async def export_production_snapshot(output_path: str):
+    """현재 프로덕션 프롬프트 스냅샷을 파일로 저장"""
+    print("🚀 프로덕션 프롬프트 스냅샷 추출 시작")
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+
+        snapshot = await build_production_snapshot()
+
+        # 읽는 쪽이 중간 상태의 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(output_dir, exist_ok=True)
+        temp_path = f"{output_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(encode_snapshot(snapshot))
+        os.replace(temp_path, output_path)
+
+        print(f"✅ 스냅샷 저장 완료: {output_path}")
+        print(f"   스냅샷 ID: {snapshot['snapshot_id']}")
+        print(f"   콘텐츠 해시: {snapshot['content_hash']}")
+        print(f"   노드 수: {len(snapshot['prompts'])}")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+
+    finally:
+        await database.disconnect()
+        print("🔌 데이터베이스 연결 종료")
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else "production_snapshot.json"
+    asyncio.run(export_production_snapshot(output))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+프롬프트 생성 동시성 스트레스 스크립트
+
+여러 작업자가 같은 노드에 동시에 프롬프트를 생성하여
+버전 중복이나 누락 없이 1..N이 할당되는지 확인하고 초당 생성 수를 출력합니다.
+임시 노드를 사용하며 끝나면 해당 노드의 프롬프트를 모두 삭제합니다.
+중복/누락이 있거나 생성이 실패하면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/stress_create_prompt.py [작업자 수] [작업자당 생성 수]
+"""
+
+import asyncio
+import sys
+import os
+import time
+import uuid
+from collections import Counter
+
+# 백엔드 프로젝트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.database import database
+from app.models.prompt_model import prompts
+from app.routers.prompt_router import create_prompt, delete_prompts_by_node_name
+from app.schemas.prompt_schema import PromptCreate
+
+
+def build_prompt(node_name: str, worker: int, index: int) -> PromptCreate:
+    return PromptCreate(
+        node_name=node_name,
+        content={
+            "system": {"order": 1, "prompt": f"스트레스 테스트 프롬프트 {worker}-{index}"},
+            "user": {"order": 2, "prompt": None},
+            "assistant": {"order": None, "prompt": None},
+        },
+        message=f"stress worker {worker} #{index}",
+    )
+
+
+async def run_worker(node_name: str, worker: int, count: int, failures: list):
+    for index in range(count):
+        try:
+            await create_prompt(build_prompt(node_name, worker, index))
+        except HTTPException as e:
+            failures.append(f"작업자 {worker} #{index}: {e.status_code} {e.detail}")
+
+
+async def stress_create_prompt(workers: int, per_worker: int) -> bool:
+    """동시 생성 후 버전 할당 결과를 검증하고 통과하면 True 반환"""
+    # node_name 컬럼이 String(50)이므로 짧은 임시 이름 사용
+    node_name = f"stress-{uuid.uuid4().hex[:12]}"
+    expected = workers * per_worker
+    failures = []
+
+    print(f"🧪 노드 '{node_name}'에 작업자 {workers}명 x {per_worker}회 동시 생성")
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(run_worker(node_name, worker, per_worker, failures) for worker in range(workers))
+    )
+    elapsed = time.perf_counter() - started
+
+    rows = await database.fetch_all(
+        select(prompts.c.version, prompts.c.production).where(prompts.c.node_name == node_name)
+    )
+    versions = [row.version for row in rows]
+    duplicates = sorted(version for version, copies in Counter(versions).items() if copies > 1)
+    missing = sorted(set(range(1, len(rows) + 1)) - set(versions))
+    production_count = sum(1 for row in rows if row.production)
+
+    print(f"⏱️  {len(rows)}개 생성, {elapsed:.2f}초, {len(rows) / elapsed:.1f} creates/sec")
+    print(f"   실패한 요청: {len(failures)}")
+    for failure in failures[:10]:
+        print(f"     - {failure}")
+    print(f"   중복 버전: {duplicates or '없음'}")
+    print(f"   누락 버전: {missing or '없음'}")
+    print(f"   프로덕션 프롬프트 수: {production_count}")
+
+    await delete_prompts_by_node_name(node_name)
+    print(f"🧹 임시 노드 '{node_name}' 삭제 완료")
+
+    return (
+        len(rows) == expected
+        and not failures
+        and not duplicates
+        and not missing
+        and production_count == 1
+    )
+
+
+async def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_worker = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+
+    try:
+        await database.connect()
+        print("✅ 데이터베이스 연결 성공")
+        passed = await stress_create_prompt(workers, per_worker)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        passed = False
+    finally:
+        await database.disconnect()
+
+    print("✅ 버전 할당 검증 통과" if passed else "❌ 버전 할당 검증 실패")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
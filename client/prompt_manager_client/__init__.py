@@ -0,0 +1,16 @@
+from prompt_manager_client.cache import CacheEntry, PromptLRUCache
+from prompt_manager_client.client import (
+    AsyncPromptManagerClient,
+    PromptManagerClient,
+    PromptManagerError,
+    PromptNotFoundError,
+)
+
+__all__ = [
+    "AsyncPromptManagerClient",
+    "CacheEntry",
+    "PromptLRUCache",
+    "PromptManagerClient",
+    "PromptManagerError",
+    "PromptNotFoundError",
+]
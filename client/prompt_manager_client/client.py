@@ -0,0 +1,294 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+import httpx
+
+from prompt_manager_client.cache import CacheEntry, PromptKey, PromptLRUCache
+
+
+class PromptManagerError(Exception):
+    """프롬프트 매니저 API 호출 실패"""
+
+
+class PromptNotFoundError(PromptManagerError):
+    """요청한 노드/버전의 프롬프트가 없음"""
+
+
+class _BaseClient:
+    """동기/비동기 클라이언트 공통 로직 (캐시 판단, 응답 해석)"""
+
+    def __init__(
+        self,
+        base_url: str,
+        fresh_ttl: float = 30.0,
+        stale_ttl: float = 3600.0,
+        max_entries: int = 1024,
+    ):
+        """
+        - **fresh_ttl**: 이 시간(초) 동안은 서버에 묻지 않고 캐시로 응답
+        - **stale_ttl**: fresh_ttl 이후 이 시간 동안은 캐시로 즉시 응답하고 백그라운드에서 재검증
+        """
+        self.base_url = base_url.rstrip("/")
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.cache = PromptLRUCache(max_entries)
+
+    @staticmethod
+    def _path(key: PromptKey) -> str:
+        node_name, version = key
+        node = quote(node_name, safe="")
+        if version is None:
+            return f"/prompts/node/{node}/production"
+        return f"/prompts/node/{node}/version/{version}"
+
+    @staticmethod
+    def _headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        if entry is not None and entry.etag:
+            return {"If-None-Match": entry.etag}
+        return {}
+
+    def _is_fresh(self, entry: CacheEntry, now: float) -> bool:
+        return entry.age(now) < self.fresh_ttl
+
+    def _is_servable_stale(self, entry: CacheEntry, now: float) -> bool:
+        return entry.age(now) < self.fresh_ttl + self.stale_ttl
+
+    def _handle_response(
+        self, key: PromptKey, entry: Optional[CacheEntry], response: httpx.Response
+    ) -> Dict[str, Any]:
+        """응답을 해석하여 캐시에 반영하고 프롬프트를 반환"""
+        if response.status_code == 304 and entry is not None:
+            entry.fetched_at = time.monotonic()
+            self.cache.put(key, entry)
+            return entry.prompt
+
+        if response.status_code == 404:
+            self.cache.pop(key)
+            raise PromptNotFoundError(f"Prompt not found: node={key[0]!r}, version={key[1]}")
+
+        if response.status_code != 200:
+            raise PromptManagerError(
+                f"Unexpected response {response.status_code} for {response.request.url}"
+            )
+
+        prompt = response.json()["data"]
+        self.cache.put(
+            key,
+            CacheEntry(prompt, response.headers.get("ETag"), time.monotonic()),
+        )
+        return prompt
+
+    def _store_resolved(self, body: Dict[str, Any], keys: List[PromptKey]) -> Dict[PromptKey, Dict[str, Any]]:
+        """일괄 조회 응답을 캐시에 반영 (ETag가 없으므로 다음 재검증은 전체 조회)"""
+        now = time.monotonic()
+        wanted = set(keys)
+        resolved = {}
+        for prompt in body["data"]["prompts"]:
+            candidates = [(prompt["node_name"], prompt["version"])]
+            if prompt.get("production"):
+                candidates.append((prompt["node_name"], None))
+            for key in candidates:
+                if key in wanted:
+                    resolved[key] = prompt
+                    self.cache.put(key, CacheEntry(prompt, None, now))
+        return resolved
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        `export_production_snapshot.py`로 만든 스냅샷 파일로 캐시를 채웁니다.
+        채운 항목은 만료된 것으로 간주되어 첫 조회 시 즉시 반환되고 백그라운드에서 재검증됩니다.
+        """
+        with open(path, "rb") as f:
+            snapshot = json.load(f)
+
+        # fresh_ttl이 지난 시점으로 기록하여 stale 상태로 시작
+        fetched_at = time.monotonic() - self.fresh_ttl
+        for node_name, prompt in snapshot["prompts"].items():
+            prompt = {**prompt, "node_name": node_name, "production": True}
+            self.cache.put((node_name, None), CacheEntry(prompt, None, fetched_at))
+        return len(snapshot["prompts"])
+
+
+class PromptManagerClient(_BaseClient):
+    """
+    동기 클라이언트.
+
+    keep-alive 연결 풀을 재사용하며, 조회 결과를 LRU 캐시에 보관합니다.
+    만료된 항목은 즉시 반환한 뒤 백그라운드 스레드에서 ETag로 재검증하고,
+    서버 장애 시에는 캐시된 값을 계속 반환합니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        fresh_ttl: float = 30.0,
+        stale_ttl: float = 3600.0,
+        max_entries: int = 1024,
+        timeout: float = 5.0,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        super().__init__(base_url, fresh_ttl, stale_ttl, max_entries)
+        self._http = http_client or httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prompt-revalidate")
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+
+    def get_prompt(self, node_name: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """노드의 프롬프트 조회. version을 생략하면 프로덕션 프롬프트를 반환"""
+        key = (node_name, version)
+        entry = self.cache.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if self._is_fresh(entry, now):
+                return entry.prompt
+            if self._is_servable_stale(entry, now):
+                self._revalidate_in_background(key)
+                return entry.prompt
+
+        try:
+            return self._fetch(key, entry)
+        except PromptNotFoundError:
+            raise
+        except (httpx.HTTPError, PromptManagerError):
+            # 서버 장애 시에는 오래된 값이라도 반환
+            if entry is not None:
+                return entry.prompt
+            raise
+
+    def resolve(self, node_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 노드의 프로덕션 프롬프트를 한 번의 요청으로 조회하여 캐시를 채움"""
+        keys = [(node_name, None) for node_name in node_names]
+        response = self._http.post(
+            "/prompts/production/resolve",
+            json={"nodes": [{"node_name": node_name} for node_name, _ in keys]},
+        )
+        response.raise_for_status()
+        resolved = self._store_resolved(response.json(), keys)
+        return {node_name: prompt for (node_name, _), prompt in resolved.items()}
+
+    def _fetch(self, key: PromptKey, entry: Optional[CacheEntry]) -> Dict[str, Any]:
+        response = self._http.get(self._path(key), headers=self._headers(entry))
+        return self._handle_response(key, entry, response)
+
+    def _revalidate_in_background(self, key: PromptKey) -> None:
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+        self._executor.submit(self._revalidate, key)
+
+    def _revalidate(self, key: PromptKey) -> None:
+        try:
+            self._fetch(key, self.cache.get(key))
+        except Exception:
+            # 실패하면 캐시를 유지하고 다음 조회 때 다시 시도
+            pass
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(key)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._http.close()
+
+    def __enter__(self) -> "PromptManagerClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncPromptManagerClient(_BaseClient):
+    """
+    비동기 클라이언트.
+
+    동작은 PromptManagerClient와 같으며, 재검증은 이벤트 루프의 백그라운드 태스크로 수행합니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        fresh_ttl: float = 30.0,
+        stale_ttl: float = 3600.0,
+        max_entries: int = 1024,
+        timeout: float = 5.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        super().__init__(base_url, fresh_ttl, stale_ttl, max_entries)
+        self._http = http_client or httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+        self._revalidating: Dict[PromptKey, asyncio.Task] = {}
+
+    async def get_prompt(self, node_name: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """노드의 프롬프트 조회. version을 생략하면 프로덕션 프롬프트를 반환"""
+        key = (node_name, version)
+        entry = self.cache.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if self._is_fresh(entry, now):
+                return entry.prompt
+            if self._is_servable_stale(entry, now):
+                self._revalidate_in_background(key)
+                return entry.prompt
+
+        try:
+            return await self._fetch(key, entry)
+        except PromptNotFoundError:
+            raise
+        except (httpx.HTTPError, PromptManagerError):
+            # 서버 장애 시에는 오래된 값이라도 반환
+            if entry is not None:
+                return entry.prompt
+            raise
+
+    async def resolve(self, node_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 노드의 프로덕션 프롬프트를 한 번의 요청으로 조회하여 캐시를 채움"""
+        keys = [(node_name, None) for node_name in node_names]
+        response = await self._http.post(
+            "/prompts/production/resolve",
+            json={"nodes": [{"node_name": node_name} for node_name, _ in keys]},
+        )
+        response.raise_for_status()
+        resolved = self._store_resolved(response.json(), keys)
+        return {node_name: prompt for (node_name, _), prompt in resolved.items()}
+
+    async def _fetch(self, key: PromptKey, entry: Optional[CacheEntry]) -> Dict[str, Any]:
+        response = await self._http.get(self._path(key), headers=self._headers(entry))
+        return self._handle_response(key, entry, response)
+
+    def _revalidate_in_background(self, key: PromptKey) -> None:
+        if key in self._revalidating:
+            return
+        task = asyncio.get_running_loop().create_task(self._revalidate(key))
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+
+    async def _revalidate(self, key: PromptKey) -> None:
+        try:
+            await self._fetch(key, self.cache.get(key))
+        except Exception:
+            # 실패하면 캐시를 유지하고 다음 조회 때 다시 시도
+            pass
+
+    async def aclose(self) -> None:
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncPromptManagerClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -39,7 +39,7 @@ const NewDataSetsForm = ({ form, file, onSetFile }: NewDatasetsFormProps) => {
           required
         >
           <Upload
-            accept=".csv"
+            accept=".csv,.parquet,.arrow,.arrows,.feather"
             maxCount={1}
             beforeUpload={(file) => {
               onSetFile(file)
@@ -140,12 +140,12 @@ const DatasetsTable = ({ data, onChangePage, refreshDatasets }: DatasetsTablePro
     },
     {
       title: 'Items',
-      dataIndex: 'content',
+      dataIndex: 'row_count',
       ellipsis: true,
       width: 300,
-      render: (text: string) => (
-        <Tooltip title={text} placement="topLeft">
-          {text}
+      render: (rowCount: number | null, record: DatasetsListItem) => (
+        <Tooltip title={record.column_names?.join(', ')} placement="topLeft">
+          {rowCount ?? '-'}
         </Tooltip>
       ),
     },
@@ -76,6 +76,9 @@ export interface DatasetsListItem {
   content?: string
   name: string
   description: string
+  row_count?: number | null
+  byte_size?: number | null
+  column_names?: string[] | null
   created_at?: string
 }
 